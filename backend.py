@@ -0,0 +1,101 @@
+import pygame
+import gfx
+from constants import *
+
+
+def _scene_rects(scene_size, zoom):
+    """(source rect in the scene buffer, target rect on screen) for a zoom level."""
+    sw, sh = scene_size
+    src = pygame.Rect(0, 0, sw, sh)
+    dest = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+    if zoom > 1.0:
+        # Nur der sichtbare Mittelausschnitt
+        src.size = (int(sw / zoom), int(sh / zoom))
+        src.center = (sw // 2, sh // 2)
+    elif zoom < 1.0:
+        dest.size = (int(SCREEN_WIDTH * zoom), int(SCREEN_HEIGHT * zoom))
+        dest.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+    return src, dest
+
+
+def compose_scene(scene, zoom, screen):
+    """Scale the scene buffer onto ``screen`` in one step, no temporary surfaces.
+
+    Zoom and render scale share the same transform.scale call.
+    """
+    src, dest = _scene_rects(scene.get_size(), zoom)
+    if dest.size != screen.get_size():
+        screen.fill(COLOR_BLACK)
+    pygame.transform.scale(scene.subsurface(src), dest.size, screen.subsurface(dest))
+
+
+class SurfaceBackend:
+    """Default output: software drawing into the display surface."""
+    name = "surface"
+    textured = False
+
+    def __init__(self, caption):
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption(caption)
+
+    def present_scene(self, scene, zoom):
+        compose_scene(scene, zoom, self.screen)
+
+    def flip(self, dirty=None):
+        if dirty is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty)
+
+
+class RendererBackend:
+    """SDL2 Renderer output (pygame._sdl2.video), drawing through gfx.py.
+
+    ``screen`` is a canvas on the window and the scene buffer a target
+    texture. Sprites, text and particle frames are uploaded once as
+    textures (gfx.static) and rotated and scaled by the renderer, so zoom
+    and render scale cost one textured quad per frame. Runs on SDL's
+    software renderer too (headless); faster only with a
+    hardware-accelerated one.
+    """
+    name = "renderer"
+    textured = True
+
+    def __init__(self, caption):
+        if gfx.video is None:
+            raise pygame.error("pygame._sdl2 nicht verfügbar")
+        # Kein set_mode: ein Fenster mit Display-Surface bekommt keinen Renderer
+        self.window = gfx.video.Window(caption, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        try:
+            self.renderer = gfx.video.Renderer(self.window, accelerated=-1)
+        except Exception:
+            self.window.destroy()
+            raise
+        self.device = gfx.TextureDevice(self.renderer)
+        self.screen = gfx.TextureCanvas(self.device, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._scene = None
+
+    def scene_canvas(self, size):
+        """Canvas on a target texture of ``size``, reused across frames."""
+        if self._scene is None or self._scene.size != size:
+            texture = gfx.video.Texture(self.renderer, size, target=True)
+            self._scene = gfx.TextureCanvas(self.device, size, texture)
+        return self._scene
+
+    def present_scene(self, scene, zoom):
+        src, dest = _scene_rects(scene.get_size(), zoom)
+        self.screen.fill(COLOR_BLACK)
+        self.screen.blit_canvas(scene, src, dest)
+
+    def flip(self, dirty=None):
+        # Der Renderer zeichnet immer das ganze Bild neu
+        self.renderer.present()
+
+
+def create_backend(caption):
+    if RENDER_BACKEND == "renderer":
+        try:
+            return RendererBackend(caption)
+        except Exception as e:
+            print(f"SDL2-Renderer nicht verfügbar ({e}), nutze Software-Ausgabe")
+    return SurfaceBackend(caption)
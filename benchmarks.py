@@ -0,0 +1,1001 @@
+"""Micro-benchmarks for the game's hot paths.
+
+Runs headless (dummy SDL drivers), no window needed:
+
+    python benchmarks.py            # all benchmarks
+    python benchmarks.py slots      # only the named ones
+"""
+import os
+import sys
+import time
+import math
+import random
+import tracemalloc
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from constants import *
+from view import View
+
+BENCHMARKS = {}
+
+
+def benchmark(fn):
+    BENCHMARKS[fn.__name__[len('bench_'):]] = fn
+    return fn
+
+
+def _timeit(fn, repeat=5):
+    """Best-of-``repeat`` wall time of ``fn()`` in milliseconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000.0
+
+
+def _measure_alloc(factory, count):
+    """Bytes allocated while building ``count`` objects with ``factory``."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objs = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return objs, after - before
+
+
+def _report(title, rows):
+    print(f"\n{title}")
+    for label, old, new, unit in rows:
+        gain = (1.0 - new / old) * 100 if old else 0.0
+        print(f"  {label:<28} {old:>10.1f} {unit:<3} -> {new:>10.1f} {unit:<3} ({gain:+.0f}% saved)")
+
+
+# ---------------------------------------------------------------------------
+# __slots__ entities
+# ---------------------------------------------------------------------------
+
+class _DictParticle:
+    """Particle as it was before slotting: __dict__ and Vector2 pos/vel."""
+
+    def __init__(self, pos, vel, lifetime, color, size, priority=1, gravity=0):
+        self.pos = pygame.math.Vector2(pos)
+        self.vel = pygame.math.Vector2(vel)
+        self.lifetime = lifetime
+        self.max_lifetime = lifetime
+        self.color = color
+        self.size = size
+        self.priority = priority
+        self.gravity = gravity
+
+    def update(self, dt):
+        self.vel.y += self.gravity * dt
+        self.pos += self.vel * dt
+        self.lifetime -= dt
+        return self.lifetime > 0
+
+
+class _DictProjectile(pygame.sprite.Sprite):
+    """BaseProjectile as it was before slotting."""
+
+    def __init__(self, game, x, y, vel_x, vel_y, damage, color=COLOR_BLUE, size=(10, 10)):
+        super().__init__()
+        self.game = game
+        self.width, self.height = size
+        self.color = color
+        self.rect = pygame.Rect(0, 0, self.width, self.height)
+        self.rect.center = (x, y)
+        self.pos = pygame.math.Vector2(x, y)
+        self.vel = pygame.math.Vector2(vel_x, vel_y)
+        self.damage = damage
+        self.angle = 0
+
+    def update(self, dt):
+        self.pos += self.vel * dt
+        self.rect.center = (int(self.pos.x), int(self.pos.y))
+
+        if self.is_off_screen():
+            self.kill()
+
+    def is_off_screen(self):
+        margin = 200
+        return (self.rect.right < -margin or self.rect.left > SCREEN_WIDTH + margin or
+                self.rect.bottom < -margin or self.rect.top > SCREEN_HEIGHT + margin)
+
+
+class _DictBossProjectile(_DictProjectile):
+    """BossProjectile as it was before slotting."""
+
+    def __init__(self, game, x, y, vel_x, vel_y, color=COLOR_RED, size=(20, 20), is_parryable=False):
+        super().__init__(game, x, y, vel_x, vel_y, 1, COLOR_PINK if is_parryable else color, size)
+        self.is_parryable = is_parryable
+        self.rot_speed = random.choice([-300, 300])
+
+    def update(self, dt):
+        super().update(dt)
+        self.angle += self.rot_speed * dt
+
+
+@benchmark
+def bench_slots(count=1000, frames=120):
+    """Memory and update cost of 1000 live particles and 1000 live bullets."""
+    from effects import Particle
+    from boss_projectiles import BossProjectile
+
+    game = SimpleNamespace()
+    rng = random.Random(0)
+    args = [((rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT)),
+             (rng.uniform(-60, 60), rng.uniform(-60, 60))) for _ in range(count)]
+
+    def particle_rows(cls):
+        objs, size = _measure_alloc(
+            lambda i: cls(args[i][0], args[i][1], 1e9, COLOR_WHITE, 4, gravity=720), count)
+
+        def run():
+            for _ in range(frames):
+                for p in objs:
+                    p.update(0.0001)
+        return size, _timeit(run)
+
+    def bullet_rows(cls):
+        objs, size = _measure_alloc(
+            lambda i: cls(game, *args[i][0], *args[i][1]), count)
+
+        def run():
+            for _ in range(frames):
+                for b in objs:
+                    b.update(0.0001)
+        return size, _timeit(run)
+
+    old_pm, old_pt = particle_rows(_DictParticle)
+    new_pm, new_pt = particle_rows(Particle)
+    old_bm, old_bt = bullet_rows(_DictBossProjectile)
+    new_bm, new_bt = bullet_rows(BossProjectile)
+
+    _report(f"slots: {count} live entities, {frames} update frames", [
+        ("particle memory", old_pm / 1024, new_pm / 1024, "KiB"),
+        ("particle update", old_pt, new_pt, "ms"),
+        ("bullet memory", old_bm / 1024, new_bm / 1024, "KiB"),
+        ("bullet update", old_bt, new_bt, "ms"),
+    ])
+
+
+@benchmark
+def bench_entities(frames=600, spawn=6):
+    """Spawn/update/kill churn: two sprite groups vs. the entity registry."""
+    from entities import EntityRegistry
+
+    game = SimpleNamespace()
+
+    def run_groups():
+        all_sprites = pygame.sprite.Group()
+        bullets = pygame.sprite.Group()
+        for f in range(frames):
+            for i in range(spawn):
+                b = _DictBossProjectile(game, SCREEN_WIDTH, i * 80, -600, 0)
+                all_sprites.add(b)
+                bullets.add(b)
+            bullets.update(1 / 60)
+
+    def run_registry():
+        from boss_projectiles import BossProjectile
+        registry = EntityRegistry()
+        for f in range(frames):
+            for i in range(spawn):
+                registry.add(BossProjectile(game, SCREEN_WIDTH, i * 80, -600, 0))
+            registry.boss_bullets.update(1 / 60)
+            registry.flush()
+
+    _report(f"entities: {frames} frames, {spawn} spawns/frame", [
+        ("spawn/update/kill", _timeit(run_groups), _timeit(run_registry), "ms"),
+    ])
+
+
+# Particle drawing as it was before the sprite bank: one Surface per
+# particle, refilled/redrawn every frame, stars rebuilt from scratch.
+
+def _legacy_square(p, surf, screen):
+    alpha = int(max(0, min(255, (p.lifetime / p.max_lifetime) * 255)))
+    surf.fill((*p.color[:3], alpha))
+    screen.blit(surf, surf.get_rect(center=(p.x, p.y)))
+
+
+def _legacy_dust(p, surf, screen):
+    alpha = int(max(0, min(255, (p.lifetime / p.max_lifetime) * 255)))
+    r = surf.get_width() // 2
+    surf.fill((0, 0, 0, 0))
+    pygame.draw.circle(surf, (*p.color[:3], alpha), (r, r), r)
+    screen.blit(surf, (int(p.x) - r, int(p.y) - r))
+
+
+def _legacy_star(p, surf, screen):
+    rotation = (p.max_lifetime - p.lifetime) * 30
+    points = []
+    for i in range(10):
+        angle = math.radians(i * 36 + rotation)
+        r = p.size if i % 2 == 0 else p.size * 0.4
+        points.append((p.x + math.cos(angle) * r, p.y + math.sin(angle) * r))
+    alpha = int(max(0, min(255, (p.lifetime / p.max_lifetime) * 255)))
+    min_x = min(q[0] for q in points)
+    min_y = min(q[1] for q in points)
+    w = int(max(q[0] for q in points) - min_x + 2)
+    h = int(max(q[1] for q in points) - min_y + 2)
+    s = pygame.Surface((w, h), pygame.SRCALPHA)
+    pygame.draw.polygon(s, (*p.color, alpha), [(q[0] - min_x, q[1] - min_y) for q in points])
+    screen.blit(s, (min_x, min_y))
+
+
+@benchmark
+def bench_particles(count=200, frames=120):
+    """Drawing a full particle cap (parry stars, hit squares, dust)."""
+    from effects import ParticleManager, StarParticle, SquareParticle, DustParticle
+
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    view = View((0, 0), 1.0, 1.0)
+    rng = random.Random(0)
+    manager = ParticleManager()
+    kinds = [(StarParticle, _legacy_star, COLOR_GOLD), (SquareParticle, _legacy_square, COLOR_RED),
+             (DustParticle, _legacy_dust, COLOR_GRAY)]
+    legacy = []
+    for i in range(count):
+        cls, fn, color = kinds[i % 3]
+        size = rng.randint(3, 10)
+        p = cls((rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT)), (0, 0),
+                rng.uniform(0.3, 1.0), color, size)
+        manager.particles.append(p)
+        legacy.append((fn, p, pygame.Surface((size, size), pygame.SRCALPHA)))
+
+    def age():
+        for p in manager.particles:
+            p.lifetime = p.max_lifetime * rng.uniform(0.05, 1.0)
+
+    def run_old():
+        for _ in range(frames):
+            age()
+            for fn, p, surf in legacy:
+                fn(p, surf, screen)
+
+    def run_new():
+        for _ in range(frames):
+            age()
+            manager.draw(screen, view)
+
+    run_new()  # Bank füllen, wie nach den ersten Sekunden im Spiel
+    _report(f"particles: {count} particles, {frames} frames", [
+        ("draw", _timeit(run_old), _timeit(run_new), "ms"),
+    ])
+
+
+@benchmark
+def bench_trails(bullets=24, frames=240):
+    """Bullet trails: one SquareParticle per sample vs. per-bullet ring buffer."""
+    from effects import ParticleManager, SquareParticle
+    from projectiles import PlayerProjectile, draw_trails
+
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    view = View((0, 0), 1.0, 1.0)
+    dt = 1 / 60
+    game = SimpleNamespace()
+    slots = {}
+
+    def spawn():
+        return [PlayerProjectile(game, 50 + i * 10, 100 + i * 15, 300, 0, 1) for i in range(bullets)]
+
+    def run_particles():
+        manager = ParticleManager()
+        shots = spawn()
+        timers = [0.0] * bullets
+        for _ in range(frames):
+            for i, b in enumerate(shots):
+                b.pos.x = 50 + (b.pos.x + b.vel.x * dt) % (SCREEN_WIDTH - 100)
+                b.rect.center = (int(b.pos.x), int(b.pos.y))
+                timers[i] += dt
+                if timers[i] > 0.033:
+                    timers[i] = 0
+                    manager.add(SquareParticle(b.rect.center, (0, 0), 0.16, COLOR_WHITE, 2, priority=0))
+            manager.update(dt)
+            manager.draw(screen, view)
+        slots['old'] = len(manager.particles)
+
+    def run_ring():
+        shots = spawn()
+        for _ in range(frames):
+            for b in shots:
+                b.pos.x = 50 + (b.pos.x + b.vel.x * dt) % (SCREEN_WIDTH - 100)
+                b.rect.center = (int(b.pos.x), int(b.pos.y))
+                b.trail_timer += dt
+                if b.trail_timer > b.TRAIL_INTERVAL:
+                    b.trail_timer = 0
+                    b.trail.append(b.rect.center)
+            draw_trails(screen, shots, view)
+        slots['new'] = 0
+
+    old, new = _timeit(run_particles), _timeit(run_ring)
+    _report(f"trails: {bullets} bullets, {frames} frames", [
+        ("update + draw", old, new, "ms"),
+        ("particle slots used", slots['old'], slots['new'], ""),
+    ])
+
+
+@benchmark
+def bench_compositing(frames=120):
+    """Frame compositing without zoom and with camera zoom (1.3 / 0.8)."""
+    screen = pygame.display.get_surface()
+    render_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+
+    def old_plain():
+        for _ in range(frames):
+            render_surface.fill(COLOR_BLACK)
+            screen.blit(render_surface, (0, 0))
+
+    def new_plain():
+        for _ in range(frames):
+            screen.fill(COLOR_BLACK)
+
+    def old_zoom(zoom):
+        def run():
+            for _ in range(frames):
+                render_surface.fill(COLOR_BLACK)
+                w, h = int(SCREEN_WIDTH * zoom), int(SCREEN_HEIGHT * zoom)
+                scaled = pygame.transform.scale(render_surface, (w, h))
+                screen.fill(COLOR_BLACK)
+                screen.blit(scaled, ((SCREEN_WIDTH - w) // 2, (SCREEN_HEIGHT - h) // 2))
+        return run
+
+    def new_zoom(zoom):
+        def run():
+            for _ in range(frames):
+                render_surface.fill(COLOR_BLACK)
+                if zoom > 1.0:
+                    w, h = int(SCREEN_WIDTH / zoom), int(SCREEN_HEIGHT / zoom)
+                    src = render_surface.subsurface(((SCREEN_WIDTH - w) // 2, (SCREEN_HEIGHT - h) // 2, w, h))
+                    pygame.transform.scale(src, size, screen)
+                else:
+                    w, h = int(SCREEN_WIDTH * zoom), int(SCREEN_HEIGHT * zoom)
+                    dest = pygame.Rect((SCREEN_WIDTH - w) // 2, (SCREEN_HEIGHT - h) // 2, w, h)
+                    screen.fill(COLOR_BLACK)
+                    pygame.transform.scale(render_surface, dest.size, screen.subsurface(dest))
+        return run
+
+    _report(f"compositing: {frames} frames", [
+        ("no zoom", _timeit(old_plain), _timeit(new_plain), "ms"),
+        ("zoom 1.3", _timeit(old_zoom(1.3)), _timeit(new_zoom(1.3)), "ms"),
+        ("zoom 0.8", _timeit(old_zoom(0.8)), _timeit(new_zoom(0.8)), "ms"),
+    ])
+
+
+@benchmark
+def bench_overlays(frames=120):
+    """Pause overlay + demo panel + tutorial panel, allocated vs. cached."""
+    from utils import get_overlay
+
+    screen = pygame.display.get_surface()
+    layers = [((SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0, 0, 140), (0, 0)),
+              ((200, SCREEN_HEIGHT), (50, 50, 50, 180), (SCREEN_WIDTH - 200, 0)),
+              ((SCREEN_WIDTH, 130), (10, 10, 30, 210), (0, SCREEN_HEIGHT - 130))]
+
+    def run_old():
+        for _ in range(frames):
+            for size, color, pos in layers:
+                surf = pygame.Surface(size, pygame.SRCALPHA)
+                surf.fill(color)
+                screen.blit(surf, pos)
+
+    def run_new():
+        for _ in range(frames):
+            for size, color, pos in layers:
+                screen.blit(get_overlay(size, color), pos)
+
+    _report(f"overlays: {len(layers)} overlays, {frames} frames", [
+        ("allocate + fill + blit", _timeit(run_old), _timeit(run_new), "ms"),
+    ])
+
+
+@benchmark
+def bench_menus(frames=120):
+    """Idle menu / challenge select / statistics frames: re-render vs. retained."""
+    from ui import UIManager
+    from save_system import SaveSystem
+
+    screen = pygame.display.get_surface()
+    game = SimpleNamespace(state="MENU", save_system=SaveSystem())
+    ui = UIManager(game)
+    rows = []
+    for state, view in (("MENU", ui.menu), ("CHALLENGE_SELECT", ui.challenge_screen),
+                        ("STATISTICS", ui.statistics_screen)):
+        game.state = state
+
+        def run_old():
+            for _ in range(frames):
+                view.render(screen)
+                pygame.display.flip()
+
+        def run_new():
+            for _ in range(frames):
+                dirty = ui.present_retained(screen, view)
+                if dirty:
+                    pygame.display.update(dirty)
+
+        rows.append((state.lower(), _timeit(run_old), _timeit(run_new), "ms"))
+    _report(f"menus: {frames} idle frames", rows)
+
+
+@benchmark
+def bench_idle(seconds=1.0):
+    """CPU time of one wall-clock second in MENU and PAUSED: fixed 60 FPS vs. idle wait."""
+    import main as game_main
+
+    game = game_main.Game()
+    rows = []
+    for state in ("MENU", "PAUSED"):
+        def cpu(loop):
+            game.reset_game()
+            if state == "PAUSED":
+                game.state = "PLAYING"
+            game.state = state
+            game.ui_manager.invalidate()
+            game.clock.tick()
+            t0, c0 = time.perf_counter(), time.process_time()
+            while time.perf_counter() - t0 < seconds:
+                loop()
+            return (time.process_time() - c0) * 1000.0
+
+        def old():
+            game.handle_events()
+            game.update()
+            # vorher: Szene bzw. Menü jedes Frame komplett neu und flip()
+            game.screen.fill(COLOR_BLACK)
+            if state == "MENU":
+                game.ui_manager.menu.render(game.screen)
+            else:
+                game.draw_scene(game.screen, View())
+                game.ui_manager.hud.draw(game.screen)
+                game.ui_manager.draw_pause(game.screen)
+            pygame.display.flip()
+
+        def new():
+            timeout = game.idle_timeout()
+            game.handle_events(game.wait_events(timeout))
+            game.update()
+            game.draw()
+
+        rows.append((state.lower(), cpu(old), cpu(new), "ms"))
+    _report(f"idle: CPU time per {seconds:.0f} s wall time", rows)
+
+
+@benchmark
+def bench_render_scale(frames=120, bullets=40, particles=150):
+    """Fight frame at full resolution vs. half scene resolution + one upscale."""
+    import main as game_main
+    from boss_projectiles import BossProjectile
+
+    game = game_main.Game()
+    game.reset_game()
+    game.state = "PLAYING"
+    random.seed(5)
+    for _ in range(bullets):
+        x, y = random.randint(50, SCREEN_WIDTH - 50), random.randint(100, SCREEN_HEIGHT - 50)
+        game.entities.add(game.pools.acquire(BossProjectile, game, x, y, -120, 0))
+    for _ in range(particles // 15):
+        game.particle_manager.spawn_parry((random.randint(0, SCREEN_WIDTH), random.randint(0, SCREEN_HEIGHT)))
+    game.entities.flush()
+
+    def run(scale):
+        def loop():
+            game.quality.render_scale = scale
+            for _ in range(frames):
+                game.static_frame_shown = False
+                game.draw()
+        return loop
+
+    rows = []
+    for label, reality_break, zoom in (("plain", 0, 1.0),
+                                       ("full-screen overlay", 100, 1.0),
+                                       ("overlay + zoom 1.3", 100, 1.3)):
+        game.reality_break_timer = reality_break
+        game.reality_break_type = 'slow_mo'
+        game.effect_manager.zoom_level = game.effect_manager.target_zoom = zoom
+        rows.append((label, _timeit(run(1.0)), _timeit(run(0.5)), "ms"))
+    _report(f"render scale 0.5: {frames} frames, {bullets} bullets, {particles} particles", rows)
+
+
+@benchmark
+def bench_backends(frames=120, bullets=40, particles=150):
+    """The render-scale fight frame, drawn and presented: surface vs. renderer backend.
+
+    Headless this is SDL's software renderer, which rotates and blends
+    every textured quad on the CPU; the renderer backend only wins with a
+    hardware-accelerated driver.
+    """
+    import main as game_main
+    from backend import RendererBackend
+    from boss_projectiles import BossProjectile
+
+    game = game_main.Game()
+    game.reset_game()
+    game.state = "PLAYING"
+    random.seed(5)
+    for _ in range(bullets):
+        x, y = random.randint(50, SCREEN_WIDTH - 50), random.randint(100, SCREEN_HEIGHT - 50)
+        game.entities.add(game.pools.acquire(BossProjectile, game, x, y, -120, 0))
+    for _ in range(particles // 15):
+        game.particle_manager.spawn_parry((random.randint(0, SCREEN_WIDTH), random.randint(0, SCREEN_HEIGHT)))
+    game.entities.flush()
+
+    def run(backend, scale, zoom):
+        def loop():
+            game.backend, game.screen = backend, backend.screen
+            game.quality.render_scale = scale
+            game.effect_manager.zoom_level = game.effect_manager.target_zoom = zoom
+            for _ in range(frames):
+                game.static_frame_shown = False
+                game.draw()
+        return loop
+
+    surface = game.backend
+    renderer = RendererBackend("bench")
+    rows = []
+    for label, scale, zoom in (("full resolution", 1.0, 1.0),
+                               ("render scale 0.5", 0.5, 1.0),
+                               ("zoom 1.3", 1.0, 1.3)):
+        rows.append((label, _timeit(run(surface, scale, zoom)), _timeit(run(renderer, scale, zoom)), "ms"))
+    game.backend, game.screen = surface, surface.screen
+    renderer.window.destroy()
+    _report(f"backends (surface -> renderer): {frames} frames, {bullets} bullets, {particles} particles", rows)
+
+
+@benchmark
+def bench_culling(frames=300, rains=3):
+    """Boss bullets during rain attacks: every entity every frame vs. culled draw + deferred updates."""
+    import main as game_main
+    from boss_projectiles import BossProjectile, EquationProjectile
+
+    game = game_main.Game()
+    screen = game.screen
+
+    def run(cull):
+        def loop():
+            EquationProjectile.deferrable = BossProjectile.deferrable = cull
+            random.seed(11)
+            game.reset_game()
+            for _ in range(rains):
+                game.boss.rain_attack_full()
+            for frame in range(frames):
+                game.boss_bullets.update(1 / FPS)
+                game.entities.flush()
+                view = View()
+                if not cull:
+                    view.visible = pygame.Rect(-10 ** 6, -10 ** 6, 2 * 10 ** 6, 2 * 10 ** 6)
+                game.boss_bullets.draw(screen, view)
+        return loop
+
+    old, new = _timeit(run(False)), _timeit(run(True))
+    EquationProjectile.deferrable = BossProjectile.deferrable = True
+    _report(f"culling: {frames} frames, {rains * 10} falling equations", [
+        ("update + draw", old, new, "ms"),
+    ])
+
+
+@benchmark
+def bench_spawn_burst(bursts=200):
+    """Slowest frame of a rain + wipe + compass burst: cold pools vs. pools prewarmed in idle steps (median)."""
+    import main as game_main
+    from boss_projectiles import BossProjectile, EquationProjectile
+
+    game = game_main.Game()
+    game.reset_game()
+    counts = {BossProjectile: 30, EquationProjectile: 12}
+
+    def worst_frame(prewarmed):
+        worst = []
+        for _ in range(bursts):
+            game.entities.clear()
+            for cls in counts:
+                game.pools.get(cls)._free.clear()
+                game.pools.get(cls).high_water = 0
+            if prewarmed:
+                for _ in game.pools.prewarm_steps(counts):
+                    pass
+            frame_times = []
+            for frame in range(4):
+                t0 = time.perf_counter()
+                if frame == 0:
+                    game.boss.rain_attack_full()
+                    game.boss.wipe_attack()
+                    game.boss.compass_hell_advanced()
+                game.boss_bullets.update(1 / FPS)
+                game.entities.flush()
+                frame_times.append(time.perf_counter() - t0)
+            worst.append(max(frame_times))
+        worst.sort()
+        return worst[len(worst) // 2] * 1000.0
+
+    _report(f"spawn burst: 33 projectiles, {bursts} bursts", [
+        ("slowest frame", worst_frame(False), worst_frame(True), "ms"),
+    ])
+
+
+def _legacy_compass(boss):
+    # compass_hell_advanced vor den Spawn-Tabellen: Winkel und sin/cos pro Kugel
+    from boss_projectiles import BossProjectile
+    for burst in range(3):
+        for i in range(6):
+            rad = math.radians(i * 60 + burst * 15)
+            speed = 240 + burst * 60
+            boss.game.entities.spawn(BossProjectile, boss.game, boss.rect.centerx, boss.rect.centery,
+                                     math.cos(rad) * speed, math.sin(rad) * speed, is_parryable=(i % 2 == 0))
+
+
+@benchmark
+def bench_patterns(repeat=200):
+    """Issuing the compass-hell burst (18 bullets): per-bullet loop vs. precompiled spawn table."""
+    import main as game_main
+
+    game = game_main.Game()
+    game.reset_game()
+    boss = game.boss
+
+    def issue(fn):
+        def run():
+            for _ in range(repeat):
+                fn()
+                game.entities.clear()
+        return _timeit(run) / repeat * 1000.0
+
+    old = issue(lambda: _legacy_compass(boss))
+    new = issue(lambda: boss.emit_pattern('compass_hell'))
+    _report("attack patterns: issuing one burst", [
+        ("compass hell, 18 bullets", old, new, "us"),
+    ])
+
+
+@benchmark
+def bench_phase_prefetch(rounds=5):
+    """First round of phase-2/3 attacks (spawn + one drawn frame), cold caches vs. after the transition prefetch."""
+    import main as game_main
+    import utils
+    import boss_projectiles
+    from effects import sprite_bank
+
+    game = game_main.Game()
+
+    def cold_caches():
+        for cache in (utils._font_cache, utils._overlay_cache, utils._scratch_cache, sprite_bank._frames):
+            cache.clear()
+        boss_projectiles.EQUATION_FONT = None
+        utils.SoundManager().sounds.clear()
+
+    def first_round(phase, prefetch):
+        total = 0.0
+        for _ in range(rounds):
+            game.reset_game()
+            game.state = "PLAYING"
+            cold_caches()
+            game.draw()  # HUD und Phase 1 wieder warm, kalt bleibt nur die neue Phase
+            boss = game.boss
+            boss.start_transition(phase)
+            if prefetch:
+                while boss.transition_timer > 0:
+                    boss.update_transition(1 / FPS)
+                    game.idle_tasks.run(0.004)
+            else:
+                game.idle_tasks.cancel(boss._prefetch)
+            random.seed(1)
+            t0 = time.perf_counter()
+            for _ in range(5):
+                boss.run_attack()
+                game.static_frame_shown = False
+                game.draw()
+                game.entities.flush()
+                game.events.flush()
+            total += time.perf_counter() - t0
+        return total / rounds * 1000.0
+
+    _report("phase prefetch: first five attacks incl. drawing", [
+        (f"phase {phase}", first_round(phase, False), first_round(phase, True), "ms")
+        for phase in (2, 3)
+    ])
+
+
+@benchmark
+def bench_events(frames=300, hits=8):
+    """A busy frame (several boss hits, shakes, sounds): direct side effects vs. the coalescing EventBus."""
+    import main as game_main
+
+    game = game_main.Game()
+    game.reset_game()
+    boss, effects, events = game.boss, game.effect_manager, game.events
+
+    def direct():
+        for _ in range(frames):
+            for _ in range(hits):
+                game.sound_manager.play("boss_hit")
+                effects.add_damage_number(boss.rect.center, 3)
+                effects.apply_shake(0.08, 3)
+            effects.damage_numbers.clear()
+
+    def batched():
+        for _ in range(frames):
+            for _ in range(hits):
+                events.sound("boss_hit")
+                events.damage_number(boss.rect.center, 3, target=boss)
+                events.shake(0.08, 3)
+            events.flush()
+            effects.damage_numbers.clear()
+
+    old, new = _timeit(direct), _timeit(batched)
+    events.sound("boss_hit")
+    for _ in range(hits):
+        events.damage_number(boss.rect.center, 3, target=boss)
+    events.flush()
+    _report(f"events: {hits} hits per frame, {frames} frames", [
+        ("side effects", old, new, "ms"),
+        ("damage numbers per frame", hits, len(effects.damage_numbers), ""),
+    ])
+
+
+_TIMER_NAMES = ('dash', 'dash_cooldown', 'perfect_dash', 'i_frames', 'parry_active', 'perfect_parry',
+                'parry_chain', 'parry_counter', 'shoot', 'shield', 'wall_cling', 'momentum',
+                'squash', 'flash', 'shake')
+
+
+@benchmark
+def bench_timers(objects=200, frames=600):
+    """Countdowns of idle objects: decrement-and-compare polling vs. timers.Countdown on a scheduler."""
+    from timers import TimerScheduler, Countdown
+
+    class Polled:
+        def __init__(self):
+            for name in _TIMER_NAMES:
+                setattr(self, name, 0.0)
+
+        def update_timers(self, dt):
+            d = self.__dict__
+            for name in _TIMER_NAMES:
+                if d[name] > 0:
+                    d[name] -= dt
+
+    scheduler = TimerScheduler()
+    Scheduled = type('Scheduled', (), {name: Countdown(on_expire='expire') for name in _TIMER_NAMES})
+    Scheduled.timers = scheduler
+    Scheduled.expire = lambda self: None
+
+    polled = [Polled() for _ in range(objects)]
+    scheduled = [Scheduled() for _ in range(objects)]
+
+    def run_polled():
+        for frame in range(frames):
+            if frame % 60 == 0:
+                polled[frame % objects].i_frames = 0.5
+            for obj in polled:
+                obj.update_timers(1 / FPS)
+
+    def run_scheduled():
+        for frame in range(frames):
+            if frame % 60 == 0:
+                scheduled[frame % objects].i_frames = 0.5
+            scheduler.advance(1 / FPS)
+
+    old, new = _timeit(run_polled, repeat=3), _timeit(run_scheduled, repeat=3)
+    _report(f"timers: {objects} objects x {len(_TIMER_NAMES)} countdowns, {frames} frames", [
+        ("mostly idle", old, new, "ms"),
+    ])
+
+
+@benchmark
+def bench_async(seconds=2.0):
+    """Fight at 60 FPS: Game.run() vs. AsyncRunner with a service waking every 5 ms.
+
+    CPU time per wall-clock second and frames per second; the service only
+    gets to run in the async version.
+    """
+    import asyncio
+    import main as game_main
+    from runner import AsyncRunner
+
+    game = game_main.Game()
+    wakeups = []
+
+    async def service(game):
+        while True:
+            wakeups.append(time.perf_counter())
+            await asyncio.sleep(0.005)
+
+    class Stop(Exception):
+        pass
+
+    def measure(run):
+        game.reset_game()
+        game.state = "PLAYING"
+        frames = []
+        handle = game.handle_events
+        deadline = time.perf_counter() + seconds
+
+        def handle_events(events=None):
+            if time.perf_counter() >= deadline:
+                raise Stop
+            frames.append(1)
+            handle(events)
+
+        game.handle_events = handle_events
+        c0 = time.process_time()
+        try:
+            run()
+        except Stop:
+            pass
+        del game.handle_events
+        return (time.process_time() - c0) * 1000.0 / seconds, len(frames) / seconds
+
+    cpu_sync, fps_sync = measure(game.run)
+    cpu_async, fps_async = measure(lambda: asyncio.run(AsyncRunner(game, [service]).run()))
+    _report(f"async: {seconds:.0f} s fight, service woke {len(wakeups) / seconds:.0f}x/s", [
+        ("CPU per second", cpu_sync, cpu_async, "ms"),
+        ("frames per second", fps_sync, fps_async, ""),
+    ])
+
+
+@benchmark
+def bench_idle_tasks(rounds=5):
+    """Work moved out of the frame into spare time: win-frame save, transition prefetch.
+
+    "Frame" is the part the frame has to wait for; with the scheduler the
+    work runs after draw() in the time Clock.tick() would sleep anyway.
+    """
+    import tempfile
+    import main as game_main
+    import save_system
+    import utils
+    from effects import sprite_bank
+
+    game = game_main.Game()
+    save_file = save_system.SAVE_FILE
+    save_system.SAVE_FILE = os.path.join(tempfile.mkdtemp(), "save_data.json")  # echten Spielstand nicht anfassen
+
+    def save_in_frame(deferred):
+        game.save_system.update_stat("total_wins", 0)
+        t0 = time.perf_counter()
+        if deferred:
+            game.idle_tasks.add("save", game.save_system.save_later(), priority=2, deadline=0.5)
+        else:
+            game.save_system.save()
+        spent = time.perf_counter() - t0
+        game.idle_tasks.finish()
+        return spent * 1000.0
+
+    def worst_transition_frame(deferred):
+        worst = 0.0
+        for _ in range(rounds):
+            game.reset_game()
+            game.state = "PLAYING"
+            for cache in (utils._font_cache, utils._overlay_cache, utils._scratch_cache, sprite_bank._frames):
+                cache.clear()
+            boss = game.boss
+            boss.start_transition(2 + _ % 2)
+            if not deferred:
+                game.idle_tasks.cancel(boss._prefetch)
+                steps = boss.prefetch_phase(boss.phase)
+            while boss.transition_timer > 0:
+                t0 = time.perf_counter()
+                boss.update_transition(1 / FPS)
+                if not deferred:
+                    next(steps, None)  # vorher: ein Schritt pro Frame in update_transition()
+                worst = max(worst, time.perf_counter() - t0)
+                game.idle_tasks.run(0.004)
+        return worst * 1000.0
+
+    rows = [
+        ("win frame: save", min(save_in_frame(False) for _ in range(rounds)),
+         min(save_in_frame(True) for _ in range(rounds)), "ms"),
+        ("transition: worst frame", worst_transition_frame(False), worst_transition_frame(True), "ms"),
+    ]
+    save_system.SAVE_FILE = save_file
+    _report("idle tasks: time spent inside the frame", rows)
+    for name, used in sorted(game.idle_tasks.usage(frames=10 ** 6).items()):
+        print(f"    {name:<26} {used * 1000.0:8.2f} ms spare time")
+
+
+@benchmark
+def bench_snapshot(frames=200):
+    """Snapshot and restore of a running fight, quiet and during a bullet-hell burst."""
+    import main as game_main
+
+    game = game_main.Game()
+    game.reset_game()
+    game.state = "PLAYING"
+    random.seed(1)
+
+    def run(count):
+        for i in range(count):
+            if i % 3 == 0:
+                game.input.inject('shoot')
+            game.handle_events([])
+            game.update()
+            game.draw()
+
+    def measure(label):
+        print(f"  {label}")
+        for cosmetic in (False, True):
+            snap = game.snapshot(cosmetic)
+            take = _timeit(lambda: [game.snapshot(cosmetic) for _ in range(100)]) * 10.0
+            restore = _timeit(lambda: [game.restore(snap) for _ in range(100)]) * 10.0
+            what = "+ particles" if cosmetic else "gameplay"
+            print(f"    {what:<12} take {take:7.1f} us  restore {restore:7.1f} us  {len(snap):>6} bytes")
+
+    game_main.FPS = 0
+    run(frames)
+    print(f"\nsnapshot: {len(game.boss_bullets) + len(game.player_bullets)} bullets")
+    measure("quiet")
+    for name in ('compass_hell', 'rain_full', 'wipe'):
+        game.boss.emit_pattern(name)
+    run(20)
+    game.boss.emit_pattern('compass_hell')
+    run(2)
+    measure(f"burst ({len(game.boss_bullets) + len(game.player_bullets)} bullets, "
+            f"{len(game.particle_manager.particles)} particles)")
+    game_main.FPS = FPS
+
+
+@benchmark
+def bench_rewind(frames=480):
+    """Practice-mode rewind buffer: capture cost per frame, memory, step back."""
+    import main as game_main
+    from rewind import REWIND_CAPTURE_BUDGET, REWIND_MEMORY, REWIND_SPEED
+
+    game = game_main.Game()
+    game.reset_game()
+    game.state = "PRACTICE"
+    buffer = game.scene.rewind
+    random.seed(1)
+
+    def run(count):
+        raw = 0
+        for i in range(count):
+            if i % 3 == 0:
+                game.input.inject('shoot')
+            game.handle_events([])
+            game.update()
+            game.draw()
+            raw += len(game.snapshot())
+        return raw / count
+
+    def measure(label, raw):
+        full = raw * len(buffer.frames)  # jeder Frame als ganzer Snapshot
+        print(f"  {label}")
+        print(f"    capture {buffer.cost * 1e6:7.1f} us/frame (budget {REWIND_CAPTURE_BUDGET * 1e6:.0f}),"
+              f" stride {buffer.stride}")
+        print(f"    {len(buffer.frames)} entries, {buffer.seconds:.1f} s: {buffer.bytes / 1024:7.1f} KB"
+              f" (budget {REWIND_MEMORY / 1024:.0f} KB, full snapshots {full / 1024:.1f} KB)")
+
+    game_main.FPS = 0
+    print("\nrewind:")
+    measure("quiet", run(frames))
+    for name in ('compass_hell', 'rain_full', 'wipe'):
+        game.boss.emit_pattern(name)
+    measure("burst (compass_hell + rain_full + wipe)", run(frames // 3))
+    count = 0
+    t0 = time.perf_counter()
+    while buffer.step_back(REWIND_SPEED):
+        count += 1
+    spent = time.perf_counter() - t0
+    print(f"  step back x{REWIND_SPEED}: {spent / count * 1e6:7.1f} us per frame")
+    game_main.FPS = FPS
+
+
+def main(names):
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    for name in names or BENCHMARKS:
+        if name not in BENCHMARKS:
+            print(f"unknown benchmark '{name}' – available: {', '.join(BENCHMARKS)}")
+            continue
+        BENCHMARKS[name]()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -2,22 +2,40 @@ import pygame
 import math
 import random
 import os
+from operator import attrgetter
+import gfx
 from constants import *
 from boss_projectiles import *
-from utils import draw_text, SoundManager
+from utils import draw_text, get_font, get_overlay, get_scratch, load_image, SoundManager
+from view import View
+from patterns import SPAWN_TABLES
+from timers import Countdown, get_countdowns, set_countdowns
 
 def _load_boss_sprite(filename, size):
     path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sprites', filename)
     try:
-        img = pygame.image.load(path).convert_alpha()
-        return pygame.transform.scale(img, size)
+        return gfx.static(pygame.transform.scale(load_image(path), size))
     except Exception:
         return None
 
 class Boss(pygame.sprite.Sprite):
+    flash_timer = Countdown()
+    shield_timer = Countdown(on_expire='_end_shield')
+
+    # Spielzustand für get_state(); Grafik, Sound und Prefetch-Aufgabe gehören nicht dazu
+    STATE_FIELDS = (
+        'width', 'height', 'rect', 'hp', 'max_hp', 'phase', 'color', 'pos', 'vibrate_offset',
+        'state', 'state_timer', 'attack_pattern_index', 'stun_timer', 'in_transition',
+        'transition_timer', 'is_dying', 'weak_point_rect', 'weak_point_timer', 'float_offset',
+        'dialogue', 'dialogue_timer', 'reality_break_warning_timer', 'reality_break_pending_type',
+        'shield_active', '_attack_count',
+    )
+    _get_fields = attrgetter(*STATE_FIELDS)
+
     def __init__(self, game):
         super().__init__()
         self.game = game
+        self.timers = game.timers
         self.sound_manager = SoundManager()
         
         self.width = 100
@@ -27,6 +45,7 @@ class Boss(pygame.sprite.Sprite):
         self.rect.midright = (950, 450)
 
         self.idle_sprite = _load_boss_sprite('boss_idle.png', (self.width, self.height))
+        self._idle_scaled = None
         
         self.hp = BOSS_MAX_HP
         self.max_hp = BOSS_MAX_HP
@@ -63,6 +82,9 @@ class Boss(pygame.sprite.Sprite):
         self.shield_active = False
         self.shield_timer = 0
         self._attack_count = 0  # drives periodic dialogue
+        self._prefetch = None   # IdleTask running prefetch_phase() (Game.idle_tasks)
+
+        self.game.pools.prewarm(self._POOL_PREWARM[1])
 
     def update(self, dt):
         if self.game.state in ("DEMO", "TUTORIAL"):
@@ -91,7 +113,7 @@ class Boss(pygame.sprite.Sprite):
                 self.state = 'idle'
                 self.state_timer = 1.0
             elif int(prev_stun * 3) != int(self.stun_timer * 3):
-                self.game.effect_manager.add_damage_number(self.rect.midtop, "STUNNED!", color=COLOR_YELLOW, size=20)
+                self.game.events.damage_number(self.rect.midtop, "STUNNED!", target=self, color=COLOR_YELLOW, size=20)
             return
 
         self.check_phase()
@@ -101,6 +123,14 @@ class Boss(pygame.sprite.Sprite):
         
         self.rect.center = self.pos + self.vibrate_offset
 
+    # Pooled projectiles each phase's attacks can have alive at once;
+    # pools are topped up during the transition (see prefetch_phase).
+    _POOL_PREWARM = {
+        1: {BossProjectile: 10, EquationProjectile: 3, BouncingEraser: 2},
+        2: {BossProjectile: 10, EquationProjectile: 12, BouncingEraser: 2},
+        3: {BossProjectile: 30, EquationProjectile: 12, BouncingEraser: 2},
+    }
+
     _DIALOGUE_POOL = {
         1: [
             "Das nennt ihr Mathematik?",
@@ -148,7 +178,7 @@ class Boss(pygame.sprite.Sprite):
         else: new_phase = 3
         
         if new_phase > self.phase:
-            self.sound_manager.play("boss_transition")
+            self.game.events.sound("boss_transition")
             self.start_transition(new_phase)
 
     def start_transition(self, next_phase):
@@ -156,9 +186,12 @@ class Boss(pygame.sprite.Sprite):
         self.phase = next_phase
         self.transition_timer = 3.0
         self.state = 'transition'
-        self.game.effect_manager.apply_shake(1.0, 10)
+        self.game.events.shake(1.0, 10)
         self.game.effect_manager.apply_zoom(0.8, duration=1.0)
-        
+        # In der freien Zeit der Frames; spätestens nach 0.5 s ein Schritt pro Frame
+        self._prefetch = self.game.idle_tasks.add(
+            f"prefetch phase {next_phase}", self.prefetch_phase(next_phase), priority=1, deadline=0.5)
+
         if self.phase == 2:
             self.dialogue = "GENUG! Das Seminar gehört MIR!"
             self.color = COLOR_ORANGE
@@ -183,7 +216,64 @@ class Boss(pygame.sprite.Sprite):
             self.vibrate_offset = pygame.math.Vector2(0, 0)
             self.game.effect_manager.apply_zoom(1.0, duration=0.5)
             if self.phase == 3:
-                self.game.effect_manager.apply_shake(2.0, 5, type='rumble')
+                self.game.events.shake(2.0, 5, type='rumble')
+
+    # Sounds, die erst die Attacken der jeweiligen Phase abspielen
+    _PHASE_SOUNDS = {
+        2: (),
+        3: ("ultimate_attack", "teleport", "hit"),  # hit: teleport_strike trifft den Spieler
+    }
+
+    def _phase_samples(self, phase):
+        """One throwaway projectile per type and draw state of the phase's attacks."""
+        game = self.game
+        x, y = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
+        samples = [EquationProjectile(game, x, y), EquationProjectile(game, x, y, is_parryable=True)]
+        if phase == 2:
+            slam, laser = TextbookSlam(game, x), Laser(game, y)
+            falling, firing = TextbookSlam(game, x), Laser(game, y)
+            falling.state = 'slam'
+            firing.state = 'fire'
+            samples += [ChalkboardEraser(game, 'left'), ProtractorSpin(game, self),
+                        slam, falling, laser, firing]
+        elif phase == 3:
+            rotating = Laser(game, y, duration=2.0, rotation_speed=30)
+            rotating.state = 'fire'
+            samples += [BossProjectile(game, x, y, 0, 0), BossProjectile(game, x, y, 0, 0, is_parryable=True),
+                        BossProjectile(game, x, y, -180, 0, color=COLOR_WHITE, size=(40, 100)),
+                        BouncingEraser(game, x, y), BouncingEraser(game, x, y, size_mult=0.5, speed_mult=1.5),
+                        rotating]
+        return samples
+
+    def prefetch_phase(self, phase):
+        """Generator warming up what the next phase's attacks create lazily.
+
+        Run as an idle task (tasks.IdleScheduler): the phase's pool
+        instances, a few per step, sounds, one instance of each projectile
+        type drawn once off-screen (fonts, icons, overlay and scratch
+        surfaces) and the reality-break tints. The first attack of a phase
+        then costs the same as the tenth.
+        """
+        yield from self.game.pools.prewarm_steps(self._POOL_PREWARM[phase])
+        self.sound_manager.preload(*self._PHASE_SOUNDS.get(phase, ()))
+        yield
+        # Konstruktoren würfeln – der Zufallsstrom des Kampfes bleibt unberührt
+        rng_state = random.getstate()
+        samples = self._phase_samples(phase)
+        random.setstate(rng_state)
+        yield
+        view = View((0, 0), self.game.quality.render_scale)
+        size = (int(SCREEN_WIDTH * view.scale), int(SCREEN_HEIGHT * view.scale))
+        # Eigener Puffer im Format des Szenenpuffers – der echte gehört dem Frame
+        scratch = get_scratch(size, 0)
+        for sample in samples:
+            sample.draw(scratch, view)
+            yield
+        get_font("Arial", view.size(24), bold=True)
+        get_font("Arial", 32, bold=True)
+        if phase == 3:
+            for color in REALITY_BREAK_TINTS.values():
+                get_overlay(size, color)
 
     def update_behavior(self, dt):
         if self.state == 'dead':
@@ -233,6 +323,12 @@ class Boss(pygame.sprite.Sprite):
 
         self.state_timer = timer
 
+    def emit_pattern(self, name):
+        """Spawn a precompiled pattern (patterns.SPAWN_TABLES) in one batch."""
+        table = SPAWN_TABLES[name]
+        origin = getattr(self.rect, table.anchor) if table.anchor else (0, 0)
+        self.game.entities.spawn_many(table.cls, table.rows(self.game, origin))
+
     def stun(self, duration):
         self.stun_timer = duration
         self.state = 'stunned'
@@ -244,109 +340,73 @@ class Boss(pygame.sprite.Sprite):
         
         self.weak_point_timer = BOSS_WEAK_POINT_DURATION
 
-        count = 5 if random.random() < 0.5 else 3
-        for i in range(count):
-            is_pink = (i == 2 or i == 4)
-            p = BossProjectile(self.game, self.rect.left, self.rect.centery, -300, 0, is_parryable=is_pink)
-            p.rect.x -= (count - 1 - i) * 100
-            if count == 5:
-                p.vel.y = (i - 2) * 60
-            self.game.all_sprites.add(p)
-            self.game.boss_bullets.add(p)
+        self.emit_pattern('geometry_5' if random.random() < 0.5 else 'geometry_3')
 
     def eraser_attack(self):
         self._maybe_dialogue()
-        e1 = BouncingEraser(self.game, self.rect.centerx, self.rect.centery, size_mult=1.0)
-        self.game.all_sprites.add(e1)
-        self.game.boss_bullets.add(e1)
+        e1 = self.game.pools.acquire(BouncingEraser, self.game, self.rect.centerx, self.rect.centery, size_mult=1.0)
+        self.game.entities.add(e1)
         
         if random.random() < 0.5:
-            e2 = BouncingEraser(self.game, self.rect.centerx, self.rect.centery, size_mult=0.5, speed_mult=1.5)
-            self.game.all_sprites.add(e2)
-            self.game.boss_bullets.add(e2)
+            e2 = self.game.pools.acquire(BouncingEraser, self.game, self.rect.centerx, self.rect.centery, size_mult=0.5, speed_mult=1.5)
+            self.game.entities.add(e2)
 
     def wipe_attack(self):
         self._maybe_dialogue()
-        for i in range(5):
-            is_pink = (i == 2)
-            p = BossProjectile(self.game, SCREEN_WIDTH + i*40, i*120, -180, 0, color=COLOR_WHITE, size=(40, 100), is_parryable=is_pink)
-            self.game.all_sprites.add(p)
-            self.game.boss_bullets.add(p)
+        self.emit_pattern('wipe')
 
     def rain_attack_mini(self):
-        for i in range(3):
-            is_pink = (i == 1)
-            x = 200 + i * 300
-            p = EquationProjectile(self.game, x, -100, is_parryable=is_pink)
-            self.game.all_sprites.add(p)
-            self.game.boss_bullets.add(p)
+        self.emit_pattern('rain_mini')
 
     # --- Phase 2 Attacks ---
     def eraser_attack_full(self):
         e1 = ChalkboardEraser(self.game, 'left')
         e2 = ChalkboardEraser(self.game, 'right')
         e2.rect.x -= 300
-        self.game.all_sprites.add(e1, e2)
-        self.game.boss_bullets.add(e1, e2)
+        self.game.entities.add(e1)
+        self.game.entities.add(e2)
 
     def rain_attack_full(self):
-        for i in range(10):
-            is_pink = (i in [3, 7])
-            x = random.randint(50, 950)
-            delay_y = -i * 200
-            p = EquationProjectile(self.game, x, delay_y, is_parryable=is_pink)
-            self.game.all_sprites.add(p)
-            self.game.boss_bullets.add(p)
+        self.emit_pattern('rain_full')
 
     def protractor_attack(self):
         self._maybe_dialogue()
         p = ProtractorSpin(self.game, self)
-        self.game.all_sprites.add(p)
-        self.game.boss_bullets.add(p)
+        self.game.entities.add(p)
         self.weak_point_timer = BOSS_WEAK_POINT_DURATION
 
     def slam_attack(self):
         s = TextbookSlam(self.game, self.game.player.rect.centerx)
-        self.game.all_sprites.add(s)
-        self.game.boss_bullets.add(s)
+        self.game.entities.add(s)
 
     def laser_attack_double(self):
         y1 = self.game.player.rect.centery
         y2 = y1 + random.choice([-100, 100])
         l1 = Laser(self.game, y1)
         l2 = Laser(self.game, y2)
-        self.game.all_sprites.add(l1, l2)
-        self.game.boss_bullets.add(l1, l2)
+        self.game.entities.add(l1)
+        self.game.entities.add(l2)
 
     # --- Phase 3 Attacks ---
     def compass_hell_advanced(self):
         self._maybe_dialogue(force=True)
-        for burst in range(3):
-            num_projs = 6  # was 8 – reduces bullet density to manageable levels
-            for i in range(num_projs):
-                angle = (i * (360/num_projs)) + (burst * 15)
-                rad = math.radians(angle)
-                speed = 240 + burst * 60
-                p = BossProjectile(self.game, self.rect.centerx, self.rect.centery, math.cos(rad)*speed, math.sin(rad)*speed, is_parryable=(i%2==0))
-                self.game.all_sprites.add(p)
-                self.game.boss_bullets.add(p)
+        self.emit_pattern('compass_hell')
 
     def laser_attack_multi(self):
         l = Laser(self.game, self.game.player.rect.centery, duration=2.0, rotation_speed=30)
-        self.game.all_sprites.add(l)
-        self.game.boss_bullets.add(l)
+        self.game.entities.add(l)
 
     def reality_break(self):
         effect = random.choice(['invert_controls', 'invert_gravity', 'slow_mo'])
         self.reality_break_pending_type = effect
         self.reality_break_warning_timer = 2.0  # was 1.0 – players now have time to react
-        self.game.effect_manager.apply_shake(1.0, 2, type='rumble')
+        self.game.events.shake(1.0, 2, type='rumble')
         _labels = {'invert_controls': 'STEUERUNG INVERTIERT', 'invert_gravity': 'SCHWERKRAFT UMGEKEHRT', 'slow_mo': 'ZEITLUPE'}
         self.dialogue = f"REALITY BREAK: {_labels.get(effect, effect.upper())}!"
         self.dialogue_timer = 2.0
 
     def blackboard_barrage(self):
-        self.sound_manager.play("ultimate_attack")
+        self.game.events.sound("ultimate_attack")
         self.dialogue = "IHR WERDET ALLE DURCHFALLEN!"
         self.dialogue_timer = 2.0
         self.eraser_attack()
@@ -366,7 +426,7 @@ class Boss(pygame.sprite.Sprite):
         self.weak_point_timer = 1.0
 
     def teleport(self):
-        self.sound_manager.play("teleport")
+        self.game.events.sound("teleport")
         valid = False
         attempts = 0
         candidates = []
@@ -392,10 +452,10 @@ class Boss(pygame.sprite.Sprite):
     def take_damage(self, amount):
         if self.hp <= 0 or self.flash_timer > 0: return
         if self.shield_active:
-            self.game.effect_manager.add_damage_number(self.rect.center, "REFLECTED", color=COLOR_CYAN, size=20)
+            self.game.events.damage_number(self.rect.center, "REFLECTED", target=self, color=COLOR_CYAN, size=20)
             return
 
-        self.sound_manager.play("boss_hit")
+        self.game.events.sound("boss_hit")
         self.flash_timer = 0.166
         multiplier = 1
         is_weak = False
@@ -406,8 +466,8 @@ class Boss(pygame.sprite.Sprite):
 
         actual_damage = amount * multiplier
         self.hp -= actual_damage
-        self.game.effect_manager.add_damage_number(self.rect.center, int(actual_damage), is_weak=is_weak)
-        self.game.effect_manager.apply_shake(0.08, 3)
+        self.game.events.damage_number(self.rect.center, int(actual_damage), target=self, is_weak=is_weak)
+        self.game.events.shake(0.08, 3)
         
         if self.hp < 0: self.hp = 0
 
@@ -419,47 +479,76 @@ class Boss(pygame.sprite.Sprite):
             self.weak_point_rect = None
 
     def update_visuals(self, dt):
+        # Bleibt gepollt: Übergänge setzen dialogue ohne Timer und verlassen
+        # sich darauf, dass hier danach wieder geleert wird
         if self.dialogue_timer > 0:
             self.dialogue_timer -= dt
         else:
             self.dialogue = ""
-        if self.flash_timer > 0:
-            self.flash_timer -= dt
-        if self.shield_timer > 0:
-            self.shield_timer -= dt
-            if self.shield_timer <= 0:
-                self.shield_active = False
 
-    def draw(self, screen, camera_offset):
+    def get_state(self):
+        """Gameplay state as plain values for snapshot.py (see Player.get_state)."""
+        return self._get_fields(self), get_countdowns(self), self.alive()
+
+    def set_state(self, state):
+        values, countdowns, alive = state
+        for name, value in zip(self.STATE_FIELDS, values):
+            setattr(self, name, value)
+        set_countdowns(self, countdowns)
+        if alive and not self.alive():
+            self.game.all_sprites.add(self)
+        elif not alive:
+            self.kill()
+
+    def _end_shield(self):
+        self.shield_active = False
+
+    def draw(self, screen, view):
+        s = view.scale
         if self.shield_active:
              pulse = math.sin(pygame.time.get_ticks() * 0.02) * 5
-             pygame.draw.circle(screen, COLOR_CYAN, (self.rect.centerx - camera_offset.x, self.rect.centery - camera_offset.y), 100 + pulse, 3)
-             pygame.draw.circle(screen, COLOR_WHITE, (self.rect.centerx - camera_offset.x, self.rect.centery - camera_offset.y), 90 + pulse, 1)
+             center = view.point(*self.rect.center)
+             gfx.circle(screen, COLOR_CYAN, center, (100 + pulse) * s, view.size(3))
+             gfx.circle(screen, COLOR_WHITE, center, (90 + pulse) * s, 1)
 
-        draw_rect = self.rect.copy()
-        draw_rect.x -= camera_offset.x
-        draw_rect.y -= camera_offset.y
+        draw_rect = view.rect(self.rect)
 
         if self.flash_timer > 0:
-            pygame.draw.rect(screen, COLOR_WHITE, draw_rect)
+            gfx.rect(screen, COLOR_WHITE, draw_rect)
         elif self.state == 'idle' and self.idle_sprite:
-            screen.blit(self.idle_sprite, draw_rect)
+            if isinstance(screen, gfx.TextureCanvas):
+                # Der Renderer skaliert selbst
+                gfx.blit_scaled(screen, self.idle_sprite, draw_rect)
+            else:
+                screen.blit(self._idle_sprite_at(draw_rect.size), draw_rect)
         else:
-            pygame.draw.rect(screen, self.color, draw_rect)
-            pygame.draw.rect(screen, COLOR_BLACK, draw_rect.inflate(-10, -10), 2)
+            gfx.rect(screen, self.color, draw_rect)
+            inset = -view.size(10)
+            gfx.rect(screen, COLOR_BLACK, draw_rect.inflate(inset, inset), view.size(2))
 
             eye_color = COLOR_YELLOW if self.phase == 2 else (COLOR_RED if self.phase == 3 else COLOR_WHITE)
-            pygame.draw.rect(screen, eye_color, (draw_rect.x + 20, draw_rect.y + 40, 20, 20))
-            pygame.draw.rect(screen, eye_color, (draw_rect.x + 60, draw_rect.y + 40, 20, 20))
+            eye = view.size(20)
+            gfx.rect(screen, eye_color, (draw_rect.x + 20 * s, draw_rect.y + 40 * s, eye, eye))
+            gfx.rect(screen, eye_color, (draw_rect.x + 60 * s, draw_rect.y + 40 * s, eye, eye))
 
             if self.dialogue:
-                pygame.draw.rect(screen, COLOR_BLACK, (draw_rect.x + 30, draw_rect.y + 100, 40, 20))
+                gfx.rect(screen, COLOR_BLACK, (draw_rect.x + 30 * s, draw_rect.y + 100 * s, view.size(40), eye))
             else:
-                pygame.draw.line(screen, COLOR_BLACK, (draw_rect.x + 30, draw_rect.y + 110), (draw_rect.x + 70, draw_rect.y + 110), 3)
+                mouth_y = draw_rect.y + 110 * s
+                gfx.line(screen, COLOR_BLACK, (draw_rect.x + 30 * s, mouth_y), (draw_rect.x + 70 * s, mouth_y), view.size(3))
 
         if self.weak_point_timer > 0:
              pulse = math.sin(pygame.time.get_ticks() * 0.2) * 5
-             pygame.draw.rect(screen, COLOR_YELLOW, draw_rect.inflate(10 + pulse, 10 + pulse), 4)
+             grow = (10 + pulse) * s
+             gfx.rect(screen, COLOR_YELLOW, draw_rect.inflate(grow, grow), view.size(4))
 
         if self.dialogue:
-            draw_text(screen, self.dialogue, 24, draw_rect.centerx, draw_rect.top - 40, COLOR_WHITE)
+            draw_text(screen, self.dialogue, view.size(24), draw_rect.centerx, draw_rect.top - 40 * s, COLOR_WHITE)
+
+    def _idle_sprite_at(self, size):
+        # Bei reduzierter Render-Auflösung einmal pro Größe herunterskalieren
+        if size == self.idle_sprite.get_size():
+            return self.idle_sprite
+        if self._idle_scaled is None or self._idle_scaled.get_size() != size:
+            self._idle_scaled = pygame.transform.smoothscale(self.idle_sprite, size)
+        return self._idle_scaled
@@ -1,37 +1,49 @@
 import pygame
 import math
 import random
+import gfx
 from constants import *
 from projectiles import BaseProjectile
-from utils import get_font
+from utils import get_font, get_overlay, render_text
 
 EQUATION_FONT = None
 
 class BossProjectile(BaseProjectile):
-    def __init__(self, game, x, y, vel_x, vel_y, color=COLOR_RED, size=(20, 20), is_parryable=False):
-        super().__init__(game, x, y, vel_x, vel_y, 1, COLOR_PINK if is_parryable else color, size)
+    __slots__ = ('is_parryable', 'rot_speed')
+    entity_kind = 'boss_bullets'
+    deferrable = True
+
+    def reset(self, game, x, y, vel_x, vel_y, color=COLOR_RED, size=(20, 20), is_parryable=False, rot_speed=None):
+        super().reset(game, x, y, vel_x, vel_y, 1, COLOR_PINK if is_parryable else color, size)
         self.is_parryable = is_parryable
-        self.rot_speed = random.choice([-300, 300]) # 5 * 60
+        self.rot_speed = random.choice([-300, 300]) if rot_speed is None else rot_speed # 5 * 60
+
+    @classmethod
+    def roll(cls, kwargs):
+        kwargs.setdefault('rot_speed', random.choice([-300, 300]))
 
     def update(self, dt):
         super().update(dt)
         self.angle += self.rot_speed * dt
 
-    def draw(self, screen, camera_offset):
-        surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        pygame.draw.rect(surf, self.color, (0, 0, self.width, self.height))
-        
-        rotated_surf = pygame.transform.rotate(surf, self.angle)
-        new_rect = rotated_surf.get_rect(center=(self.rect.centerx - camera_offset.x, self.rect.centery - camera_offset.y))
-        screen.blit(rotated_surf, new_rect)
+    def draw(self, screen, view):
+        surf = get_overlay((view.size(self.width), view.size(self.height)), self.color, pygame.SRCALPHA)
+        gfx.blit_rotated(screen, surf, view.point(*self.rect.center), self.angle)
 
 class BouncingEraser(BossProjectile):
-    def __init__(self, game, x, y, size_mult=1.0, speed_mult=1.0):
+    __slots__ = ('lifetime', 'speed_up', 'squash', 'squash_timer')
+    deferrable = False
+
+    def __init__(self, *args, **kwargs):
+        self.squash = pygame.math.Vector2(1.0, 1.0)
+        super().__init__(*args, **kwargs)
+
+    def reset(self, game, x, y, size_mult=1.0, speed_mult=1.0):
         size = (int(40 * size_mult), int(40 * size_mult))
-        super().__init__(game, x, y, random.choice([-240, 240]) * speed_mult, random.choice([-240, 240]) * speed_mult, color=COLOR_BROWN, size=size)
+        super().reset(game, x, y, random.choice([-240, 240]) * speed_mult, random.choice([-240, 240]) * speed_mult, color=COLOR_BROWN, size=size)
         self.lifetime = 5.0 # 300 / 60
         self.speed_up = 1.12 # 1.002^60 approx 1.12
-        self.squash = pygame.math.Vector2(1.0, 1.0)
+        self.squash.update(1.0, 1.0)
         self.squash_timer = 0
 
     def update(self, dt):
@@ -42,7 +54,7 @@ class BouncingEraser(BossProjectile):
         if self.rect.left <= 0 or self.rect.right >= SCREEN_WIDTH:
             self.vel.x *= -1
             self.pos.x += self.vel.x * dt
-            self.squash = pygame.math.Vector2(0.6, 1.4)
+            self.squash.update(0.6, 1.4)
             self.squash_timer = 0.166 # 10 / 60
             
         self.pos.y += self.vel.y * dt
@@ -51,7 +63,7 @@ class BouncingEraser(BossProjectile):
         if self.rect.top <= 0 or self.rect.bottom >= SCREEN_HEIGHT:
             self.vel.y *= -1
             self.pos.y += self.vel.y * dt
-            self.squash = pygame.math.Vector2(1.4, 0.6)
+            self.squash.update(1.4, 0.6)
             self.squash_timer = 0.166
 
         self.lifetime -= dt
@@ -59,27 +71,30 @@ class BouncingEraser(BossProjectile):
         
         if self.squash_timer > 0:
             self.squash_timer -= dt
-            self.squash += (pygame.math.Vector2(1.0, 1.0) - self.squash) * 12 * dt
-            self.squash.x = max(0.1, self.squash.x)
-            self.squash.y = max(0.1, self.squash.y)
+            k = 12 * dt
+            self.squash.x = max(0.1, self.squash.x + (1.0 - self.squash.x) * k)
+            self.squash.y = max(0.1, self.squash.y + (1.0 - self.squash.y) * k)
 
-    def draw(self, screen, camera_offset):
-        w = self.width * self.squash.x
-        h = self.height * self.squash.y
+    def draw(self, screen, view):
+        w = self.width * self.squash.x * view.scale
+        h = self.height * self.squash.y * view.scale
         rect = pygame.Rect(0, 0, w, h)
-        rect.center = (self.pos.x - camera_offset.x, self.pos.y - camera_offset.y)
-        pygame.draw.rect(screen, self.color, rect)
-        pygame.draw.rect(screen, COLOR_WHITE, rect.inflate(-10, -10), 2)
+        rect.center = view.point(self.pos.x, self.pos.y)
+        gfx.rect(screen, self.color, rect)
+        inset = -view.size(10)
+        gfx.rect(screen, COLOR_WHITE, rect.inflate(inset, inset), view.size(2))
 
 class ChalkboardEraser(BossProjectile):
-    def __init__(self, game, direction='left'):
-        super().__init__(game, 0, 0, 0, 0, color=COLOR_GRAY, size=(100, SCREEN_HEIGHT))
+    __slots__ = ()
+
+    def reset(self, game, direction='left'):
+        super().reset(game, 0, 0, 0, 0, color=COLOR_GRAY, size=(100, SCREEN_HEIGHT))
         if direction == 'left':
-            self.pos = pygame.math.Vector2(SCREEN_WIDTH + 50, SCREEN_HEIGHT/2)
-            self.vel = pygame.math.Vector2(-720, 0)
+            self.pos.update(SCREEN_WIDTH + 50, SCREEN_HEIGHT/2)
+            self.vel.update(-720, 0)
         else:
-            self.pos = pygame.math.Vector2(-50, SCREEN_HEIGHT/2)
-            self.vel = pygame.math.Vector2(720, 0)
+            self.pos.update(-50, SCREEN_HEIGHT/2)
+            self.vel.update(720, 0)
         self.rect.center = (int(self.pos.x), int(self.pos.y))
 
     def update(self, dt):
@@ -88,15 +103,24 @@ class ChalkboardEraser(BossProjectile):
             self.kill()
 
 class EquationProjectile(BossProjectile):
-    def __init__(self, game, x, y, is_parryable=False):
-        super().__init__(game, x, y, 0, 180, color=COLOR_PINK if is_parryable else COLOR_GRAY, size=(30, 30), is_parryable=is_parryable)
+    __slots__ = ('start_x', 'pos_y', 'amplitude', 'frequency', 'offset', 'shimmer_time')
+
+    def reset(self, game, x, y, is_parryable=False, rot_speed=None, amplitude=None, offset=None):
+        super().reset(game, x, y, 0, 180, color=COLOR_PINK if is_parryable else COLOR_GRAY, size=(30, 30),
+                      is_parryable=is_parryable, rot_speed=rot_speed)
         self.start_x = x
         self.pos_y = float(y)
-        self.amplitude = random.randint(40, 60)
+        self.amplitude = random.randint(40, 60) if amplitude is None else amplitude
         self.frequency = 0.05
-        self.offset = random.random() * math.pi * 2
+        self.offset = random.random() * math.pi * 2 if offset is None else offset
         self.shimmer_time = 0
 
+    @classmethod
+    def roll(cls, kwargs):
+        super().roll(kwargs)
+        kwargs.setdefault('amplitude', random.randint(40, 60))
+        kwargs.setdefault('offset', random.random() * math.pi * 2)
+
     def update(self, dt):
         self.pos_y += self.vel.y * dt
         self.rect.y = int(self.pos_y)
@@ -104,29 +128,37 @@ class EquationProjectile(BossProjectile):
         self.shimmer_time += dt
         if self.rect.top > SCREEN_HEIGHT: self.kill()
 
-    def draw(self, screen, camera_offset):
+    def draw(self, screen, view):
         global EQUATION_FONT
-        if EQUATION_FONT is None:
-            EQUATION_FONT = get_font("Arial", 24, bold=True)
+        if view.scale != 1.0:
+            font = get_font("Arial", view.size(24), bold=True)
+        else:
+            if EQUATION_FONT is None:
+                EQUATION_FONT = get_font("Arial", 24, bold=True)
+            font = EQUATION_FONT
 
         alpha = int(200 + math.sin(self.shimmer_time * 12) * 55)
-        surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-
-        text_color = (*self.color, alpha) if len(self.color) == 3 else self.color
-        text = EQUATION_FONT.render("∑" if not self.is_parryable else "π", True, text_color)
-        rect = text.get_rect(center=(self.width//2, self.height//2))
-        surf.blit(text, rect)
-        
-        screen.blit(surf, (self.rect.x - camera_offset.x, self.rect.y - camera_offset.y))
+        text = render_text(font, "∑" if not self.is_parryable else "π", self.color[:3])
+        text.set_alpha(alpha)
+        screen.blit(text, text.get_rect(center=view.point(*self.rect.center)))
 
 class ProtractorSpin(BossProjectile):
-    def __init__(self, game, boss):
-        super().__init__(game, boss.rect.centerx, boss.rect.centery, 0, 0, color=COLOR_BLUE, size=(200, 200))
+    __slots__ = ('boss', 'timer', 'tips')
+    deferrable = False
+
+    def reset(self, game, boss):
+        super().reset(game, boss.rect.centerx, boss.rect.centery, 0, 0, color=COLOR_BLUE, size=(200, 200))
         self.is_parryable = True
         self.boss = boss
         self.timer = 10.0 # 600 / 60
         self.tips = []
 
+    STATE_SKIP = BossProjectile.STATE_SKIP | {'boss'}
+
+    def set_state(self, game, state):
+        super().set_state(game, state)
+        self.boss = game.boss
+
     def update(self, dt):
         self.angle += 120 * dt # 2 * 60
         self.rect.center = self.boss.rect.center
@@ -148,17 +180,21 @@ class ProtractorSpin(BossProjectile):
                     self.kill()
                     return
 
-    def draw(self, screen, camera_offset):
-        center = (self.rect.centerx - camera_offset.x, self.rect.centery - camera_offset.y)
-        pygame.draw.circle(screen, self.color, center, 100, 5)
+    def draw(self, screen, view):
+        center = view.point(*self.rect.center)
+        radius = 100 * view.scale
+        gfx.circle(screen, self.color, center, radius, view.size(5))
         for i in range(4):
             a = math.radians(self.angle + i * 90)
-            tip_pos = (center[0] + math.cos(a) * 100, center[1] + math.sin(a) * 100)
-            pygame.draw.circle(screen, COLOR_PINK, tip_pos, 10)
+            tip_pos = (center[0] + math.cos(a) * radius, center[1] + math.sin(a) * radius)
+            gfx.circle(screen, COLOR_PINK, tip_pos, 10 * view.scale)
 
 class Laser(BossProjectile):
-    def __init__(self, game, y, duration=0.5, rotation_speed=0):
-        super().__init__(game, SCREEN_WIDTH//2, y, 0, 0, color=COLOR_YELLOW, size=(SCREEN_WIDTH, 40))
+    __slots__ = ('timer', 'state', 'charge_timer', 'rotation_speed', 'pivot')
+    deferrable = False
+
+    def reset(self, game, y, duration=0.5, rotation_speed=0):
+        super().reset(game, SCREEN_WIDTH//2, y, 0, 0, color=COLOR_YELLOW, size=(SCREEN_WIDTH, 40))
         self.timer = duration
         self.state = 'charge'
         self.charge_timer = 1.0 # 60 / 60
@@ -177,25 +213,34 @@ class Laser(BossProjectile):
         if self.rotation_speed != 0:
             self.angle += self.rotation_speed * dt
 
-    def draw(self, screen, camera_offset):
+    def on_screen(self, visible):
+        # Der rotierende Strahl reicht weit über sein Rect hinaus
+        return True
+
+    def draw(self, screen, view):
+        s = view.scale
+        width = view.size(SCREEN_WIDTH)
         if self.state == 'charge':
-            rect = pygame.Rect(0, self.rect.y - camera_offset.y, SCREEN_WIDTH, 2)
-            rect.y += (pygame.time.get_ticks() % 40)
-            pygame.draw.rect(screen, COLOR_RED, rect)
-            pygame.draw.line(screen, COLOR_RED, (0, self.rect.centery - camera_offset.y), (SCREEN_WIDTH, self.rect.centery - camera_offset.y), 1)
+            y = int((self.rect.y - view.y + pygame.time.get_ticks() % 40) * s)
+            gfx.rect(screen, COLOR_RED, (0, y, width, view.size(2)))
+            cy = int((self.rect.centery - view.y) * s)
+            gfx.line(screen, COLOR_RED, (0, cy), (width, cy), 1)
         else:
             if self.rotation_speed == 0:
-                rect = self.rect.copy()
-                rect.y -= camera_offset.y
-                pygame.draw.rect(screen, self.color, rect)
+                rect = view.rect(self.rect)
+                rect.x = int(self.rect.x * s)
+                gfx.rect(screen, self.color, rect)
             else:
-                start = self.pivot - camera_offset
-                end = start + pygame.math.Vector2(SCREEN_WIDTH * 2, 0).rotate(self.angle)
-                pygame.draw.line(screen, self.color, start, end, 40)
+                start = pygame.math.Vector2(view.point(self.pivot.x, self.pivot.y))
+                end = start + pygame.math.Vector2(SCREEN_WIDTH * 2 * s, 0).rotate(self.angle)
+                gfx.line(screen, self.color, start, end, view.size(40))
 
 class TextbookSlam(BossProjectile):
-    def __init__(self, game, x):
-        super().__init__(game, x, -200, 0, 0, color=COLOR_DARK_RED, size=(200, 100))
+    __slots__ = ('target_x', 'timer', 'state')
+    deferrable = False
+
+    def reset(self, game, x):
+        super().reset(game, x, -200, 0, 0, color=COLOR_DARK_RED, size=(200, 100))
         self.target_x = x
         self.timer = 1.5 # 90 / 60
         self.state = 'warning'
@@ -212,14 +257,17 @@ class TextbookSlam(BossProjectile):
             self.rect.centery = int(self.pos.y)
             if self.rect.top > SCREEN_HEIGHT: self.kill()
 
-    def draw(self, screen, camera_offset):
+    def on_screen(self, visible):
+        # Die Warnung steht am Boden, während das Buch noch über dem Bild hängt
+        return self.state == 'warning' or visible.colliderect(self.rect)
+
+    def draw(self, screen, view):
         if self.state == 'warning':
-            warn_surf = pygame.Surface((200, 20), pygame.SRCALPHA)
-            warn_surf.fill((255, 0, 0, 100))
-            screen.blit(warn_surf, (self.target_x - 100 - camera_offset.x, SCREEN_HEIGHT - 20))
+            s = view.scale
+            warning = get_overlay((view.size(200), view.size(20)), (255, 0, 0, 100))
+            screen.blit(warning, (int((self.target_x - 100 - view.x) * s), int((SCREEN_HEIGHT - 20) * s)))
         
-        rect = self.rect.copy()
-        rect.x -= camera_offset.x
-        rect.y -= camera_offset.y
-        pygame.draw.rect(screen, self.color, rect)
-        pygame.draw.rect(screen, COLOR_WHITE, rect.inflate(-10, -10))
+        rect = view.rect(self.rect)
+        gfx.rect(screen, self.color, rect)
+        inset = -view.size(10)
+        gfx.rect(screen, COLOR_WHITE, rect.inflate(inset, inset))
@@ -7,8 +7,22 @@ class ChallengeMode:
     def __init__(self, game, challenge_name):
         self.game = game
         self.name = challenge_name
+        self.parry_damage_total = 0
+        self.mirror_timer = 0.0
         self.setup_challenge()
 
+    def get_state(self):
+        """Plain-value state for snapshot.py."""
+        return self.name, self.parry_damage_total, self.mirror_timer
+
+    @classmethod
+    def from_state(cls, game, state):
+        """Rebuild from get_state() without setting the challenge up again."""
+        challenge = cls.__new__(cls)
+        challenge.game = game
+        challenge.name, challenge.parry_damage_total, challenge.mirror_timer = state
+        return challenge
+
     def setup_challenge(self):
         if self.name == "No Dash":
             self.game.player.can_dash = False
@@ -53,8 +67,7 @@ class ChallengeMode:
             dmg = 10 if is_perfect else 5
             dir_x = 600 if self.game.player.facing_right else -600
             bullet = ParryDamageProjectile(self.game, self.game.player.rect.centerx, self.game.player.rect.centery, dir_x, 0, dmg)
-            self.game.all_sprites.add(bullet)
-            self.game.player_bullets.add(bullet)
+            self.game.entities.add(bullet)
 
             self.parry_damage_total += dmg
             return dmg
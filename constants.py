@@ -4,6 +4,8 @@ import pygame
 SCREEN_WIDTH = 1000
 SCREEN_HEIGHT = 600
 FPS = 60
+RENDER_SCALE = None  # Szene in reduzierter Auflösung rendern (z.B. 0.5); None = automatisch
+RENDER_BACKEND = "surface"  # "surface" (Software) oder "renderer" (SDL2 Renderer mit Texturen, siehe backend.py)
 
 # --- Colors ---
 COLOR_WHITE = (255, 255, 255)
@@ -85,6 +87,11 @@ BOSS_PHASE1_COOLDOWN = 2.5             # was hardcoded 2.0
 BOSS_PHASE2_COOLDOWN = 2.2             # was hardcoded 2.0
 BOSS_PHASE3_COOLDOWN = 1.5             # was hardcoded 1.0 – phase 3 less overwhelming
 BOSS_WEAK_POINT_DURATION = 2.5         # was hardcoded 1.0 – actually hittable now
+REALITY_BREAK_TINTS = {                # Bildschirm-Tönung je Reality-Break-Effekt
+    'invert_controls': (255, 0, 0, 50),
+    'invert_gravity': (0, 0, 255, 50),
+    'slow_mo': (255, 255, 0, 50),
+}
 
 # --- System ---
 SYSTEM_SAVE_FILE = "save_data.json"
@@ -0,0 +1,137 @@
+import pygame
+
+MOUSE_LEFT = ('mouse', 0)
+MOUSE_RIGHT = ('mouse', 2)
+
+# Aktion -> Tasten / Maustasten. Umbelegen über InputState.rebind().
+DEFAULT_BINDINGS = {
+    'left': (pygame.K_a,),
+    'right': (pygame.K_d,),
+    'up': (pygame.K_w,),
+    'down': (pygame.K_s, pygame.K_DOWN),
+    'jump': (pygame.K_SPACE,),
+    'dash': (pygame.K_LSHIFT,),
+    'super': (pygame.K_LCTRL,),
+    'focus': (pygame.K_f,),
+    'shield': (pygame.K_e,),
+    'shoot': (MOUSE_LEFT,),
+    'ex': (MOUSE_RIGHT,),
+    'ex_flieger': (pygame.K_1,),
+    'ex_eraser': (pygame.K_2,),
+    'ex_ruler': (pygame.K_3,),
+    'ex_spread': (pygame.K_4,),
+    'ex_homing': (pygame.K_5,),
+    'rewind': (pygame.K_r,),  # nur im Übungsmodus
+}
+
+
+class InputState:
+    """Snapshot of the player's controls, built once per frame.
+
+    update() reads the keyboard and mouse state and the frame's events a
+    single time; gameplay code then asks for actions (held(), pressed(),
+    released(), held_time()) instead of polling pygame itself, so every
+    read within a frame agrees. Presses come from the events too, so a tap
+    shorter than a frame is not lost.
+
+    Live input can be replaced: inject() adds actions for the next
+    snapshot (scripts, tests), play() feeds a recording made with
+    start_recording() back in frame by frame.
+    """
+
+    def __init__(self, bindings=None):
+        self.bindings = dict(DEFAULT_BINDINGS if bindings is None else bindings)
+        self._build_lookup()
+        self._held = frozenset()
+        self._pressed = frozenset()
+        self._released = frozenset()
+        self._since = {}
+        self.now = 0
+        self._injected = set()
+        self._playback = None
+        self.recording = None
+
+    def _build_lookup(self):
+        self._keys = {}
+        self._buttons = {}
+        for action, inputs in self.bindings.items():
+            for binding in inputs:
+                if isinstance(binding, tuple):
+                    self._buttons.setdefault(binding[1], []).append(action)
+                else:
+                    self._keys.setdefault(binding, []).append(action)
+
+    def rebind(self, action, *inputs):
+        self.bindings[action] = inputs
+        self._build_lookup()
+
+    def update(self, events):
+        self.now = pygame.time.get_ticks()
+        if self._playback is not None:
+            frame = next(self._playback, None)
+            if frame is None:
+                self._playback = None
+            else:
+                self._apply(*frame)
+                return
+
+        pressed = set(self._injected)
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                pressed.update(self._keys.get(event.key, ()))
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                pressed.update(self._buttons.get(event.button - 1, ()))
+
+        held = set(self._injected)
+        self._injected.clear()
+        keys = pygame.key.get_pressed()
+        for key, actions in self._keys.items():
+            if keys[key]:
+                held.update(actions)
+        if self._buttons:
+            mouse = pygame.mouse.get_pressed()
+            for button, actions in self._buttons.items():
+                if button < len(mouse) and mouse[button]:
+                    held.update(actions)
+        self._apply(frozenset(held), frozenset(pressed))
+
+    def _apply(self, held, pressed):
+        previous = self._held
+        self._pressed = pressed | (held - previous)
+        self._released = previous - held
+        for action in held - previous:
+            self._since[action] = self.now
+        self._held = held
+        if self.recording is not None:
+            self.recording.append((held, pressed))
+
+    def held(self, action):
+        return action in self._held
+
+    def pressed(self, action):
+        return action in self._pressed
+
+    def released(self, action):
+        return action in self._released
+
+    def held_time(self, action):
+        """Seconds the action has been held, 0 if it is up."""
+        if action not in self._held:
+            return 0.0
+        return (self.now - self._since[action]) / 1000.0
+
+    def inject(self, *actions):
+        """Hold and press ``actions`` in the next snapshot (scripted/bot input)."""
+        self._injected.update(actions)
+
+    def start_recording(self):
+        self.recording = []
+
+    def play(self, recording):
+        """Replace live input with a recorded sequence until it runs out."""
+        self._playback = iter(recording)
+
+    def clear(self):
+        self._held = self._pressed = self._released = frozenset()
+        self._since.clear()
+        self._injected.clear()
@@ -13,6 +13,18 @@ class DemoMode:
         self.boss_active_timer = 0
         self.setup_demo()
 
+    def get_state(self):
+        """Plain-value state for snapshot.py."""
+        return self.is_bot, self.panel_visible, self.bot_timer, self.move_dir, self.boss_active_timer
+
+    @classmethod
+    def from_state(cls, game, state):
+        """Rebuild from get_state() without setting the demo up again."""
+        demo = cls.__new__(cls)
+        demo.game = game
+        demo.is_bot, demo.panel_visible, demo.bot_timer, demo.move_dir, demo.boss_active_timer = state
+        return demo
+
     def setup_demo(self):
         self.game.player.hp = PLAYER_MAX_HP
         self.game.player.cards = 5
@@ -86,8 +98,7 @@ class DemoMode:
         offset = 250 if self.game.player.facing_right else -250
         vel_x = -300 if self.game.player.facing_right else 300
 
-        p = BossProjectile(self.game, px + offset, py, vel_x, 0, is_parryable=True)
-        self.game.all_sprites.add(p)
-        self.game.boss_bullets.add(p)
+        p = self.game.pools.acquire(BossProjectile, self.game, px + offset, py, vel_x, 0, is_parryable=True)
+        self.game.entities.add(p)
         if not self.is_bot and not is_bot:
             self.game.player.add_ability_label("DRÜCKE S + SPACE ZUM PARRIEREN")
@@ -1,13 +1,85 @@
 import pygame
 import random
 import math
+from operator import attrgetter
+import gfx
 from constants import *
-from utils import get_font
+from utils import get_font, render_text
+from timers import Countdown, get_countdowns, set_countdowns
+
+class ParticleSpriteBank:
+    """Pre-rendered particle frames shared by all particles.
+
+    Frames are keyed by kind, colour, size, rotation step and alpha bucket
+    and rendered once on first use, so drawing a particle is a dict lookup
+    plus a blit instead of a fresh Surface, fill or polygon every frame.
+    """
+    ALPHA_LEVELS = 16
+    # Der Stern ist 5-fach symmetrisch: 72° reichen für alle Drehstufen
+    STAR_ROT_STEP = 6
+    STAR_ROT_STEPS = 72 // STAR_ROT_STEP
+
+    def __init__(self):
+        self._frames = {}
+
+    def alpha_level(self, alpha):
+        """Bucket 0..255 to ALPHA_LEVELS steps; 0 means invisible."""
+        return int(max(0, min(255, alpha)) * (self.ALPHA_LEVELS - 1) / 255 + 0.5)
+
+    def _alpha(self, level):
+        return level * 255 // (self.ALPHA_LEVELS - 1)
+
+    def rect(self, color, w, h, level):
+        key = ('rect', color[:3], w, h, level)
+        surf = self._frames.get(key)
+        if surf is None:
+            surf = pygame.Surface((max(1, w), max(1, h)), pygame.SRCALPHA)
+            surf.fill((*color[:3], self._alpha(level)))
+            self._frames[key] = gfx.static(surf)
+        return surf
+
+    def dust(self, color, size, level):
+        key = ('dust', color[:3], size, level)
+        surf = self._frames.get(key)
+        if surf is None:
+            s = max(1, size)
+            r = s // 2
+            surf = pygame.Surface((s, s), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (*color[:3], self._alpha(level)), (r, r), r)
+            self._frames[key] = gfx.static(surf)
+        return surf
+
+    def star(self, color, size, rot_step, level):
+        key = ('star', color[:3], size, rot_step, level)
+        surf = self._frames.get(key)
+        if surf is None:
+            c = size + 1
+            surf = pygame.Surface((2 * c + 1, 2 * c + 1), pygame.SRCALPHA)
+            points = []
+            for i in range(10):
+                angle = math.radians(i * 36 + rot_step * self.STAR_ROT_STEP)
+                r = size if i % 2 == 0 else size * 0.4
+                points.append((c + math.cos(angle) * r, c + math.sin(angle) * r))
+            pygame.draw.polygon(surf, (*color[:3], self._alpha(level)), points)
+            self._frames[key] = gfx.static(surf)
+        return surf
+
+    def __len__(self):
+        return len(self._frames)
+
+
+sprite_bank = ParticleSpriteBank()
+
 
 class Particle:
+    # Slotted, and position/velocity kept as plain floats: hundreds of these
+    # are alive during parry bursts and updated every frame.
+    __slots__ = ('x', 'y', 'vx', 'vy', 'lifetime', 'max_lifetime',
+                 'color', 'size', 'priority', 'gravity')
+
     def __init__(self, pos, vel, lifetime, color, size, priority=1, gravity=0):
-        self.pos = pygame.math.Vector2(pos)
-        self.vel = pygame.math.Vector2(vel)
+        self.x, self.y = pos
+        self.vx, self.vy = vel
         self.lifetime = lifetime
         self.max_lifetime = lifetime
         self.color = color
@@ -16,110 +88,113 @@ class Particle:
         self.gravity = gravity
 
     def update(self, dt):
-        self.vel.y += self.gravity * dt
-        self.pos += self.vel * dt
+        self.vy += self.gravity * dt
+        self.x += self.vx * dt
+        self.y += self.vy * dt
         self.lifetime -= dt
         return self.lifetime > 0
 
-    def draw(self, screen, camera_offset):
-        pass
+    def blit_args(self, view):
+        """(surface, dest) for ParticleManager's batched blit, or None."""
+        return None
+
+    def draw(self, screen, view):
+        args = self.blit_args(view)
+        if args is not None:
+            screen.blit(*args)
 
 class SquareParticle(Particle):
-    def __init__(self, pos, vel, lifetime, color, size, priority=1, gravity=0):
-        super().__init__(pos, vel, lifetime, color, size, priority, gravity)
-        self._surf = pygame.Surface((max(1, size), max(1, size)), pygame.SRCALPHA)
+    __slots__ = ()
 
-    def draw(self, screen, camera_offset):
-        alpha = int(max(0, min(255, (self.lifetime / self.max_lifetime) * 255)))
-        c = (*self.color[:3], alpha) if len(self.color) == 3 else (*self.color[:3], alpha)
-        self._surf.fill(c)
-        rect = self._surf.get_rect(center=(self.pos.x - camera_offset.x, self.pos.y - camera_offset.y))
-        screen.blit(self._surf, rect)
+    def blit_args(self, view):
+        level = sprite_bank.alpha_level(self.lifetime / self.max_lifetime * 255)
+        if not level:
+            return None
+        s = view.size(self.size)
+        surf = sprite_bank.rect(self.color, s, s, level)
+        x, y = view.point(self.x, self.y)
+        return surf, (x - s // 2, y - s // 2)
 
 class DustParticle(Particle):
-    def __init__(self, pos, vel, lifetime, color, size, priority=1, gravity=0):
-        super().__init__(pos, vel, lifetime, color, size, priority, gravity)
-        s = max(1, size)
-        self._surf = pygame.Surface((s, s), pygame.SRCALPHA)
-        self._radius = s // 2
-
-    def draw(self, screen, camera_offset):
-        alpha = int(max(0, min(255, (self.lifetime / self.max_lifetime) * 255)))
-        self._surf.fill((0, 0, 0, 0))
-        c = (*self.color[:3], alpha)
-        pygame.draw.circle(self._surf, c, (self._radius, self._radius), self._radius)
-        cx = int(self.pos.x - camera_offset.x) - self._radius
-        cy = int(self.pos.y - camera_offset.y) - self._radius
-        screen.blit(self._surf, (cx, cy))
+    __slots__ = ()
+
+    def blit_args(self, view):
+        level = sprite_bank.alpha_level(self.lifetime / self.max_lifetime * 255)
+        if not level:
+            return None
+        size = view.size(self.size)
+        r = size // 2
+        surf = sprite_bank.dust(self.color, size, level)
+        x, y = view.point(self.x, self.y)
+        return surf, (x - r, y - r)
 
 class StarParticle(Particle):
-    def draw(self, screen, camera_offset):
-        points = []
-        center = pygame.math.Vector2(self.pos.x - camera_offset.x, self.pos.y - camera_offset.y)
+    __slots__ = ()
+
+    def blit_args(self, view):
+        level = sprite_bank.alpha_level(self.lifetime / self.max_lifetime * 255)
+        if not level:
+            return None
         rotation = (self.max_lifetime - self.lifetime) * 30
-        
-        for i in range(10):
-            angle = math.radians(i * 36 + rotation)
-            r = self.size if i % 2 == 0 else self.size * 0.4
-            points.append((center.x + math.cos(angle) * r, center.y + math.sin(angle) * r))
-            
-        alpha = int(max(0, min(255, (self.lifetime / self.max_lifetime) * 255)))
-        
-        min_x = min(p[0] for p in points)
-        min_y = min(p[1] for p in points)
-        max_x = max(p[0] for p in points)
-        max_y = max(p[1] for p in points)
-        w, h = int(max_x - min_x + 2), int(max_y - min_y + 2)
-        
-        if w > 0 and h > 0:
-            surf = pygame.Surface((w, h), pygame.SRCALPHA)
-            local_points = [(p[0] - min_x, p[1] - min_y) for p in points]
-            c = (*self.color, alpha) if len(self.color) == 3 else self.color
-            pygame.draw.polygon(surf, c, local_points)
-            screen.blit(surf, (min_x, min_y))
+        rot_step = int(rotation / sprite_bank.STAR_ROT_STEP) % sprite_bank.STAR_ROT_STEPS
+        size = view.size(self.size)
+        surf = sprite_bank.star(self.color, size, rot_step, level)
+        c = size + 1
+        x, y = view.point(self.x, self.y)
+        return surf, (x - c, y - c)
 
 class AfterimageParticle(Particle):
-    def __init__(self, pos, image, lifetime, alpha_start=200):
+    __slots__ = ('image', 'alpha_start', 'source')
+
+    def __init__(self, pos, image, lifetime, alpha_start=200, source=None):
+        # pos ist die Weltposition der oberen linken Ecke, image schon in Render-Auflösung
         super().__init__(pos, (0, 0), lifetime, COLOR_WHITE, 0, priority=0)
-        self.image = image.copy()
+        self.image = gfx.static(image.copy())
         self.alpha_start = alpha_start
-        
-    def draw(self, screen, camera_offset):
+        # Wie image entstanden ist (Player.afterimage_image): steht statt des Bildes im Snapshot
+        self.source = source
+
+    def blit_args(self, view):
+        # Eigene Kopie pro Partikel, daher darf set_alpha vor dem Batch-Blit laufen
         alpha = int(max(0, min(255, (self.lifetime / self.max_lifetime) * self.alpha_start)))
         self.image.set_alpha(alpha)
-        screen.blit(self.image, (self.pos.x - camera_offset.x, self.pos.y - camera_offset.y))
+        return self.image, view.point(self.x, self.y)
 
 class SpeedLineParticle(Particle):
-    def __init__(self, pos, vel, lifetime, color, size, priority=1, gravity=0):
-        super().__init__(pos, vel, lifetime, color, size, priority, gravity)
-        self._surf = pygame.Surface((max(1, size * 5), 2), pygame.SRCALPHA)
+    __slots__ = ()
 
-    def draw(self, screen, camera_offset):
-        alpha = int(max(0, min(255, (self.lifetime / self.max_lifetime) * 150)))
-        self._surf.fill((*self.color[:3], alpha))
-        screen.blit(self._surf, (self.pos.x - camera_offset.x, self.pos.y - camera_offset.y))
+    def blit_args(self, view):
+        level = sprite_bank.alpha_level(self.lifetime / self.max_lifetime * 150)
+        if not level:
+            return None
+        surf = sprite_bank.rect(self.color, view.size(self.size * 5), view.size(2), level)
+        return surf, view.point(self.x, self.y)
 
 class ImpactParticle(Particle):
-    def __init__(self, pos, vel, lifetime, color, size, priority=1, gravity=0):
-        super().__init__(pos, vel, lifetime, color, size, priority, gravity)
-        self._surf = pygame.Surface((max(1, size + 1), max(1, size + 1)), pygame.SRCALPHA)
+    __slots__ = ()
 
-    def draw(self, screen, camera_offset):
+    def blit_args(self, view):
         life_pct = self.lifetime / self.max_lifetime
-        cur_size = self.size * life_pct
-        if cur_size <= 0:
-            return
-        alpha = int(max(0, min(255, life_pct * 255)))
-        self._surf.fill((0, 0, 0, 0))
-        pygame.draw.rect(self._surf, (*self.color[:3], alpha), (0, 0, int(cur_size), int(cur_size)))
-        rect = self._surf.get_rect(center=(self.pos.x - camera_offset.x, self.pos.y - camera_offset.y))
-        screen.blit(self._surf, rect)
+        cur_size = int(self.size * life_pct * view.scale)
+        level = sprite_bank.alpha_level(life_pct * 255)
+        if cur_size <= 0 or not level:
+            return None
+        surf = sprite_bank.rect(self.color, cur_size, cur_size, level)
+        half = (view.size(self.size) + 1) // 2
+        x, y = view.point(self.x, self.y)
+        return surf, (x - half, y - half)
 
 class ParticleManager:
     def __init__(self):
         self.particles = []
         self.max_particles = 200
 
+    def set_max_particles(self, count):
+        self.max_particles = count
+        if len(self.particles) > count:
+            self.particles.sort(key=lambda p: (p.priority, p.lifetime))
+            del self.particles[:len(self.particles) - count]
+
     def add(self, particle):
         if len(self.particles) >= self.max_particles:
             self.particles.sort(key=lambda p: (p.priority, p.lifetime))
@@ -129,9 +204,14 @@ class ParticleManager:
     def update(self, dt):
         self.particles = [p for p in self.particles if p.update(dt)]
 
-    def draw(self, screen, camera_offset):
+    def draw(self, screen, view):
+        batch = []
         for p in self.particles:
-            p.draw(screen, camera_offset)
+            args = p.blit_args(view)
+            if args is not None:
+                batch.append(args)
+        if batch:
+            screen.blits(batch, doreturn=False)
 
     def spawn_dust(self, pos, count=3):
         for _ in range(count):
@@ -155,37 +235,75 @@ class ParticleManager:
             self.add(StarParticle(pos, (random.uniform(-480, 480), random.uniform(-480, 480)),
                                   random.uniform(0.6, 1.0), color, random.randint(4, 10), priority=3))
 
-    def spawn_trail(self, pos, color, size):
-        self.add(SquareParticle(pos, (0, 0), 0.16, color, size, priority=0))
-        
     def spawn_speed_lines(self):
         y = random.randint(0, SCREEN_HEIGHT)
         self.add(SpeedLineParticle((SCREEN_WIDTH, y), (-1800, 0), 0.16, COLOR_WHITE, random.randint(20, 50), priority=0))
 
+    def get_state(self):
+        """Particles as (class, slot values) for snapshot.py; afterimages without their image."""
+        return [(p.__class__, _particle_fields(p.__class__)[1](p)) for p in self.particles]
+
+    def set_state(self, state, afterimage_image):
+        """Inverse of get_state(); ``afterimage_image(source)`` rebuilds afterimage surfaces."""
+        particles = []
+        for cls, values in state:
+            p = cls.__new__(cls)
+            for name, value in zip(_particle_fields(cls)[0], values):
+                setattr(p, name, value)
+            if cls is AfterimageParticle:
+                p.image = gfx.static(afterimage_image(p.source))
+            particles.append(p)
+        self.particles = particles
+
+
+_particle_state = {}  # Klasse -> (Slot-Namen, attrgetter)
+
+
+def _particle_fields(cls):
+    fields = _particle_state.get(cls)
+    if fields is None:
+        names = tuple(name for klass in reversed(cls.__mro__)
+                      for name in klass.__dict__.get('__slots__', ()) if name != 'image')
+        fields = _particle_state[cls] = (names, attrgetter(*names))
+    return fields
+
+
 class DamageNumber:
+    __slots__ = ('x', 'y', 'vx', 'vy', 'text', 'color', 'lifetime', 'size')
+
     def __init__(self, pos, text, color, size=24):
-        self.pos = pygame.math.Vector2(pos)
+        self.x, self.y = pos
         self.text = text
         self.color = color
-        self.vel = pygame.math.Vector2(random.uniform(-60, 60), -120)
+        self.vx = random.uniform(-60, 60)
+        self.vy = -120
         self.lifetime = 1.0
-        self.font = get_font("Arial", size, bold=True)
+        self.size = size
 
     def update(self, dt):
-        self.pos += self.vel * dt
-        self.vel.y += 180 * dt
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        self.vy += 180 * dt
         self.lifetime -= dt
         return self.lifetime > 0
 
-    def draw(self, screen, camera_offset):
-        surf = self.font.render(self.text, True, self.color)
+    def draw(self, screen, view):
+        font = get_font("Arial", view.size(self.size), bold=True)
+        surf = render_text(font, self.text, self.color)
         alpha = int(max(0, min(255, self.lifetime * 255)))
         surf.set_alpha(alpha)
-        rect = surf.get_rect(center=(self.pos.x - camera_offset.x, self.pos.y - camera_offset.y))
+        rect = surf.get_rect(center=view.point(self.x, self.y))
         screen.blit(surf, rect)
 
 class EffectManager:
-    def __init__(self):
+    # Shake und Freeze zählen mit echter Zeit, nicht game-skaliertem dt
+    shake_timer = Countdown(clock='real_timers')
+    freeze_timer = Countdown(clock='real_timers')
+    slowmo_timer = Countdown(on_expire='_end_slowmo')
+
+    def __init__(self, timers, real_timers):
+        self.timers = timers
+        self.real_timers = real_timers
         self.shake_timer = 0
         self.shake_magnitude = 0
         self.shake_type = 'impact'
@@ -200,8 +318,12 @@ class EffectManager:
         self._zoom_speed = 6.0
         
         self.damage_numbers = []
+        self.max_damage_numbers = 30
+        self.shake_enabled = True
 
     def apply_shake(self, duration, magnitude, type='impact', vector=(0,1)):
+        if not self.shake_enabled:
+            return
         self.shake_timer = duration
         self.shake_magnitude = magnitude
         self.shake_type = type
@@ -211,6 +333,9 @@ class EffectManager:
         self.slowmo_timer = duration
         self.time_scale = scale
 
+    def _end_slowmo(self):
+        self.time_scale = 1.0
+
     def apply_freeze(self, duration):
         self.freeze_timer = duration
 
@@ -236,26 +361,42 @@ class EffectManager:
              if is_weak: text += " WEAK!"
              if is_crit: text += " CRIT!"
         
+        if len(self.damage_numbers) >= self.max_damage_numbers:
+            self.damage_numbers.pop(0)
         self.damage_numbers.append(DamageNumber(pos, text, color, size))
 
-    def update(self, dt, dt_raw=None):
-        if dt_raw is None:
-            dt_raw = dt
-
-        if self.shake_timer > 0:
-            self.shake_timer -= dt_raw
-
+    def update(self, dt):
         if self.freeze_timer > 0:
-            self.freeze_timer -= dt_raw  # zählt mit echter Zeit, nicht game-skaliertem dt
             return
 
-        if self.slowmo_timer > 0:
-            self.slowmo_timer -= dt
-            if self.slowmo_timer <= 0:
-                self.time_scale = 1.0
-
         self.damage_numbers = [d for d in self.damage_numbers if d.update(dt)]
         self.zoom_level += (self.target_zoom - self.zoom_level) * self._zoom_speed * dt
+        # Einrasten, sonst erreicht die Annäherung 1.0 nie und Game.draw bleibt im Zoom-Pfad
+        if abs(self.target_zoom - self.zoom_level) < 0.002:
+            self.zoom_level = self.target_zoom
+
+    # Spielzustand für get_state(); max_damage_numbers und shake_enabled stellt QualityController ein
+    STATE_FIELDS = ('shake_magnitude', 'shake_type', 'shake_vector', 'time_scale',
+                    'zoom_level', 'target_zoom', '_zoom_speed')
+    _get_fields = attrgetter(*STATE_FIELDS)
+    _get_damage_number = attrgetter(*DamageNumber.__slots__)
+
+    def get_state(self):
+        """Plain-value state for snapshot.py; timers are restored first (TimerScheduler.set_state)."""
+        return (self._get_fields(self), get_countdowns(self),
+                [self._get_damage_number(d) for d in self.damage_numbers])
+
+    def set_state(self, state):
+        values, countdowns, damage_numbers = state
+        for name, value in zip(self.STATE_FIELDS, values):
+            setattr(self, name, value)
+        set_countdowns(self, countdowns)
+        self.damage_numbers = []
+        for values in damage_numbers:
+            d = DamageNumber.__new__(DamageNumber)
+            for name, value in zip(DamageNumber.__slots__, values):
+                setattr(d, name, value)
+            self.damage_numbers.append(d)
 
     def get_camera_offset(self):
         offset = pygame.math.Vector2(0, 0)
@@ -270,6 +411,6 @@ class EffectManager:
                 offset.y = random.uniform(-1, 1)
         return offset
 
-    def draw(self, screen, camera_offset):
+    def draw(self, screen, view):
         for d in self.damage_numbers:
-            d.draw(screen, camera_offset)
+            d.draw(screen, view)
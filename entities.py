@@ -0,0 +1,166 @@
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# Außerhalb dieses Bereichs kann nichts mehr kollidieren (Spielerschüsse sterben
+# 200 px hinter dem Bildrand), dort dürfen lineare Entities seltener updaten.
+ACTIVE_AREA = pygame.Rect(-250, -250, SCREEN_WIDTH + 500, SCREEN_HEIGHT + 500)
+MAX_DEFER = 0.25    # s, längste Pause zwischen zwei Updates
+CULL_MARGIN = 32    # px, Überstand der Grafik über das Rect (Rotation, Icons)
+
+
+def _defer_time(entity):
+    """Seconds the entity can provably stay outside ACTIVE_AREA (0 = inside)."""
+    rect = entity.rect
+    dx = max(ACTIVE_AREA.left - rect.right, rect.left - ACTIVE_AREA.right, 0)
+    dy = max(ACTIVE_AREA.top - rect.bottom, rect.top - ACTIVE_AREA.bottom, 0)
+    dist = max(dx, dy)
+    if not dist:
+        return 0.0
+    speed = entity.vel.length()
+    return MAX_DEFER if speed * MAX_DEFER < dist else dist / speed
+
+
+class EntityList:
+    """Densely packed list holding one kind of entity (e.g. boss bullets).
+
+    kill() only flags an entity and queues it; flush() removes all killed
+    entities at the end of the frame with O(1) swap-removes. The list
+    therefore never changes shape while it is being iterated, and killed
+    entities are simply skipped until then.
+
+    Entities with ``deferrable = True`` move linearly (one update with the
+    summed dt equals several small ones). While they are far outside
+    ACTIVE_AREA they are only updated once their pending time could bring
+    them back in, so they are exact again before anything can touch them.
+    draw() skips everything outside the visible part of the world.
+    """
+
+    def __init__(self):
+        self._items = []
+        self._killed = []
+
+    def add(self, entity):
+        entity.entity_list = self
+        entity.entity_index = len(self._items)
+        entity.killed = False
+        entity.sleep = 0.0
+        entity.pending_dt = 0.0
+        self._items.append(entity)
+
+    def kill(self, entity):
+        if not entity.killed:
+            entity.killed = True
+            self._killed.append(entity)
+
+    def flush(self):
+        items = self._items
+        for entity in self._killed:
+            last = items.pop()
+            if last is not entity:
+                items[entity.entity_index] = last
+                last.entity_index = entity.entity_index
+            entity.entity_list = None
+            if entity.pool is not None:
+                entity.pool.release(entity)
+        self._killed.clear()
+
+    def clear(self):
+        for entity in self._items:
+            entity.entity_list = None
+            if entity.pool is not None:
+                entity.pool.release(entity)
+        self._items.clear()
+        self._killed.clear()
+
+    def __iter__(self):
+        for entity in self._items:
+            if not entity.killed:
+                yield entity
+
+    def __len__(self):
+        return len(self._items) - len(self._killed)
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def sprites(self):
+        return [entity for entity in self._items if not entity.killed]
+
+    def update(self, dt):
+        # Entities spawned during this loop get their first update next frame.
+        items = self._items
+        in_active_area = ACTIVE_AREA.colliderect
+        for i in range(len(items)):
+            entity = items[i]
+            if entity.killed:
+                continue
+            if entity.sleep:
+                step = entity.pending_dt + dt
+                if step < entity.sleep:
+                    entity.pending_dt = step
+                    continue
+                entity.pending_dt = entity.sleep = 0.0
+                entity.update(step)
+            else:
+                entity.update(dt)
+            if entity.deferrable and not in_active_area(entity.rect):
+                entity.sleep = _defer_time(entity)
+
+    def draw(self, screen, view):
+        visible = view.visible.inflate(CULL_MARGIN * 2, CULL_MARGIN * 2)
+        for entity in self._items:
+            if not entity.killed and entity.on_screen(visible):
+                entity.draw(screen, view)
+
+    def collide(self, rect, kill=False):
+        """Live entities whose rect overlaps ``rect``; optionally kill them."""
+        colliderect = rect.colliderect
+        hits = [entity for entity in self._items
+                if not entity.killed and colliderect(entity.rect)]
+        if kill:
+            for entity in hits:
+                entity.kill()
+        return hits
+
+
+class EntityRegistry:
+    """All projectiles of a fight, one EntityList per kind.
+
+    Entities name their list through the ``entity_kind`` class attribute.
+    """
+
+    def __init__(self, pools=None):
+        self.pools = pools
+        self.player_bullets = EntityList()
+        self.boss_bullets = EntityList()
+        self._lists = (self.player_bullets, self.boss_bullets)
+
+    def add(self, entity):
+        getattr(self, entity.entity_kind).add(entity)
+        return entity
+
+    def spawn(self, cls, *args, **kwargs):
+        """Pooled spawn for attack bursts, active in the same frame.
+
+        Bursts stay cheap because the boss fills the pools ahead of time
+        in idle steps (ProjectilePools.prewarm_steps); bullets starting far
+        off-screen are only updated rarely until they come close (see
+        EntityList).
+        """
+        return self.add(self.pools.acquire(cls, *args, **kwargs))
+
+    def spawn_many(self, cls, rows):
+        """Batch version of spawn() for patterns.SpawnTable.rows()."""
+        entity_list = getattr(self, cls.entity_kind)
+        pool = self.pools.get(cls)
+        for args, kwargs in rows:
+            entity_list.add(pool.acquire(*args, **kwargs))
+
+    def flush(self):
+        """Deferred kill processing – call once at the end of every frame."""
+        for entity_list in self._lists:
+            entity_list.flush()
+
+    def clear(self):
+        for entity_list in self._lists:
+            entity_list.clear()
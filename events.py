@@ -0,0 +1,73 @@
+class EventBus:
+    """Per-frame queue for gameplay side effects: screen shake, sounds, damage numbers.
+
+    Gameplay code emits here instead of calling the effect/sound managers
+    directly; Game.update drains the queue once at the end of the frame.
+    Duplicates within a frame are coalesced: of several shakes only the
+    strongest is applied, each sound is played once (at the loudest
+    requested volume) and numeric damage numbers on the same target are
+    summed into one. Listeners (e.g. telemetry) see every event as emitted.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.listeners = []
+        self._shake = None
+        self._sounds = {}
+        self._numbers = {}
+
+    def subscribe(self, listener):
+        """``listener(kind, args)`` is called for every emitted event."""
+        self.listeners.append(listener)
+
+    def _notify(self, kind, args):
+        for listener in self.listeners:
+            listener(kind, args)
+
+    def shake(self, duration, magnitude, type='impact', vector=(0, 1)):
+        if self.listeners:
+            self._notify('shake', (duration, magnitude, type, vector))
+        current = self._shake
+        if current is None or (magnitude, duration) > (current[1], current[0]):
+            self._shake = (duration, magnitude, type, vector)
+
+    def sound(self, name, volume=1.0):
+        if self.listeners:
+            self._notify('sound', (name, volume))
+        if volume > self._sounds.get(name, -1.0):
+            self._sounds[name] = volume
+
+    def damage_number(self, pos, amount, target=None, is_weak=False, is_crit=False, color=None, size=None):
+        """Like EffectManager.add_damage_number; ``target`` groups numbers for summing."""
+        if self.listeners:
+            self._notify('damage_number', (pos, amount, target))
+        numeric = isinstance(amount, (int, float))
+        # Zahlen pro Ziel addieren, gleiche Texte nur einmal zeigen
+        key = (target if target is not None else tuple(pos), None if numeric else amount,
+               is_weak, is_crit, color, size)
+        entry = self._numbers.get(key)
+        if entry is None:
+            self._numbers[key] = [pos, amount]
+        elif numeric:
+            entry[1] += amount
+
+    def flush(self):
+        effect_manager = self.game.effect_manager
+        if self._shake is not None:
+            effect_manager.apply_shake(*self._shake)
+            self._shake = None
+        if self._sounds:
+            play = self.game.sound_manager.play
+            for name, volume in self._sounds.items():
+                play(name, volume)
+            self._sounds.clear()
+        if self._numbers:
+            for (_, _, is_weak, is_crit, color, size), (pos, amount) in self._numbers.items():
+                effect_manager.add_damage_number(pos, amount, is_weak=is_weak, is_crit=is_crit,
+                                                 color=color, size=size)
+            self._numbers.clear()
+
+    def clear(self):
+        self._shake = None
+        self._sounds.clear()
+        self._numbers.clear()
@@ -0,0 +1,229 @@
+import math
+import weakref
+import pygame
+
+try:
+    from pygame._sdl2 import video
+except ImportError:  # pygame ohne SDL2-Module: nur die Software-Ausgabe
+    video = None
+
+# Surfaces, die sich nach dem Anlegen nicht mehr ändern (Sprites, Partikel-
+# Frames, Overlays, Text aus dem Cache). Der Renderer lädt sie nur einmal als
+# Textur hoch; alle anderen Surfaces werden bei jedem Blit neu hochgeladen.
+_static = weakref.WeakKeyDictionary()
+
+
+def static(surface):
+    """Mark ``surface`` as immutable, so the renderer keeps its texture; returns it.
+
+    Only the surface alpha (set_alpha) may still change afterwards.
+    """
+    if surface is not None:
+        _static.setdefault(surface, {})
+    return surface
+
+
+class TextureDevice:
+    """Renderer plus the textures shared by all canvases drawing with it."""
+
+    def __init__(self, renderer):
+        self.renderer = renderer
+        self.bound = None  # Canvas, auf das der Renderer gerade zeichnet
+        self._circles = {}
+        self._pixel = None
+
+    def texture(self, surface):
+        """Texture for ``surface``, uploaded once if it is static(); None if it is empty."""
+        w, h = surface.get_size()
+        if not w or not h:
+            return None
+        textures = _static.get(surface)
+        if textures is None:
+            tex = video.Texture.from_surface(self.renderer, surface)
+        else:
+            tex = textures.get(self)
+            if tex is None:
+                tex = textures[self] = video.Texture.from_surface(self.renderer, surface)
+            alpha = surface.get_alpha()
+            tex.alpha = 255 if alpha is None else alpha
+        return tex
+
+    def circle(self, radius, width):
+        key = (radius, width)
+        tex = self._circles.get(key)
+        if tex is None:
+            surf = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (255, 255, 255), (radius, radius), radius, width)
+            tex = self._circles[key] = video.Texture.from_surface(self.renderer, surf)
+        return tex
+
+    def pixel(self):
+        # 1x1 weiß, gestreckt und gedreht für breite Linien
+        if self._pixel is None:
+            surf = pygame.Surface((1, 1))
+            surf.fill((255, 255, 255))
+            self._pixel = video.Texture.from_surface(self.renderer, surf)
+        return self._pixel
+
+
+class TextureCanvas:
+    """Surface-like draw target on an SDL2 Renderer: the window or a target texture.
+
+    Implements the part of the Surface API the draw code uses (fill, blit,
+    blits, get_size/get_rect); shapes go through the module functions
+    below. Blits draw the source's texture, so rotation and scaling are
+    done by the renderer (blit_rotated, blit_scaled).
+    """
+
+    def __init__(self, device, size, texture=None):
+        self.device = device
+        self.size = tuple(size)
+        self.texture = texture  # None = Fenster
+
+    def _bind(self):
+        device = self.device
+        if device.bound is not self:
+            device.renderer.target = self.texture
+            device.bound = self
+        return device.renderer
+
+    def get_size(self):
+        return self.size
+
+    def get_width(self):
+        return self.size[0]
+
+    def get_height(self):
+        return self.size[1]
+
+    def get_rect(self, **kwargs):
+        rect = pygame.Rect((0, 0), self.size)
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+    def fill(self, color, rect=None, special_flags=0):
+        renderer = self._bind()
+        renderer.draw_color = pygame.Color(color)
+        if rect is None:
+            renderer.clear()
+        else:
+            renderer.fill_rect(rect)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        if area is None:
+            w, h = source.get_size()
+        else:
+            area = pygame.Rect(area)
+            w, h = area.size
+        rect = pygame.Rect(dest[0], dest[1], w, h)
+        tex = self.device.texture(source)
+        if tex is not None:
+            tex.blend_mode = pygame.BLENDMODE_ADD if special_flags & pygame.BLEND_ADD else pygame.BLENDMODE_BLEND
+            self._bind()
+            tex.draw(srcrect=area, dstrect=rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn=True):
+        rects = [self.blit(*args) for args in blit_sequence]
+        return rects if doreturn else None
+
+    def draw_texture(self, source, rect, angle=0, flip_x=False, flip_y=False):
+        tex = self.device.texture(source)
+        if tex is not None:
+            tex.blend_mode = pygame.BLENDMODE_BLEND
+            self._bind()
+            tex.draw(dstrect=rect, angle=angle, flip_x=flip_x, flip_y=flip_y)
+
+    def blit_canvas(self, source, area, rect):
+        """Draw the target texture of canvas ``source`` (its ``area``) stretched to ``rect``."""
+        self._bind()
+        source.texture.draw(srcrect=area, dstrect=rect)
+
+    def draw_shape(self, tex, color, rect, angle=0):
+        tex.color = pygame.Color(color)
+        tex.alpha = 255
+        tex.blend_mode = pygame.BLENDMODE_BLEND
+        self._bind()
+        tex.draw(dstrect=rect, angle=angle)
+
+
+# ---------------------------------------------------------------------------
+# Draw helpers: pygame.draw / transform on Surfaces, renderer calls on canvases
+# ---------------------------------------------------------------------------
+
+def rect(target, color, rect, width=0):
+    if target.__class__ is not TextureCanvas:
+        return pygame.draw.rect(target, color, rect, width)
+    rect = pygame.Rect(rect)
+    renderer = target._bind()
+    renderer.draw_color = pygame.Color(color)
+    if width <= 0 or 2 * width >= min(rect.w, rect.h):
+        renderer.fill_rect(rect)
+    else:
+        # Rahmen nach innen, wie pygame.draw.rect
+        x, y, w, h = rect
+        renderer.fill_rect((x, y, w, width))
+        renderer.fill_rect((x, y + h - width, w, width))
+        renderer.fill_rect((x, y + width, width, h - 2 * width))
+        renderer.fill_rect((x + w - width, y + width, width, h - 2 * width))
+    return rect
+
+
+def line(target, color, start, end, width=1):
+    if target.__class__ is not TextureCanvas:
+        return pygame.draw.line(target, color, start, end, width)
+    if width <= 1:
+        renderer = target._bind()
+        renderer.draw_color = pygame.Color(color)
+        renderer.draw_line(start, end)
+        return
+    dx, dy = end[0] - start[0], end[1] - start[1]
+    length = math.hypot(dx, dy)
+    cx, cy = (start[0] + end[0]) / 2, (start[1] + end[1]) / 2
+    target.draw_shape(target.device.pixel(), color,
+                      (cx - length / 2, cy - width / 2, length, width),
+                      math.degrees(math.atan2(dy, dx)))
+
+
+def circle(target, color, center, radius, width=0):
+    if target.__class__ is not TextureCanvas:
+        return pygame.draw.circle(target, color, center, radius, width)
+    r = int(radius)
+    if r < 1:
+        return
+    tex = target.device.circle(r, width)
+    target.draw_shape(tex, color, (center[0] - r, center[1] - r, 2 * r, 2 * r))
+
+
+def polygon(target, color, points, width=0):
+    if target.__class__ is not TextureCanvas:
+        return pygame.draw.polygon(target, color, points, width)
+    # Der Renderer kann keine Polygone füllen: in Software zeichnen und hochladen
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    x0, y0 = int(min(xs)) - 1, int(min(ys)) - 1
+    surf = pygame.Surface((int(max(xs)) - x0 + 2, int(max(ys)) - y0 + 2), pygame.SRCALPHA)
+    pygame.draw.polygon(surf, color, [(x - x0, y - y0) for x, y in points], width)
+    target.blit(surf, (x0, y0))
+
+
+def blit_rotated(target, surface, center, angle):
+    """Blit ``surface`` rotated by ``angle`` degrees (counter-clockwise, like
+    transform.rotate), centred on ``center``."""
+    if target.__class__ is not TextureCanvas:
+        rotated = pygame.transform.rotate(surface, angle)
+        return target.blit(rotated, rotated.get_rect(center=center))
+    w, h = surface.get_size()
+    # Texture.draw dreht im Uhrzeigersinn
+    target.draw_texture(surface, (center[0] - w / 2, center[1] - h / 2, w, h), -angle)
+
+
+def blit_scaled(target, surface, rect, flip_x=False):
+    """Blit ``surface`` stretched to ``rect``, mirrored horizontally if ``flip_x``."""
+    if target.__class__ is not TextureCanvas:
+        scaled = surface if rect.size == surface.get_size() else pygame.transform.scale(surface, rect.size)
+        if flip_x:
+            scaled = pygame.transform.flip(scaled, True, False)
+        return target.blit(scaled, rect)
+    target.draw_texture(surface, rect, flip_x=flip_x)
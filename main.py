@@ -1,16 +1,30 @@
 import pygame
 import sys
+import time
+import asyncio
+from operator import attrgetter
+import gfx
 from constants import *
 from player import Player
 from boss import Boss
-from projectiles import EXSuper
+from projectiles import EXSuper, draw_trails
 from effects import ParticleManager, EffectManager
+from pools import ProjectilePools
+from entities import EntityRegistry
+from quality import QualityController
 from ui import UIManager, GradeScreen
 from challenge import ChallengeMode
 from demo import DemoMode
-from tutorial import TutorialManager
 from save_system import SaveSystem
-from utils import draw_text, SoundManager
+from backend import create_backend
+from timers import TimerScheduler, Countdown, get_countdowns, set_countdowns
+from events import EventBus
+from controls import InputState
+from scenes import SCENES
+from runner import AsyncRunner, save_flusher
+from tasks import IdleScheduler, IDLE_MARGIN
+from snapshot import take_snapshot, restore_snapshot
+from utils import get_overlay, SoundManager
 
 class Platform(pygame.sprite.Sprite):
     def __init__(self, x, y, width, height):
@@ -20,29 +34,50 @@ class Platform(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(topleft=(x, y))
 
 class Game:
+    reality_break_timer = Countdown(on_expire='_end_reality_break')
+
+    # Kampfzustand von Game für get_state() (snapshot.py)
+    STATE_FIELDS = ('game_time', 'reality_break_type', 'inverted_controls', 'inverted_gravity',
+                    'total_parries', 'perfect_parries', 'style_points', 'action_log',
+                    'tutorial_damage_dealt', 'is_demo_bot', 'is_demo_interactive', 'game_over_timer')
+    _get_fields = attrgetter(*STATE_FIELDS)
+
     def __init__(self):
         pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.backend = create_backend("Dr. Pythagoras 2.0 - Ultimate Boss Fight")
+        self.screen = self.backend.screen
         self.render_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Dr. Pythagoras 2.0 - Ultimate Boss Fight")
+        self.scene_small = None  # Szenenpuffer bei reduzierter Render-Auflösung
         self.clock = pygame.time.Clock()
+        self.frame_start = time.perf_counter()  # Ende von Clock.tick() im laufenden Frame
+        self.idle_tasks = IdleScheduler()
         self.save_system = SaveSystem()
+        # Falls ein Speichern noch als Hintergrundaufgabe wartet
+        pygame.register_quit(self.save_system.flush)
 
-        self.state = "MENU"
         self.ui_manager = UIManager(self)
+        self.scenes = []  # Szenen-Stapel, oben liegt die aktive (siehe scenes.py)
+        self.state = "MENU"
         self.challenge = None
         self.demo = None
         self.tutorial_manager = None
         self.game_over_timer = 0.0
 
+        self.timers = TimerScheduler()       # Spielzeit (skaliert, steht im Freeze)
+        self.real_timers = TimerScheduler()  # echte Frame-Zeit
         self.particle_manager = ParticleManager()
-        self.effect_manager = EffectManager()
+        self.effect_manager = EffectManager(self.timers, self.real_timers)
         self.sound_manager = SoundManager()
+        self.pools = ProjectilePools()
+        self.entities = EntityRegistry(self.pools)
+        self.events = EventBus(self)
+        self.input = InputState()
+        self.quality = QualityController(self)
 
-        self.all_sprites = pygame.sprite.Group()
+        self.all_sprites = pygame.sprite.Group()  # platforms, player, boss
         self.platforms = pygame.sprite.Group()
-        self.player_bullets = pygame.sprite.Group()
-        self.boss_bullets = pygame.sprite.Group()
+        self.player_bullets = self.entities.player_bullets
+        self.boss_bullets = self.entities.boss_bullets
 
         self.game_time = 0
         self.reality_break_timer = 0
@@ -54,15 +89,20 @@ class Game:
         self.perfect_parries = 0
         self.style_points = 0
         self.inactivity_timer = 0
+        self.idle_waited = False        # last loop iteration blocked in wait_events()
+        self.static_frame_shown = False  # display already shows the paused/frozen frame
+        self.save_deferred = False      # a runner service writes the save file (runner.save_flusher)
 
         self.reset_game()
 
     def reset_game(self, challenge_name=None, is_demo=False, is_demo_interactive=False):
         self.inactivity_timer = 0
+        self.timers.clear()
+        self.real_timers.clear()
+        self.events.clear()
+        self.entities.clear()
         self.all_sprites.empty()
         self.platforms.empty()
-        self.player_bullets.empty()
-        self.boss_bullets.empty()
         self.particle_manager.particles = []
         self.effect_manager.damage_numbers = []
 
@@ -110,123 +150,103 @@ class Game:
         self.effect_manager.zoom_level = 1.0
         self.effect_manager.target_zoom = 1.0
 
-    def handle_events(self):
-        events = pygame.event.get()
+    @property
+    def scene(self):
+        return self.scenes[-1]
+
+    @property
+    def state(self):
+        return self.scenes[-1].name
+
+    @state.setter
+    def state(self, name):
+        """Switch scenes by name (scenes.SCENES).
+
+        Overlays (pause, game over) are pushed over the current scene;
+        naming the scene right below the top pops back to it; anything
+        else replaces the whole stack.
+        """
+        if self.scenes and self.scenes[-1].name == name:
+            return
+        cls = SCENES[name]
+        if cls.overlay:
+            self.push_scene(cls(self, self.scenes[-1]))
+        elif len(self.scenes) > 1 and self.scenes[-2].name == name:
+            self.pop_scene()
+        else:
+            self.scenes = []
+            self.push_scene(cls(self))
+
+    def push_scene(self, scene):
+        self.scenes.append(scene)
+        self.invalidate()
+
+    def pop_scene(self):
+        self.scenes.pop()
+        self.invalidate()
+
+    def invalidate(self):
+        """Force a full redraw, e.g. after the window was exposed."""
+        self.ui_manager.invalidate()
+        self.static_frame_shown = False
+
+    def idle_timeout(self):
+        """Milliseconds the loop may block waiting for input, or None.
+
+        Only idle scenes block, bounded by the scene's idle_wait() (next
+        timer that must fire on time, e.g. the MENU inactivity -> demo
+        switch or the GAME_OVER countdown).
+        """
+        if not self.scene.idle:
+            return None
+        wait = self.scene.idle_wait()
+        if self.idle_tasks:
+            # Hintergrundaufgaben brauchen freie Frames, also nicht lange schlafen
+            wait = min(wait, 1.0 / FPS)
+        return max(0, int(wait * 1000))
+
+    def wait_events(self, timeout):
+        """Block until an event arrives or ``timeout`` ms have passed."""
+        events = []
+        if timeout > 0:
+            event = pygame.event.wait(timeout)
+            if event.type != pygame.NOEVENT:
+                events.append(event)
+            self.idle_waited = True
+        events.extend(pygame.event.get())
+        return events
+
+    def handle_events(self, events=None):
+        if events is None:
+            events = pygame.event.get()
+        # Spielsteuerung (Springen, Dash, Parry, ...) liest der Spieler aus diesem Snapshot
+        self.input.update(events)
         for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
 
+            if event.type == pygame.WINDOWEXPOSED:
+                self.invalidate()
+
             if event.type in [pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN]:
                  self.inactivity_timer = 0
                  if self.state == "DEMO" and self.is_demo_bot:
                       self.state = "MENU"
 
-            if self.state == "MENU":
-                action = self.ui_manager.menu.update([event])
-                if action == "TUTORIAL":
-                    self.reset_game()
-                    self.tutorial_manager = TutorialManager(self)
-                    self.state = "TUTORIAL"
-                elif action == "START GAME":
-                    self.reset_game()
-                    self.state = "PLAYING"
-                elif action == "CHALLENGE MODES":
-                    self.state = "CHALLENGE_SELECT"
-                elif action == "DEMO MODE":
-                    self.reset_game(challenge_name=None, is_demo_interactive=True)
-                elif action == "STATISTICS":
-                    self.state = "STATISTICS"
-                elif action == "QUIT":
-                    pygame.quit()
-                    sys.exit()
-
-            elif self.state == "CHALLENGE_SELECT":
-                chal_action = self.ui_manager.challenge_screen.update([event])
-                if chal_action == "BACK":
-                    self.state = "MENU"
-                elif chal_action:
-                    self.reset_game(challenge_name=chal_action)
-                    self.state = "PLAYING"
-
-            elif self.state == "STATISTICS":
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                    self.state = "MENU"
-
-            elif self.state == "GAME_OVER":
-                if event.type == pygame.KEYDOWN and event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                    self.state = "MENU"
-
-            elif self.state == "TUTORIAL":
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        if self.tutorial_manager and not self.tutorial_manager.done:
-                            self.tutorial_manager.skip_step()
-                    if event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                        if self.tutorial_manager:
-                            self.tutorial_manager.finish()
-                            if self.tutorial_manager.done:
-                                self.state = "MENU"
-                    if event.key == pygame.K_LSHIFT:
-                        self.player.dash()
-
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                    keys_held = pygame.key.get_pressed()
-                    if keys_held[pygame.K_s] or keys_held[pygame.K_DOWN]:
-                        self.player.parry_active_timer = PLAYER_PARRY_WINDOW
-                        self.player.perfect_parry_window = PLAYER_PERFECT_PARRY_WINDOW
-                    else:
-                        self.player.jump()
-
-            elif self.state in ["PLAYING", "DEMO"]:
-                if self.state == "DEMO":
-                    ability = self.ui_manager.demo_panel.update([event])
-                    if ability:
-                        self.handle_demo_ability(ability)
-
-                if event.type == pygame.KEYDOWN:
-                    if self.state == "DEMO":
-                        if event.key == pygame.K_TAB:
-                            self.demo.panel_visible = not self.demo.panel_visible
-                        if event.key == pygame.K_r:
-                            self.boss.hp = 100
-                            self.boss.phase = 1
-                            self.boss.state = 'idle'
-                        if event.key == pygame.K_b:
-                            self.player.pos = pygame.math.Vector2(100, SCREEN_HEIGHT)
-                        if event.key == pygame.K_ESCAPE:
-                            self.state = "MENU"
-
-                    if event.key == pygame.K_SPACE:
-                        keys_held = pygame.key.get_pressed()
-                        if keys_held[pygame.K_s] or keys_held[pygame.K_DOWN]:
-                            # Duck + Parry (Ground or Air)
-                            self.player.parry_active_timer = PLAYER_PARRY_WINDOW
-                            self.player.perfect_parry_window = PLAYER_PERFECT_PARRY_WINDOW
-                        else:
-                            self.player.jump()
-
-                    if event.key == pygame.K_LSHIFT:
-                        self.player.dash()
-
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_p:
-                     self.state = "PAUSED"
-
-            elif self.state == "PAUSED":
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_p:
-                    self.state = "PLAYING"
-
-            elif self.state == "WIN_SCREEN":
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                    self.state = "MENU"
+            self.scene.handle_event(event)
+
+    def _end_reality_break(self):
+        self.inverted_controls = False
+        self.inverted_gravity = False
 
     def apply_reality_break(self, effect_type):
         self.reality_break_type = effect_type
         self.reality_break_timer = 2.0
-        self.sound_manager.play("reality_break")
+        self.events.sound("reality_break")
         if effect_type == 'invert_controls':
              self.inverted_controls = True
-             self.effect_manager.apply_shake(0.16, 5)
+             self.events.shake(0.16, 5)
         elif effect_type == 'invert_gravity':
              self.inverted_gravity = True
         elif effect_type == 'slow_mo':
@@ -234,82 +254,23 @@ class Game:
 
     def update(self):
         dt_raw = self.clock.tick(FPS) / 1000.0
+        self.frame_start = time.perf_counter()
+        scene = self.scene
+        if self.idle_waited:
+            # Die Wartezeit zählt für die Idle-Timer, ist aber kein Simulationsschritt
+            self.idle_waited = False
+            if not scene.idle:
+                dt_raw = 1.0 / FPS
+        elif scene.simulated:
+            self.quality.update(self.clock.get_rawtime(), dt_raw)
         dt = dt_raw * self.effect_manager.time_scale
         if self.effect_manager.freeze_timer > 0:
             dt = 0
 
-        if self.state == "MENU":
-            self.inactivity_timer += dt_raw
-            if self.inactivity_timer >= 15.0:
-                self.reset_game(is_demo=True)
-
-        if self.state == "GAME_OVER":
-            self.game_over_timer -= dt_raw
-            if self.game_over_timer <= 0:
-                self.state = "MENU"
-
-        if self.state == "TUTORIAL":
-            if self.tutorial_manager:
-                self.tutorial_manager.update(dt)
-                if self.tutorial_manager.done:
-                    self.state = "MENU"
-            self.player.update(dt)
-            self.boss.update(dt)
-            self.player_bullets.update(dt)
-            self.boss_bullets.update(dt)
-            self.particle_manager.update(dt)
-            self.effect_manager.update(dt, dt_raw=dt_raw)
-            # Track damage dealt to boss during tutorial
-            if self.player.alive() and self.boss.alive():
-                hits = pygame.sprite.spritecollide(self.boss, self.player_bullets, True)
-                for bullet in hits:
-                    self.tutorial_damage_dealt += bullet.damage
-                    self.particle_manager.spawn_impact(bullet.rect.center, color=COLOR_WHITE)
-
-        if self.state in ["PLAYING", "DEMO"]:
-            if self.state == "PLAYING":
-                self.game_time += dt
-
-            if self.challenge:
-                self.challenge.update(dt)
-
-            if self.state == "DEMO":
-                self.demo.update(dt)
-
-            self.player.update(dt)
-            if self.state == "PLAYING" or (self.state == "DEMO" and self.demo.boss_active_timer > 0):
-                self.boss.update(dt)
-                if self.state == "DEMO" and self.demo.boss_active_timer > 0:
-                    self.demo.boss_active_timer -= dt
-            else:
-                self.boss.update_weak_point(dt)
-                self.boss.update_visuals(dt)
-                self.boss.rect.center = self.boss.pos + self.boss.vibrate_offset
-            self.player_bullets.update(dt)
-            self.boss_bullets.update(dt)
-            self.particle_manager.update(dt)
-            self.effect_manager.update(dt, dt_raw=dt_raw)
-            
-            if self.reality_break_timer > 0:
-                self.reality_break_timer -= dt
-                if self.reality_break_timer <= 0:
-                    self.inverted_controls = False
-                    self.inverted_gravity = False
-
-            if self.player.alive() and self.boss.alive():
-                hits = pygame.sprite.spritecollide(self.boss, self.player_bullets, True)
-                for bullet in hits:
-                    self.boss.take_damage(bullet.damage)
-                    self.particle_manager.spawn_impact(bullet.rect.center, color=COLOR_WHITE)
-                    # Style: Weak Point Treffer
-                    if self.boss.weak_point_timer > 0:
-                        self.style_points += 5
-                    # Style: Treffer während Streber Mode
-                    if self.player.streber_mode:
-                        self.style_points += 2
-
-            if self.boss.is_dying and self.boss.state_timer <= 0:
-                self.win_game()
+        scene.update(dt, dt_raw)
+
+        self.entities.flush()
+        self.events.flush()
 
     def win_game(self):
         self.inactivity_timer = 0
@@ -327,8 +288,11 @@ class Game:
             'perfect_parries': self.perfect_parries, 
             'style': self.style_points + (self.player.cards * 10) + style_bonus
         }
+        practice = self.state == "PRACTICE"
         self.grade_screen = GradeScreen(self, stats)
         self.state = "WIN_SCREEN"
+        if practice:
+            return  # mit Zurückspulen gewonnen – zählt nicht für die Statistik
 
         self.save_system.update_stat("total_wins", 1)
         self.save_system.update_stat("best_time", self.game_time, mode="min")
@@ -352,60 +316,85 @@ class Game:
                   if "Perfektionist" not in self.save_system.data["unlocks"]["skins"]:
                        self.save_system.data["unlocks"]["skins"].append("Perfektionist")
 
-        self.save_system.save()  # always persist stats, regardless of game mode
+        if not self.save_deferred:
+            # always persist stats, regardless of game mode – in spare frame time, not mid-frame
+            self.idle_tasks.add("save", self.save_system.save_later(), priority=2, deadline=0.5)
 
     def game_over(self):
+        if self.state == "PRACTICE":
+            # Im Übungsmodus wird zurückgespult statt verloren
+            self.scene.player_died()
+            return
         self.inactivity_timer = 0
         self.game_over_timer = 4.0
         self.state = "GAME_OVER"
 
-    def draw(self):
-        self.render_surface.fill(COLOR_BLACK)
-        
-        if self.state == "CHALLENGE_SELECT":
-             self.ui_manager.draw(self.screen)
-             pygame.display.flip()
-             return
-
-        camera_offset = self.effect_manager.get_camera_offset()
-
-        if self.state in ["PLAYING", "PAUSED", "WIN_SCREEN", "DEMO", "TUTORIAL"]:
-            for plat in self.platforms:
-                pygame.draw.rect(self.render_surface, COLOR_GRAY, plat.rect.move(-camera_offset.x, -camera_offset.y))
-
-            self.player.draw(self.render_surface, camera_offset)
-            self.boss.draw(self.render_surface, camera_offset)
-
-            for bullet in self.player_bullets: bullet.draw(self.render_surface, camera_offset)
-            for bullet in self.boss_bullets: bullet.draw(self.render_surface, camera_offset)
-
-            self.particle_manager.draw(self.render_surface, camera_offset)
-            self.effect_manager.draw(self.render_surface, camera_offset)
-            
-            if self.reality_break_timer > 0:
-                overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                color = (255, 0, 0, 50)
-                if self.reality_break_type == 'invert_gravity': color = (0, 0, 255, 50)
-                if self.reality_break_type == 'slow_mo': color = (255, 255, 0, 50)
-                overlay.fill(color)
-                self.render_surface.blit(overlay, (0, 0))
-                _rb_labels = {'invert_controls': 'STEUERUNG INVERTIERT!', 'invert_gravity': 'SCHWERKRAFT UMGEKEHRT!', 'slow_mo': 'ZEITLUPE!'}
-                rb_text = _rb_labels.get(self.reality_break_type, self.reality_break_type.upper())
-                draw_text(self.render_surface, f"REALITY BREAK: {rb_text}", 32, SCREEN_WIDTH//2, 150, COLOR_WHITE)
-
-        zoom = self.effect_manager.zoom_level
-        if zoom != 1.0:
-            w, h = int(SCREEN_WIDTH * zoom), int(SCREEN_HEIGHT * zoom)
-            scaled = pygame.transform.scale(self.render_surface, (w, h))
-            x = (SCREEN_WIDTH - w) // 2
-            y = (SCREEN_HEIGHT - h) // 2
-            self.screen.fill(COLOR_BLACK)
-            self.screen.blit(scaled, (x, y))
-        else:
-            self.screen.blit(self.render_surface, (0, 0))
+    def run_idle_tasks(self):
+        """Spend what is left of the frame on background tasks (see tasks.py)."""
+        spare = 1.0 / FPS - (time.perf_counter() - self.frame_start) - IDLE_MARGIN
+        self.idle_tasks.run(max(0.0, spare))
 
-        self.ui_manager.draw(self.screen)
-        pygame.display.flip()
+    def draw(self):
+        self.scene.draw(self.screen)
+
+    def draw_scene(self, surface, view):
+        for plat in self.platforms:
+            gfx.rect(surface, COLOR_GRAY, view.rect(plat.rect))
+
+        self.player.draw(surface, view)
+        self.boss.draw(surface, view)
+
+        draw_trails(surface, self.player_bullets, view, self.quality.trail_length)
+        self.player_bullets.draw(surface, view)
+        self.boss_bullets.draw(surface, view)
+
+        self.particle_manager.draw(surface, view)
+        self.effect_manager.draw(surface, view)
+
+        if self.reality_break_timer > 0:
+            color = REALITY_BREAK_TINTS.get(self.reality_break_type, (255, 0, 0, 50))
+            surface.blit(get_overlay(surface.get_size(), color), (0, 0))
+
+    def scene_surface(self, scale):
+        """Off-screen scene buffer for the given render scale."""
+        size = (int(SCREEN_WIDTH * scale), int(SCREEN_HEIGHT * scale))
+        if self.backend.textured:
+            return self.backend.scene_canvas(size)
+        if scale == 1.0:
+            return self.render_surface
+        if self.scene_small is None or self.scene_small.get_size() != size:
+            self.scene_small = pygame.Surface(size)
+        return self.scene_small
+
+    def snapshot(self, cosmetic=False):
+        """Fight state for rewind/rollback; take between frames (see snapshot.py)."""
+        return take_snapshot(self, cosmetic)
+
+    def restore(self, snapshot):
+        restore_snapshot(self, snapshot)
+
+    def get_state(self):
+        """Game's own part of a snapshot: fields, platforms, challenge and demo."""
+        return (self._get_fields(self), get_countdowns(self),
+                [tuple(p.rect) for p in self.platforms],
+                self.challenge.get_state() if self.challenge else None,
+                self.demo.get_state() if self.demo else None)
+
+    def set_state(self, state):
+        values, countdowns, platforms, challenge, demo = state
+        for name, value in zip(self.STATE_FIELDS, values):
+            setattr(self, name, value)
+        set_countdowns(self, countdowns)
+        if platforms != [tuple(p.rect) for p in self.platforms]:
+            # Vom Boss zerstörte Plattformen neu anlegen, Reihenfolge wie gespeichert
+            for p in self.platforms.sprites():
+                p.kill()
+            for rect in platforms:
+                p = Platform(*rect)
+                self.platforms.add(p)
+                self.all_sprites.add(p)
+        self.challenge = None if challenge is None else ChallengeMode.from_state(self, challenge)
+        self.demo = None if demo is None else DemoMode.from_state(self, demo)
 
     def handle_demo_ability(self, ability):
         if not ability.startswith("Boss:"):
@@ -434,16 +423,15 @@ class Game:
         elif ability == "Ultimate Laser":
             self.player.cards = 5
             bullet = EXSuper(self, self.player.rect.centerx, self.player.rect.centery, 1 if self.player.facing_right else -1)
-            self.all_sprites.add(bullet)
-            self.player_bullets.add(bullet)
-            self.effect_manager.apply_shake(1.0, 15)
+            self.entities.add(bullet)
+            self.events.shake(1.0, 15)
             self.effect_manager.apply_zoom(1.3, duration=0.5)
         elif ability == "Dash (normal)":
             self.player.dash()
         elif ability == "Super-Dash":
             self.player.cards = 1
             self.player.is_super_dash = True
-            self.player.sound_manager.play("super_dash")
+            self.events.sound("super_dash")
             self.player.is_dashing = True
             self.player.dash_timer = PLAYER_DASH_DURATION * 2
             self.player.dash_cooldown_timer = PLAYER_DASH_COOLDOWN
@@ -461,8 +449,8 @@ class Game:
             self.player.parry_counter_timer = 10.0
             self.player.parry_chain_timer = 10.0
             self.player.max_jumps = 3
-            self.effect_manager.add_damage_number(
-                self.player.rect.center, "STREBER MODE!", color=COLOR_GOLD, size=32)
+            self.events.damage_number(
+                self.player.rect.center, "STREBER MODE!", target=self.player, color=COLOR_GOLD, size=32)
         elif ability == "Notizbuch-Schild":
             self.player.activate_shield()
         elif ability == "Boss: Phase 1":
@@ -486,10 +474,22 @@ class Game:
 
     def run(self):
         while True:
-            self.handle_events()
+            timeout = self.idle_timeout()
+            if timeout is None:
+                self.handle_events()
+            else:
+                self.handle_events(self.wait_events(timeout))
             self.update()
             self.draw()
+            self.run_idle_tasks()
+
+    def run_async(self, *services):
+        """Like run(), on an asyncio loop shared with background services (see runner.py)."""
+        asyncio.run(AsyncRunner(self, services).run())
 
 if __name__ == "__main__":
     game = Game()
-    game.run()
+    if "--async" in sys.argv:
+        game.run_async(save_flusher)
+    else:
+        game.run()
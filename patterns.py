@@ -0,0 +1,110 @@
+import math
+import random
+from array import array
+from constants import SCREEN_WIDTH, COLOR_WHITE
+from boss_projectiles import BossProjectile, EquationProjectile
+
+# Boss-Angriffe als Daten. Jede Zeile: (x, y, vel_x, vel_y, parryable, delay).
+#   x, y     Position relativ zum Anker (Rect-Attribut des Bosses, None = Bildschirm)
+#   delay    Sekunden, die die Kugel später ankommt – wird beim Kompilieren in
+#            eine Startposition weiter hinten auf der Flugbahn umgerechnet
+# 'jitter' streut x zufällig um bis zu so viele Pixel nach rechts.
+# 'velocity': False für Klassen, die ihre Geschwindigkeit selbst setzen
+# (EquationProjectile fällt immer mit 180 px/s) – vel dient dann nur dem delay.
+
+
+def _ring(count, speed, angle_offset=0.0):
+    """Rows for ``count`` bullets flying outwards, every other one parryable."""
+    rows = []
+    for i in range(count):
+        rad = math.radians(i * (360 / count) + angle_offset)
+        rows.append((0, 0, math.cos(rad) * speed, math.sin(rad) * speed, i % 2 == 0, 0.0))
+    return rows
+
+
+PATTERNS = {
+    # Die früheren rect.x-Versätze wurden vom ersten update() (rect folgt pos)
+    # sofort überschrieben – die Kugeln starten daher alle am Anker.
+    'geometry_3': {
+        'cls': BossProjectile, 'anchor': 'midleft',
+        'rows': [(0, 0, -300, 0, False, 0.0), (0, 0, -300, 0, False, 0.0),
+                 (0, 0, -300, 0, True, 0.0)],
+    },
+    'geometry_5': {
+        'cls': BossProjectile, 'anchor': 'midleft',
+        'rows': [(0, 0, -300, (i - 2) * 60, i in (2, 4), 0.0) for i in range(5)],
+    },
+    'wipe': {
+        'cls': BossProjectile, 'anchor': None,
+        'kwargs': {'color': COLOR_WHITE, 'size': (40, 100)},
+        'rows': [(SCREEN_WIDTH + i * 40, i * 120, -180, 0, i == 2, 0.0) for i in range(5)],
+    },
+    'rain_mini': {
+        'cls': EquationProjectile, 'anchor': None, 'velocity': False,
+        'rows': [(200 + i * 300, -100, 0, 180, i == 1, 0.0) for i in range(3)],
+    },
+    'rain_full': {
+        'cls': EquationProjectile, 'anchor': None, 'velocity': False, 'jitter': 900,
+        'rows': [(50, 0, 0, 180, i in (3, 7), i * 200 / 180) for i in range(10)],
+    },
+    # 6 statt 8 pro Ring – reduziert die Dichte auf ein spielbares Maß
+    'compass_hell': {
+        'cls': BossProjectile, 'anchor': 'center',
+        'rows': _ring(6, 240) + _ring(6, 300, 15) + _ring(6, 360, 30),
+    },
+}
+
+
+class SpawnTable:
+    """A compiled pattern: one typed array per column.
+
+    Delays are already folded into the start positions, and the constant
+    part of every bullet (offset, velocity, keyword arguments) is packed
+    once into ``packed``; emitting a pattern only adds the anchor and
+    rolls the random parts.
+    """
+    __slots__ = ('cls', 'anchor', 'kwargs', 'velocity', 'x', 'y', 'vel_x', 'vel_y',
+                 'parryable', 'jitter', 'packed')
+
+    def __init__(self, spec):
+        self.cls = spec['cls']
+        self.anchor = spec.get('anchor')
+        self.kwargs = spec.get('kwargs', {})
+        self.velocity = spec.get('velocity', True)
+        rows = spec['rows']
+        self.x = array('i', [round(x - vx * delay) for x, y, vx, vy, p, delay in rows])
+        self.y = array('i', [round(y - vy * delay) for x, y, vx, vy, p, delay in rows])
+        self.vel_x = array('d', [row[2] for row in rows])
+        self.vel_y = array('d', [row[3] for row in rows])
+        self.parryable = array('b', [bool(row[4]) for row in rows])
+        self.jitter = spec.get('jitter', 0)
+        # (x, y, Geschwindigkeits-Argumente, kwargs) je Kugel – ändert sich nie mehr
+        vels = zip(self.vel_x, self.vel_y) if self.velocity else [()] * len(rows)
+        self.packed = tuple((x, y, tuple(vel), dict(self.kwargs, is_parryable=bool(p)))
+                            for x, y, vel, p in zip(self.x, self.y, vels, self.parryable))
+
+    def __len__(self):
+        return len(self.x)
+
+    def rows(self, game, origin=(0, 0)):
+        """(args, kwargs) per bullet, random parts already rolled (see BaseProjectile.roll)."""
+        ox, oy = origin
+        roll = self.cls.roll
+        jitter = self.jitter
+        if jitter:
+            randint = random.randint
+            out = []
+            for x, y, vel, kw in self.packed:
+                # Pro Kugel erst x, dann roll() – gleiche Zufallsreihenfolge wie früher
+                x += ox + randint(0, jitter)
+                kw = kw.copy()
+                roll(kw)
+                out.append(((game, x, oy + y) + vel, kw))
+            return out
+        out = [((game, ox + x, oy + y) + vel, kw.copy()) for x, y, vel, kw in self.packed]
+        for args, kw in out:
+            roll(kw)
+        return out
+
+
+SPAWN_TABLES = {name: SpawnTable(spec) for name, spec in PATTERNS.items()}
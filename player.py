@@ -2,11 +2,15 @@ import pygame
 import math
 import random
 import os
+from functools import partial
+from operator import attrgetter
+import gfx
 from constants import *
 from projectiles import PlayerProjectile, EXFlieger, EXEraser, EXRuler, EXSuper, SpreadProjectile, HomingProjectile
 from boss_projectiles import ProtractorSpin
-from utils import SoundManager, draw_text
+from utils import draw_text, load_image
 from effects import AfterimageParticle, SquareParticle, StarParticle
+from timers import Countdown, get_countdowns, set_countdowns
 
 # ---------------------------------------------------------------------------
 # Animation constants
@@ -77,6 +81,19 @@ _ANIM_OFFSETS: dict[tuple[str, int], tuple[int, int]] = {
     ('shoot', 4):  ( 7,  3),   # readyup    – ready-up / return to idle
 }
 
+# Eingefärbte Sprite-Varianten (I-Frames, Streber-Modus), einmal pro Frame und Farbe
+_tint_cache = {}
+
+
+def _tinted(sprite, color):
+    key = (sprite, color)
+    surf = _tint_cache.get(key)
+    if surf is None:
+        surf = sprite.copy()
+        surf.fill(color, special_flags=pygame.BLEND_RGBA_ADD)
+        surf = _tint_cache[key] = gfx.static(surf)
+    return surf
+
 
 class Player(pygame.sprite.Sprite):
     """Player character.
@@ -90,6 +107,34 @@ class Player(pygame.sprite.Sprite):
         _ANIM_OFFSETS so the visual figure stays anchored to the hitbox.
     """
 
+    # Countdowns laufen auf game.timers (Spielzeit) und kosten pro Frame nichts
+    dash_timer = Countdown(on_expire='_end_dash')
+    dash_cooldown_timer = Countdown()
+    perfect_dash_window = Countdown()
+    i_frames = Countdown()
+    parry_active_timer = Countdown(on_expire='_end_parry')
+    perfect_parry_window = Countdown()
+    parry_chain_timer = Countdown(on_expire='_end_parry_chain')
+    parry_counter_timer = Countdown(on_expire='_end_parry_counter')
+    shoot_timer = Countdown()
+    shield_cooldown = Countdown()
+    wall_cling_timer = Countdown()
+    momentum_grace_timer = Countdown()
+    squash_timer = Countdown(on_expire='_end_squash')
+
+    # Spielzustand für get_state(); Sprites, Spielreferenzen und Countdowns gehören nicht dazu
+    STATE_FIELDS = (
+        'width', 'height', 'color', 'rect', 'squash_factor', 'pos', 'vel', 'acc',
+        'hp', 'cards', 'max_cards', 'facing_right', 'is_grounded', 'on_wall', 'prev_on_wall',
+        'momentum_boost', 'jump_count', 'max_jumps', 'jump_timer', 'max_jump_time', 'jump_buffer',
+        'parry_boost_active', 'is_dashing', 'can_air_dash', 'dash_direction', 'is_super_dash',
+        'can_dash', 'parry_chain', 'streber_mode', 'charge_timer', 'is_charging', 'shield_active',
+        'selected_ex', 'focus_time', 'is_focusing', 'is_slam_down', 'drop_timer', 'ability_labels',
+        '_state', '_frame', '_frame_timer', '_shot_anim_timer', '_ground_grace', '_landing_timer',
+        '_bullet_queued',
+    )
+    _get_fields = attrgetter(*STATE_FIELDS)
+
     # ------------------------------------------------------------------
     # Initialisation
     # ------------------------------------------------------------------
@@ -97,7 +142,7 @@ class Player(pygame.sprite.Sprite):
     def __init__(self, game, x, y):
         super().__init__()
         self.game = game
-        self.sound_manager = SoundManager()
+        self.timers = game.timers
 
         # Hitbox – the only rect used for physics and collision.
         self.width = 40
@@ -188,6 +233,7 @@ class Player(pygame.sprite.Sprite):
         self._bullet_queued = None
 
         self._load_sprites()
+        self.game.pools.prewarm({PlayerProjectile: 12})
 
     # ------------------------------------------------------------------
     # Sprite loading
@@ -200,9 +246,9 @@ class Player(pygame.sprite.Sprite):
         def _load(rel_path: str):
             path = os.path.join(base, rel_path)
             try:
-                img = pygame.image.load(path).convert_alpha()
+                img = load_image(path)
                 w, h = img.get_size()
-                return pygame.transform.scale(img, (w * s, h * s))
+                return gfx.static(pygame.transform.scale(img, (w * s, h * s)))
             except Exception:
                 return None
 
@@ -329,16 +375,24 @@ class Player(pygame.sprite.Sprite):
         if self.game.state == "DEMO" and self.game.is_demo_bot:
             return
 
-        keys = pygame.key.get_pressed()
-        mouse = pygame.mouse.get_pressed()
+        inp = self.game.input
+        if inp.pressed('jump'):
+            if inp.held('down'):
+                # Duck + Parry (Ground or Air)
+                self.parry_active_timer = PLAYER_PARRY_WINDOW
+                self.perfect_parry_window = PLAYER_PERFECT_PARRY_WINDOW
+            else:
+                self.jump()
+        if inp.pressed('dash'):
+            self.dash()
 
-        move_left = keys[pygame.K_a]
-        move_right = keys[pygame.K_d]
+        move_left = inp.held('left')
+        move_right = inp.held('right')
         if self.game.inverted_controls:
             move_left, move_right = move_right, move_left
 
         # Focus Mode
-        if keys[pygame.K_f] and not self.is_dashing and self.focus_time > 0:
+        if inp.held('focus') and not self.is_dashing and self.focus_time > 0:
             self.is_focusing = True
             if self.game.effect_manager.slowmo_timer <= 0:
                 self.game.effect_manager.time_scale = 0.5
@@ -362,7 +416,7 @@ class Player(pygame.sprite.Sprite):
                 self.facing_right = True
 
             # Variable jump hold
-            if keys[pygame.K_SPACE]:
+            if inp.held('jump'):
                 if self.jump_timer > 0:
                     self.vel.y -= 1080 * dt
                     self.jump_timer -= dt
@@ -370,7 +424,7 @@ class Player(pygame.sprite.Sprite):
                 self.jump_timer = 0
 
         # Shooting
-        if mouse[0]:
+        if inp.held('shoot'):
             self.is_charging = True
             self.charge_timer += dt
         else:
@@ -385,19 +439,19 @@ class Player(pygame.sprite.Sprite):
                 self.is_charging = False
                 self.charge_timer = 0
 
-        if mouse[2]:
+        if inp.held('ex'):
             self.shoot_ex()
 
         # Shield
-        if keys[pygame.K_e] and self.shield_cooldown <= 0:
+        if inp.held('shield') and self.shield_cooldown <= 0:
             self.activate_shield()
 
         # EX switch
-        if keys[pygame.K_1]: self.selected_ex = "Flieger"
-        if keys[pygame.K_2]: self.selected_ex = "Eraser"
-        if keys[pygame.K_3]: self.selected_ex = "Ruler"
-        if keys[pygame.K_4]: self.selected_ex = "Spread"
-        if keys[pygame.K_5]: self.selected_ex = "Homing"
+        if inp.held('ex_flieger'): self.selected_ex = "Flieger"
+        if inp.held('ex_eraser'): self.selected_ex = "Eraser"
+        if inp.held('ex_ruler'): self.selected_ex = "Ruler"
+        if inp.held('ex_spread'): self.selected_ex = "Spread"
+        if inp.held('ex_homing'): self.selected_ex = "Homing"
 
     # ------------------------------------------------------------------
     # Jump / Dash
@@ -411,7 +465,7 @@ class Player(pygame.sprite.Sprite):
 
     def perform_jump(self):
         if self.on_wall:
-            self.sound_manager.play("jump")
+            self.game.events.sound("jump")
             self.vel.y = PLAYER_JUMP_FORCE
             self.vel.x = 600 if self.on_wall == 'left' else -600
             self.jump_count = 1
@@ -423,7 +477,7 @@ class Player(pygame.sprite.Sprite):
             return
 
         if self.jump_count < self.max_jumps or self.is_grounded:
-            self.sound_manager.play("jump")
+            self.game.events.sound("jump")
 
             force = PLAYER_JUMP_FORCE
             if self.parry_boost_active:
@@ -436,9 +490,9 @@ class Player(pygame.sprite.Sprite):
             self.vel.y = force
 
             if self.jump_count > 0 and not self.is_grounded:
-                keys = pygame.key.get_pressed()
-                if keys[pygame.K_a]: self.vel.x = -PLAYER_MAX_SPEED
-                if keys[pygame.K_d]: self.vel.x = PLAYER_MAX_SPEED
+                inp = self.game.input
+                if inp.held('left'): self.vel.x = -PLAYER_MAX_SPEED
+                if inp.held('right'): self.vel.x = PLAYER_MAX_SPEED
 
             self.jump_timer = self.max_jump_time
             self.jump_count += 1
@@ -451,7 +505,7 @@ class Player(pygame.sprite.Sprite):
             self.squash_factor = pygame.math.Vector2(0.8, 1.2)
             self.squash_timer = 0.166
             self.spawn_jump_particles()
-            self.game.effect_manager.apply_shake(0.1, 2, type='directional', vector=(0, 1))
+            self.game.events.shake(0.1, 2, type='directional', vector=(0, 1))
 
     def dash(self):
         if not self.can_dash:
@@ -459,15 +513,15 @@ class Player(pygame.sprite.Sprite):
 
         if self.dash_cooldown_timer <= 0:
             if self.is_grounded or self.can_air_dash:
-                keys = pygame.key.get_pressed()
-                cost = 1 if keys[pygame.K_LCTRL] else 0
+                inp = self.game.input
+                cost = 1 if inp.held('super') else 0
                 if cost == 1 and self.cards >= 1:
                     self.cards -= 1
                     self.is_super_dash = True
                 else:
                     self.is_super_dash = False
 
-                self.sound_manager.play("super_dash" if self.is_super_dash else "dash")
+                self.game.events.sound("super_dash" if self.is_super_dash else "dash")
                 self.is_dashing = True
                 self.dash_timer = PLAYER_DASH_DURATION * (2 if self.is_super_dash else 1)
                 self.dash_cooldown_timer = PLAYER_DASH_COOLDOWN
@@ -479,10 +533,10 @@ class Player(pygame.sprite.Sprite):
 
                 dir_x = 0
                 dir_y = 0
-                if keys[pygame.K_a]: dir_x = -1
-                elif keys[pygame.K_d]: dir_x = 1
-                if keys[pygame.K_w]: dir_y = -1
-                elif keys[pygame.K_s]: dir_y = 1
+                if inp.held('left'): dir_x = -1
+                elif inp.held('right'): dir_x = 1
+                if inp.held('up'): dir_y = -1
+                elif inp.held('down'): dir_y = 1
 
                 if dir_x == 0 and dir_y == 0:
                     dir_x = 1 if self.facing_right else -1
@@ -491,7 +545,7 @@ class Player(pygame.sprite.Sprite):
                     self.is_slam_down = True
                     self.vel.y = PLAYER_DASH_SPEED * 1.5
                     self.dash_timer = 0.33
-                    self.game.effect_manager.apply_shake(0.1, 5, type='directional', vector=(0, 1))
+                    self.game.events.shake(0.1, 5, type='directional', vector=(0, 1))
                     return
                 else:
                     self.is_slam_down = False
@@ -519,7 +573,7 @@ class Player(pygame.sprite.Sprite):
         if self.game.challenge and self.game.challenge.name == "Parry Only":
             return
         if self.shoot_timer <= 0:
-            self.sound_manager.play("shoot")
+            self.game.events.sound("shoot")
             damage = 1
             color = COLOR_BLUE
             is_gold = False
@@ -544,11 +598,11 @@ class Player(pygame.sprite.Sprite):
             self._shot_anim_timer = 0.40
 
             # Muzzle flash: tiny burst of particles + minimal screen nudge
-            self.game.effect_manager.apply_shake(0.05, 1.5)
+            self.game.events.shake(0.05, 1.5)
             gx = self.rect.centerx + (22 if self.facing_right else -22)
             gy = self.rect.centery - 4
             flash_color = COLOR_GOLD if is_gold else COLOR_LIGHT_BLUE
-            for _ in range(5):
+            for _ in range(self.game.quality.muzzle_flash):
                 self.game.particle_manager.add(
                     SquareParticle(
                         (gx, gy),
@@ -561,7 +615,7 @@ class Player(pygame.sprite.Sprite):
     def shoot_charge(self):
         if self.game.challenge and self.game.challenge.name == "Parry Only":
             return
-        self.sound_manager.play("charge_shot")
+        self.game.events.sound("charge_shot")
         self._bullet_queued = {
             "type": "charge",
             "vel_x": 900 if self.facing_right else -900,
@@ -575,37 +629,34 @@ class Player(pygame.sprite.Sprite):
             return
         if self.cards >= 2:
             self.cards -= 2
-            self.sound_manager.play("shoot_spread")
+            self.game.events.sound("shoot_spread")
             for i in range(-2, 3):
                 angle = i * 10
                 rad = math.radians(angle)
                 vel_x = (720 if self.facing_right else -720) * math.cos(rad)
                 vel_y = 720 * math.sin(rad)
                 bullet = SpreadProjectile(self.game, self.rect.centerx, self.rect.centery, vel_x, vel_y)
-                self.game.all_sprites.add(bullet)
-                self.game.player_bullets.add(bullet)
+                self.game.entities.add(bullet)
 
     def shoot_homing(self):
         if self.game.challenge and self.game.challenge.name == "Parry Only":
             return
         if self.cards >= 3:
             self.cards -= 3
-            self.sound_manager.play("shoot_homing")
+            self.game.events.sound("shoot_homing")
             for i in range(3):
                 bullet = HomingProjectile(self.game, self.rect.centerx, self.rect.centery - 20 + i * 20)
-                self.game.all_sprites.add(bullet)
-                self.game.player_bullets.add(bullet)
+                self.game.entities.add(bullet)
 
     def shoot_ex(self):
         if self.game.challenge and self.game.challenge.name == "Parry Only":
             return
         if self.cards >= 5:
-            self.sound_manager.play("ultimate")
+            self.game.events.sound("ultimate")
             self.cards -= 5
             bullet = EXSuper(self.game, self.rect.centerx, self.rect.centery, 1 if self.facing_right else -1)
-            self.game.all_sprites.add(bullet)
-            self.game.player_bullets.add(bullet)
-            self.game.effect_manager.apply_shake(1.0, 15)
+            self.game.entities.add(bullet)
+            self.game.events.shake(1.0, 15)
             self.game.effect_manager.apply_zoom(1.3, duration=0.5)
             return
 
@@ -631,13 +682,18 @@ class Player(pygame.sprite.Sprite):
                 bullet = EXRuler(self.game, self.rect.centerx, self.rect.centery, 1 if self.facing_right else -1)
 
             if bullet:
-                self.sound_manager.play("ex_attack")
-                self.game.all_sprites.add(bullet)
-                self.game.player_bullets.add(bullet)
-                self.game.effect_manager.apply_shake(0.16, 3)
+                self.game.events.sound("ex_attack")
+                self.game.entities.add(bullet)
+                self.game.events.shake(0.16, 3)
 
     def add_ability_label(self, text):
-        self.ability_labels.append({"text": text, "timer": 2.0})
+        label = {"text": text, "end": self.timers.now + 2.0}
+        self.ability_labels.append(label)
+        # partial statt lambda: snapshot.py speichert Timer-Callbacks als Methode plus Argumente
+        self.timers.schedule(2.0, partial(self._remove_ability_label, label))
+
+    def _remove_ability_label(self, label):
+        self.ability_labels.remove(label)
 
     # ------------------------------------------------------------------
     # Update
@@ -665,12 +721,11 @@ class Player(pygame.sprite.Sprite):
         # stop the player from drifting back onto the platform top after
         # microscopic float drift and the collision check would lose grip.
         if not self.is_dashing and not self.on_wall:
-            keys = pygame.key.get_pressed()
             g = PHYSICS_GRAVITY
             if self.game.inverted_gravity:
                 g = -PHYSICS_GRAVITY
             rising = self.vel.y > 0 if self.game.inverted_gravity else self.vel.y < 0
-            current_gravity = g * 0.5 if (keys[pygame.K_SPACE] and rising) else g
+            current_gravity = g * 0.5 if (self.game.input.held('jump') and rising) else g
             self.vel.y += current_gravity * dt
 
             # When grounded, clamp |vel.y| to a small bias so we maintain
@@ -704,56 +759,38 @@ class Player(pygame.sprite.Sprite):
         self.rect.midbottom = (int(self.pos.x), int(self.pos.y))
 
     def update_timers(self, dt):
-        if self.dash_timer > 0:
-            self.dash_timer -= dt
-            if self.dash_timer <= 0:
-                self.is_dashing = False
-            if self.is_super_dash and random.random() < 30 * dt:
-                self.game.particle_manager.add(
-                    StarParticle(self.rect.center,
-                                 (random.uniform(-120, 120), random.uniform(-120, 120)),
-                                 0.3, COLOR_BLUE, 8))
-
-        if self.dash_cooldown_timer > 0: self.dash_cooldown_timer -= dt
-        if self.perfect_dash_window > 0: self.perfect_dash_window -= dt
-        if self.i_frames > 0:            self.i_frames -= dt
-        if self.parry_active_timer > 0:
-            self.parry_active_timer -= dt
-            self.perfect_parry_window -= dt
-
-        if self.parry_chain_timer > 0:
-            self.parry_chain_timer -= dt
-            if self.parry_chain_timer <= 0:
-                self.parry_chain = 0
-                if self.parry_counter_timer <= 0:
-                    self.streber_mode = False
-
-        if self.parry_counter_timer > 0:
-            self.parry_counter_timer -= dt
-            if self.parry_counter_timer <= 0:
-                self.streber_mode = False
+        """Per-frame work while a timer runs; counting down is done by game.timers."""
+        if self.is_super_dash and self.dash_timer > 0 and random.random() < 30 * dt:
+            self.game.particle_manager.add(
+                StarParticle(self.rect.center,
+                             (random.uniform(-120, 120), random.uniform(-120, 120)),
+                             0.3, COLOR_BLUE, 8))
 
         if not self.is_dashing:
             self.is_slam_down = False
 
-        if self.shoot_timer > 0:       self.shoot_timer -= dt
-        if self.shield_cooldown > 0:   self.shield_cooldown -= dt
-        if self.wall_cling_timer > 0:  self.wall_cling_timer -= dt
-        if self.momentum_grace_timer > 0: self.momentum_grace_timer -= dt
-
         if self.squash_timer > 0:
-            self.squash_timer -= dt
-            if self.squash_timer <= 0:
-                self.squash_factor = pygame.math.Vector2(1.0, 1.0)
-            else:
-                self.squash_factor += (pygame.math.Vector2(1.0, 1.0) - self.squash_factor) * 12 * dt
-                self.squash_factor.x = max(0.1, self.squash_factor.x)
-                self.squash_factor.y = max(0.1, self.squash_factor.y)
+            self.squash_factor += (pygame.math.Vector2(1.0, 1.0) - self.squash_factor) * 12 * dt
+            self.squash_factor.x = max(0.1, self.squash_factor.x)
+            self.squash_factor.y = max(0.1, self.squash_factor.y)
+
+    def _end_dash(self):
+        self.is_dashing = False
 
-        for label in self.ability_labels[:]:
-            label["timer"] -= dt
-            if label["timer"] <= 0:
-                self.ability_labels.remove(label)
+    def _end_parry(self):
+        # Das Perfekt-Fenster gilt nur, solange die Parade aktiv ist
+        self.perfect_parry_window = 0
+
+    def _end_parry_chain(self):
+        self.parry_chain = 0
+        if self.parry_counter_timer <= 0:
+            self.streber_mode = False
+
+    def _end_parry_counter(self):
+        self.streber_mode = False
+
+    def _end_squash(self):
+        self.squash_factor = pygame.math.Vector2(1.0, 1.0)
 
     def update_animation(self, dt):
         if self._shot_anim_timer > 0:
@@ -778,19 +815,17 @@ class Player(pygame.sprite.Sprite):
             return
         data = self._bullet_queued
         if data["type"] == "basic":
-            bullet = PlayerProjectile(
-                self.game, self.rect.centerx, self.rect.centery,
+            bullet = self.game.pools.acquire(
+                PlayerProjectile, self.game, self.rect.centerx, self.rect.centery,
                 data["vel_x"], 0, data["damage"], data["color"])
             bullet.is_golden = data["is_gold"]
-            self.game.all_sprites.add(bullet)
-            self.game.player_bullets.add(bullet)
+            self.game.entities.add(bullet)
         elif data["type"] == "charge":
-            bullet = PlayerProjectile(
-                self.game, self.rect.centerx, self.rect.centery,
+            bullet = self.game.pools.acquire(
+                PlayerProjectile, self.game, self.rect.centerx, self.rect.centery,
                 data["vel_x"], 0,
                 data["damage"], data["color"], size=(30, 30))
-            self.game.all_sprites.add(bullet)
-            self.game.player_bullets.add(bullet)
+            self.game.entities.add(bullet)
         self._bullet_queued = None
 
     # ------------------------------------------------------------------
@@ -823,7 +858,7 @@ class Player(pygame.sprite.Sprite):
             if self.pos.y <= 0:
                 if not was_grounded:
                     self.spawn_jump_particles()
-                    self.sound_manager.play("land")
+                    self.game.events.sound("land")
                     self.squash_factor = pygame.math.Vector2(1.2, 0.8)
                     self.squash_timer = 0.166
                     self._landing_timer = 0.10
@@ -839,7 +874,7 @@ class Player(pygame.sprite.Sprite):
             if self.pos.y >= SCREEN_HEIGHT:
                 if not was_grounded:
                     self.spawn_jump_particles()
-                    self.sound_manager.play("land")
+                    self.game.events.sound("land")
                     self.squash_factor = pygame.math.Vector2(1.2, 0.8)
                     self.squash_timer = 0.166
                     self._landing_timer = 0.10
@@ -867,7 +902,7 @@ class Player(pygame.sprite.Sprite):
                     self.vel.y = 0
                     if not was_grounded:
                         self.spawn_jump_particles()
-                        self.sound_manager.play("land")
+                        self.game.events.sound("land")
                         self.squash_factor = pygame.math.Vector2(1.2, 0.8)
                         self.squash_timer = 0.166
                         self._landing_timer = 0.10
@@ -888,7 +923,7 @@ class Player(pygame.sprite.Sprite):
                     self.vel.y = 0
                     if not was_grounded:
                         self.spawn_jump_particles()
-                        self.sound_manager.play("land")
+                        self.game.events.sound("land")
                         self.squash_factor = pygame.math.Vector2(1.2, 0.8)
                         self.squash_timer = 0.166
                         self._landing_timer = 0.10
@@ -901,7 +936,7 @@ class Player(pygame.sprite.Sprite):
                     self.rect.bottom = int(self.pos.y)
                     break
 
-        hits = pygame.sprite.spritecollide(self, self.game.boss_bullets, False)
+        hits = self.game.boss_bullets.collide(self.rect)
         for projectile in hits:
             if isinstance(projectile, ProtractorSpin):
                 continue
@@ -909,7 +944,7 @@ class Player(pygame.sprite.Sprite):
                 if self.perfect_dash_window > 0:
                     self.game.style_points += 5
                     self.cards = min(self.cards + 0.5, PLAYER_MAX_CARDS)
-                    self.game.effect_manager.add_damage_number(self.rect.center, "PERFECT DASH", color=COLOR_CYAN, size=16)
+                    self.game.events.damage_number(self.rect.center, "PERFECT DASH", target=self, color=COLOR_CYAN, size=16)
                     self.game.effect_manager.apply_slowmo(0.16, 0.8)
                     self.game.particle_manager.spawn_hit(projectile.rect.center, color=COLOR_CYAN)
                 projectile.kill()
@@ -920,7 +955,7 @@ class Player(pygame.sprite.Sprite):
             elif self.shield_active:
                 self.shield_active = False
                 projectile.kill()
-                self.game.effect_manager.add_damage_number(self.rect.center, "BLOCKED", color=COLOR_CYAN, size=16)
+                self.game.events.damage_number(self.rect.center, "BLOCKED", target=self, color=COLOR_CYAN, size=16)
             elif self.i_frames <= 0:
                 self.take_damage()
                 projectile.kill()
@@ -929,8 +964,8 @@ class Player(pygame.sprite.Sprite):
         if projectile is None:
             return
         if not getattr(projectile, 'is_parryable', False):
-            self.sound_manager.play("parry_fail")
-            self.game.effect_manager.add_damage_number(self.rect.center, "KEIN PARRY!", color=COLOR_ORANGE, size=18)
+            self.game.events.sound("parry_fail")
+            self.game.events.damage_number(self.rect.center, "KEIN PARRY!", target=self, color=COLOR_ORANGE, size=18)
             self.take_damage()
             projectile.kill()
             return
@@ -940,7 +975,7 @@ class Player(pygame.sprite.Sprite):
 
         projectile.kill()
         is_perfect = self.perfect_parry_window > 0
-        self.sound_manager.play("perfect_parry" if is_perfect else "parry")
+        self.game.events.sound("perfect_parry" if is_perfect else "parry")
         self.game.particle_manager.spawn_parry(self.rect.center, perfect=is_perfect)
 
         if is_perfect:
@@ -970,12 +1005,12 @@ class Player(pygame.sprite.Sprite):
             self.streber_mode = True
             self.parry_chain_timer = PLAYER_STREBER_DURATION
             self.parry_counter_timer = PLAYER_STREBER_DURATION
-            self.game.effect_manager.add_damage_number(self.rect.center, "STREBER MODE!", color=COLOR_GOLD, size=32)
+            self.game.events.damage_number(self.rect.center, "STREBER MODE!", target=self, color=COLOR_GOLD, size=32)
 
     def take_damage(self):
         if self.i_frames > 0:
             return
-        self.sound_manager.play("hit")
+        self.game.events.sound("hit")
         self.hp -= 1
 
         if self.game.challenge and self.game.challenge.name == "One Hit KO":
@@ -984,7 +1019,7 @@ class Player(pygame.sprite.Sprite):
         else:
             self.i_frames = PLAYER_IFRAMES_DURATION
 
-        self.game.effect_manager.apply_shake(0.33, 10)
+        self.game.events.shake(0.33, 10)
         self.game.particle_manager.spawn_hit(self.rect.center, color=COLOR_RED)
         self.momentum_boost = 1.0
         self.streber_mode = False
@@ -998,82 +1033,111 @@ class Player(pygame.sprite.Sprite):
     def spawn_jump_particles(self):
         self.game.particle_manager.spawn_dust((self.rect.centerx, self.rect.bottom))
 
+    # ------------------------------------------------------------------
+    # Snapshot (snapshot.py)
+    # ------------------------------------------------------------------
+
+    def get_state(self):
+        """Gameplay state as plain values; timers are restored first (TimerScheduler.set_state)."""
+        return self._get_fields(self), get_countdowns(self), self.alive()
+
+    def set_state(self, state):
+        values, countdowns, alive = state
+        for name, value in zip(self.STATE_FIELDS, values):
+            setattr(self, name, value)
+        set_countdowns(self, countdowns)
+        if alive and not self.alive():
+            self.game.all_sprites.add(self)
+        elif not alive:
+            self.kill()
+
+    def afterimage_image(self, source):
+        """Surface of a dash afterimage, rebuilt from its ``source`` (see AfterimageParticle)."""
+        state, frame, tint, size, flip = source
+        if state is None:
+            # Ersatz-Rechteck ohne Sprites, tint ist die Farbe
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            surf.fill(tint)
+            return surf
+        sprite = self._sprites[state][frame]
+        if tint is not None:
+            sprite = _tinted(sprite, tint)
+        return pygame.transform.flip(pygame.transform.scale(sprite, size), flip, False)
+
     # ------------------------------------------------------------------
     # Draw
     # ------------------------------------------------------------------
 
-    def draw(self, screen, camera_offset):
+    def draw(self, screen, view):
+        s = view.scale
         # Ability labels
         for label in self.ability_labels:
-            t = label["timer"]
+            t = label["end"] - self.timers.now
             alpha = 255
             if t > 1.66:
                 alpha = int((2.0 - t) / 0.33 * 255)
             elif t < 0.33:
                 alpha = int(t / 0.33 * 255)
-            draw_text(screen, label["text"], 36,
-                      self.rect.centerx - camera_offset.x,
-                      self.rect.top - 80 - camera_offset.y,
+            draw_text(screen, label["text"], view.size(36),
+                      *view.point(self.rect.centerx, self.rect.top - 80),
                       color=COLOR_GOLD, alpha=alpha)
 
         # Hitbox anchor in screen space
-        hb_cx = self.rect.centerx - int(camera_offset.x)
-        hb_by = self.rect.bottom  - int(camera_offset.y)
+        hb_cx, hb_by = view.point(self.rect.centerx, self.rect.bottom)
 
         # Pick sprite for the current state / frame
-        frame_list = self._sprites.get(self._state, self._sprites['idle'])
+        sprite_state = self._state if self._state in self._sprites else 'idle'
+        frame_list = self._sprites[sprite_state]
         frame_idx  = min(self._frame, len(frame_list) - 1)
         sprite     = frame_list[frame_idx]
 
         if sprite:
             sw, sh = sprite.get_size()
             # Squash-and-stretch
-            w = max(1, int(sw * self.squash_factor.x))
-            h = max(1, int(sh * self.squash_factor.y))
-            scaled = pygame.transform.scale(sprite, (w, h))
+            w = max(1, int(sw * self.squash_factor.x * s))
+            h = max(1, int(sh * self.squash_factor.y * s))
 
             # Mirror for left-facing direction.
             # Run-Sprites sind bereits richtungsspezifisch (run_r=rechts,
             # run_l=links) und dürfen NICHT geflippt werden.
             is_directional_run = self._state in ('run_r', 'run_l')
-            if not self.facing_right and not is_directional_run:
-                scaled = pygame.transform.flip(scaled, True, False)
+            flip = not self.facing_right and not is_directional_run
 
             # Tint overlays
             iframes_flash = self.i_frames > 0 and (int(self.i_frames * 6) % 2 == 0)
+            tint = None
             if iframes_flash:
-                tint = pygame.Surface(scaled.get_size(), pygame.SRCALPHA)
-                tint.fill((255, 255, 255, 200))
-                scaled = scaled.copy()
-                scaled.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+                tint = (255, 255, 255, 200)
             elif self.streber_mode or self.parry_counter_timer > 0:
-                tint = pygame.Surface(scaled.get_size(), pygame.SRCALPHA)
-                tint.fill((80, 60, 0, 110))
-                scaled = scaled.copy()
-                scaled.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+                tint = (80, 60, 0, 110)
+            if tint is not None:
+                sprite = _tinted(sprite, tint)
 
             # Apply offset so visual feet land exactly on hitbox.bottom / centerx.
             # ox/oy are in scaled screen pixels; ox sign depends on facing direction.
             ox, oy = self._get_draw_offset()
-            draw_rect = scaled.get_rect()
-            draw_rect.midbottom = (hb_cx + ox, hb_by + oy)
-            screen.blit(scaled, draw_rect)
+            draw_rect = pygame.Rect(0, 0, w, h)
+            draw_rect.midbottom = (hb_cx + int(ox * s), hb_by + int(oy * s))
+            gfx.blit_scaled(screen, sprite, draw_rect, flip_x=flip)
 
             # Dash afterimage
-            if self.is_dashing and (int(self.dash_timer * 60) % 3 == 0):
+            stride = self.game.quality.afterimage_stride
+            if self.is_dashing and stride and (int(self.dash_timer * 60) % stride == 0):
+                source = (sprite_state, frame_idx, tint, (w, h), flip)
                 self.game.particle_manager.add(
-                    AfterimageParticle(pygame.math.Vector2(draw_rect.topleft), scaled, 0.25, 150))
+                    AfterimageParticle(view.world(draw_rect.topleft), self.afterimage_image(source),
+                                       0.25, 150, source))
 
             # Charge bar
             if self.is_charging:
                 pct = min(1.0, self.charge_timer / PLAYER_CHARGE_DURATION)
-                bar_x = hb_cx - self.width // 2
-                pygame.draw.rect(screen, COLOR_WHITE,
-                                 (bar_x, draw_rect.top - 8, int(self.width * pct), 5))
+                bar_x = hb_cx - int(self.width * s) // 2
+                gfx.rect(screen, COLOR_WHITE,
+                         (bar_x, draw_rect.top - 8 * s, int(self.width * s * pct), view.size(5)))
         else:
             # Fallback procedural rectangle when sprites are missing
-            w = self.width  * self.squash_factor.x
-            h = self.height * self.squash_factor.y
+            w = self.width  * self.squash_factor.x * s
+            h = self.height * self.squash_factor.y * s
             color = self.color
             if self.streber_mode or self.parry_counter_timer > 0:
                 color = COLOR_GOLD
@@ -1081,22 +1145,23 @@ class Player(pygame.sprite.Sprite):
                 color = COLOR_WHITE
             fb_rect = pygame.Rect(0, 0, w, h)
             fb_rect.midbottom = (hb_cx, hb_by)
-            pygame.draw.rect(screen, color, fb_rect)
-            eye_offset = 10 if self.facing_right else -10
-            pygame.draw.circle(screen, COLOR_WHITE,
-                                (fb_rect.centerx + eye_offset, fb_rect.top + 15), 5)
-            if self.is_dashing and (int(self.dash_timer * 60) % 3 == 0):
-                surf = pygame.Surface((w, h), pygame.SRCALPHA)
-                pygame.draw.rect(surf, color, (0, 0, w, h))
+            gfx.rect(screen, color, fb_rect)
+            eye_offset = (10 if self.facing_right else -10) * s
+            gfx.circle(screen, COLOR_WHITE,
+                       (fb_rect.centerx + eye_offset, fb_rect.top + 15 * s), 5 * s)
+            stride = self.game.quality.afterimage_stride
+            if self.is_dashing and stride and (int(self.dash_timer * 60) % stride == 0):
+                source = (None, 0, color, (int(w), int(h)), False)
                 self.game.particle_manager.add(
-                    AfterimageParticle(pygame.math.Vector2(fb_rect.topleft), surf, 0.25, 150))
+                    AfterimageParticle(view.world(fb_rect.topleft), self.afterimage_image(source),
+                                       0.25, 150, source))
             if self.is_charging:
                 pct = min(1.0, self.charge_timer / PLAYER_CHARGE_DURATION)
-                pygame.draw.rect(screen, COLOR_WHITE,
-                                 (fb_rect.left, fb_rect.top - 10, w * pct, 5))
+                gfx.rect(screen, COLOR_WHITE,
+                         (fb_rect.left, fb_rect.top - 10 * s, w * pct, view.size(5)))
 
         # Shield ring
         if self.shield_active:
             cx = hb_cx
-            cy = hb_by - self.height // 2
-            pygame.draw.circle(screen, COLOR_CYAN, (cx, cy), 50, 2)
+            cy = hb_by - int(self.height * s) // 2
+            gfx.circle(screen, COLOR_CYAN, (cx, cy), 50 * s, view.size(2))
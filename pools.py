@@ -0,0 +1,120 @@
+PREWARM_STEP = 12  # neue Instanzen pro Schritt von ProjectilePools.prewarm_steps
+
+
+class ObjectPool:
+    """Free-list of recycled instances of a single projectile class.
+
+    Pooled classes must accept a bare constructor call (``cls()``) for
+    pre-warming and provide ``reset(*args)`` with the same signature as their
+    normal constructor, so a recycled instance can be re-initialised in place.
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        self._free = []
+        self.in_use = 0
+        self.high_water = 0
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args, **kwargs):
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            obj = self.cls(*args, **kwargs)
+            self.created += 1
+        return self._hand_out(obj)
+
+    def reclaim(self):
+        """Like acquire(), but without reset(): the caller sets the state (set_state).
+
+        Used by snapshot restore, so restored projectiles come out of the
+        free list instead of growing it.
+        """
+        if self._free:
+            obj = self._free.pop()
+            self.reused += 1
+        else:
+            obj = self.cls()
+            self.created += 1
+        return self._hand_out(obj)
+
+    def _hand_out(self, obj):
+        obj.pool = self
+        obj.in_pool = False
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+
+    def release(self, obj):
+        """Return ``obj`` to the free list.
+
+        Only called from EntityList.flush()/clear() at the end of the frame,
+        so a projectile killed mid-frame is never handed out again while
+        other code still holds a reference to it.
+        """
+        if obj.in_pool:
+            return
+        obj.in_pool = True
+        self.in_use -= 1
+        self._free.append(obj)
+
+    def prewarm(self, count, limit=None):
+        """Top the free list up so that ``count`` instances are available.
+
+        Creates at most ``limit`` instances; returns True once the pool is full.
+        """
+        count = max(count, self.high_water)
+        while len(self._free) + self.in_use < count:
+            if limit is not None:
+                if limit <= 0:
+                    return False
+                limit -= 1
+            obj = self.cls()
+            obj.pool = self
+            obj.in_pool = True
+            self._free.append(obj)
+            self.created += 1
+        return True
+
+    def stats(self):
+        return {
+            'free': len(self._free),
+            'in_use': self.in_use,
+            'high_water': self.high_water,
+            'created': self.created,
+            'reused': self.reused,
+        }
+
+
+class ProjectilePools:
+    """One ObjectPool per projectile class, created on first use."""
+
+    def __init__(self):
+        self._pools = {}
+
+    def get(self, cls):
+        pool = self._pools.get(cls)
+        if pool is None:
+            pool = self._pools[cls] = ObjectPool(cls)
+        return pool
+
+    def acquire(self, cls, *args, **kwargs):
+        return self.get(cls).acquire(*args, **kwargs)
+
+    def prewarm(self, counts):
+        for cls, count in counts.items():
+            self.get(cls).prewarm(count)
+
+    def prewarm_steps(self, counts):
+        """prewarm() as a generator for idle tasks: at most PREWARM_STEP new instances per step."""
+        for cls, count in counts.items():
+            pool = self.get(cls)
+            while not pool.prewarm(count, PREWARM_STEP):
+                yield
+
+    def stats(self):
+        return {cls.__name__: pool.stats() for cls, pool in self._pools.items()}
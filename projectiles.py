@@ -2,7 +2,12 @@ import pygame
 import math
 import random
 import os
+from collections import deque
+from operator import attrgetter
+import gfx
 from constants import *
+from effects import sprite_bank
+from utils import get_overlay, load_image
 
 _icon_cache = {}
 
@@ -11,22 +16,76 @@ def _get_icon(filename, size):
     if key not in _icon_cache:
         path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sprites', 'icons', filename)
         try:
-            _icon_cache[key] = pygame.transform.scale(
-                pygame.image.load(path).convert_alpha(), size)
+            _icon_cache[key] = gfx.static(pygame.transform.scale(load_image(path), size))
         except Exception:
             _icon_cache[key] = None
     return _icon_cache[key]
 
-class BaseProjectile(pygame.sprite.Sprite):
-    def __init__(self, game, x, y, vel_x, vel_y, damage, color=COLOR_BLUE, size=(10, 10)):
-        super().__init__()
+_trail_dot_cache = []
+
+def _trail_dots():
+    # 2px-Punkte der Spur, vom ältesten (blass) zum neuesten (voll)
+    if not _trail_dot_cache:
+        length = PlayerProjectile.TRAIL_LENGTH
+        for i in range(length):
+            level = sprite_bank.alpha_level(255 * (i + 1) / length)
+            _trail_dot_cache.append(sprite_bank.rect(COLOR_WHITE, 2, 2, level))
+    return _trail_dot_cache
+
+def draw_trails(screen, bullets, view, length=None):
+    """Draw the trails of all player bullets in one blits call.
+
+    ``length`` limits each trail to its newest dots (quality setting).
+    """
+    if length == 0:
+        return
+    batch = []
+    for bullet in bullets:
+        bullet.trail_blits(batch, view, length)
+    if batch:
+        screen.blits(batch, doreturn=False)
+
+class BaseProjectile:
+    """Base class for all projectiles.
+
+    Subclasses put their set-up into reset() instead of __init__, so that
+    pools.ObjectPool can re-initialise a killed instance in place rather than
+    constructing a new one. Called without arguments the instance stays
+    blank (used for pre-warming pools). Projectiles are plain slotted objects
+    living in an entities.EntityList (see Game.entities), not sprite groups.
+    """
+
+    __slots__ = ('game', 'width', 'height', 'color', 'rect', 'pos', 'vel',
+                 'damage', 'angle', 'pool', 'in_pool',
+                 'entity_list', 'entity_index', 'killed', 'sleep', 'pending_dt')
+
+    # Which EntityRegistry list the projectile is added to
+    entity_kind = 'player_bullets'
+    # update() is linear in dt, may be batched while far off-screen (see EntityList)
+    deferrable = False
+
+    def __init__(self, *args, **kwargs):
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.pos = pygame.math.Vector2()
+        self.vel = pygame.math.Vector2()
+        self.pool = None
+        self.in_pool = False
+        self.entity_list = None
+        self.entity_index = -1
+        self.killed = False
+        self.sleep = 0.0
+        self.pending_dt = 0.0
+        if args or kwargs:
+            self.reset(*args, **kwargs)
+
+    def reset(self, game, x, y, vel_x, vel_y, damage, color=COLOR_BLUE, size=(10, 10)):
         self.game = game
         self.width, self.height = size
         self.color = color
-        self.rect = pygame.Rect(0, 0, self.width, self.height)
+        self.rect.size = size
         self.rect.center = (x, y)
-        self.pos = pygame.math.Vector2(x, y)
-        self.vel = pygame.math.Vector2(vel_x, vel_y)
+        self.pos.update(x, y)
+        self.vel.update(vel_x, vel_y)
         self.damage = damage
         self.angle = 0
 
@@ -45,47 +104,139 @@ class BaseProjectile(pygame.sprite.Sprite):
     def check_collision(self, target):
         return self.rect.colliderect(target.rect)
 
-    def draw(self, screen, camera_offset):
-        draw_rect = self.rect.copy()
-        draw_rect.x -= camera_offset.x
-        draw_rect.y -= camera_offset.y
-        pygame.draw.rect(screen, self.color, draw_rect)
+    def on_screen(self, visible):
+        return visible.colliderect(self.rect)
+
+    @classmethod
+    def roll(cls, kwargs):
+        """Draw the random parts of reset() into ``kwargs`` right away.
+
+        Used by patterns.SpawnTable.rows(), which builds the arguments of a
+        whole burst up front, so the random stream is consumed in the same
+        order as with one spawn per bullet.
+        """
+
+    def draw(self, screen, view):
+        gfx.rect(screen, self.color, view.rect(self.rect))
+
+    # Nicht in get_state(): Spiel, Pool und Listenplatz setzt snapshot.py beim Restore,
+    # rect und Vektoren speichert get_state() selbst als Zahlen
+    STATE_SKIP = frozenset(('game', 'pool', 'in_pool', 'entity_list', 'entity_index', 'killed',
+                            'rect', 'pos', 'vel'))
+
+    def get_state(self):
+        """Plain-value state for snapshot.py, without links to the game, pool or list."""
+        rect, pos, vel = self.rect, self.pos, self.vel
+        return ((rect.x, rect.y, rect.w, rect.h), pos.x, pos.y, vel.x, vel.y,
+                _state_fields(self.__class__)[1](self))
+
+    def set_state(self, game, state):
+        """Inverse of get_state() on a blank or recycled instance already added to its list."""
+        rect, px, py, vx, vy, values = state
+        self.game = game
+        self.rect.update(rect)
+        self.pos.update(px, py)
+        self.vel.update(vx, vy)
+        for name, value in zip(_state_fields(self.__class__)[0], values):
+            setattr(self, name, value)
+
+    def kill(self):
+        # Removal (and the return to the pool) happens in EntityList.flush()
+        if self.entity_list is not None:
+            self.entity_list.kill(self)
+        else:
+            self.killed = True
+
+    def alive(self):
+        return self.entity_list is not None and not self.killed
+
+_state_getters = {}  # Klasse -> (Slot-Namen für get_state, attrgetter)
+
+
+def _state_fields(cls):
+    fields = _state_getters.get(cls)
+    if fields is None:
+        names = []
+        for klass in reversed(cls.__mro__):
+            for name in klass.__dict__.get('__slots__', ()):
+                if name not in names and name not in cls.STATE_SKIP:
+                    names.append(name)
+        fields = _state_getters[cls] = (tuple(names), attrgetter(*names))
+    return fields
+
 
 class PlayerProjectile(BaseProjectile):
-    def __init__(self, game, x, y, vel_x, vel_y, damage, color=COLOR_BLUE, size=(10, 10), is_ex=False):
-        super().__init__(game, x, y, vel_x, vel_y, damage, color, size)
+    __slots__ = ('is_ex', 'is_golden', 'trail_timer', 'angle_rot', 'trail')
+
+    # Spur: Ringpuffer der letzten Positionen statt eigener Partikel
+    TRAIL_INTERVAL = 0.033  # ~2 frames at 60fps
+    TRAIL_LENGTH = 5
+
+    def __init__(self, *args, **kwargs):
+        self.trail = deque(maxlen=self.TRAIL_LENGTH)
+        super().__init__(*args, **kwargs)
+
+    def reset(self, game, x, y, vel_x, vel_y, damage, color=COLOR_BLUE, size=(10, 10), is_ex=False):
+        super().reset(game, x, y, vel_x, vel_y, damage, color, size)
         self.is_ex = is_ex
+        self.is_golden = False
         self.trail_timer = 0
         self.angle_rot = 0
+        self.trail.clear()
 
     def update(self, dt):
         super().update(dt)
         self.angle_rot += 600 * dt # 10 degrees per frame at 60fps
         self.trail_timer += dt
-        if self.trail_timer > 0.033: # ~2 frames at 60fps
+        if self.trail_timer > self.TRAIL_INTERVAL:
             self.trail_timer = 0
-            self.game.particle_manager.spawn_trail(self.rect.center, COLOR_WHITE, 2)
-
-    def draw(self, screen, camera_offset):
-        surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        pygame.draw.rect(surf, self.color, (0, 0, self.width, self.height))
-        
-        rotated_surf = pygame.transform.rotate(surf, self.angle_rot)
-        new_rect = rotated_surf.get_rect(center=(self.rect.centerx - camera_offset.x, self.rect.centery - camera_offset.y))
-        screen.blit(rotated_surf, new_rect)
+            self.trail.append(self.rect.center)
+
+    STATE_SKIP = BaseProjectile.STATE_SKIP | {'trail'}
+
+    def get_state(self):
+        return super().get_state(), tuple(self.trail)
+
+    def set_state(self, game, state):
+        state, trail = state
+        super().set_state(game, state)
+        self.trail.clear()
+        self.trail.extend(trail)
+
+    def trail_blits(self, batch, view, length=None):
+        """Append the trail strip (oldest dot faintest) to a blits batch."""
+        trail = self.trail
+        if not trail:
+            return
+        ox, oy = view
+        s = view.scale
+        dots = _trail_dots()
+        skip = len(trail) - length if length is not None and length < len(trail) else 0
+        first = len(dots) - len(trail)
+        for i, (x, y) in enumerate(trail):
+            if i >= skip:
+                batch.append((dots[first + i], ((x - ox) * s - 1, (y - oy) * s - 1)))
+
+    def draw(self, screen, view):
+        surf = get_overlay((view.size(self.width), view.size(self.height)), self.color, pygame.SRCALPHA)
+        gfx.blit_rotated(screen, surf, view.point(*self.rect.center), self.angle_rot)
 
     def kill(self):
         self.game.particle_manager.spawn_dust(self.rect.center, count=5)
         super().kill()
 
 class SpreadProjectile(PlayerProjectile):
-    def __init__(self, game, x, y, vel_x, vel_y):
-        super().__init__(game, x, y, vel_x, vel_y, 1, COLOR_CYAN, (8, 8))
+    __slots__ = ()
+
+    def reset(self, game, x, y, vel_x, vel_y):
+        super().reset(game, x, y, vel_x, vel_y, 1, COLOR_CYAN, (8, 8))
 
 class HomingProjectile(PlayerProjectile):
-    def __init__(self, game, x, y):
+    __slots__ = ('is_homing', 'lifetime')
+
+    def reset(self, game, x, y):
         direction = 1 if game.player.facing_right else -1
-        super().__init__(game, x, y, 600 * direction, 0, 2, COLOR_GREEN, (10, 10))
+        super().reset(game, x, y, 600 * direction, 0, 2, COLOR_GREEN, (10, 10))
         self.is_homing = True
         self.lifetime = 2.0
 
@@ -108,8 +259,10 @@ class HomingProjectile(PlayerProjectile):
             self.kill()
 
 class EXFlieger(PlayerProjectile):
-    def __init__(self, game, x, y, direction):
-        super().__init__(game, x, y, direction * 720, 0, 5, COLOR_BLUE, (40, 20), is_ex=True)
+    __slots__ = ('flight_time',)
+
+    def reset(self, game, x, y, direction):
+        super().reset(game, x, y, direction * 720, 0, 5, COLOR_BLUE, (40, 20), is_ex=True)
         self.flight_time = 0
 
     def update(self, dt):
@@ -118,43 +271,41 @@ class EXFlieger(PlayerProjectile):
         
         super().update(dt)
         # Check if hitting parryable projectiles
-        hits = pygame.sprite.spritecollide(self, self.game.boss_bullets, False)
+        hits = self.game.boss_bullets.collide(self.rect)
         for bullet in hits:
             if hasattr(bullet, 'is_parryable') and bullet.is_parryable:
                 bullet.kill()
                 self.game.player.cards = min(self.game.player.cards + 0.1, PLAYER_MAX_CARDS)
 
-    def draw(self, screen, camera_offset):
-        center = (self.rect.centerx - camera_offset.x, self.rect.centery - camera_offset.y)
-        icon = _get_icon('Stift 1.png', (40, 40))
+    def draw(self, screen, view):
+        center = view.point(*self.rect.center)
+        s = view.scale
+        icon = _get_icon('Stift 1.png', (view.size(40), view.size(40)))
         if icon:
             angle = -math.degrees(math.atan2(self.vel.y, self.vel.x))
-            rotated = pygame.transform.rotate(icon, angle)
-            screen.blit(rotated, rotated.get_rect(center=center))
+            gfx.blit_rotated(screen, icon, center, angle)
         else:
             angle_rad = math.atan2(self.vel.y, self.vel.x)
             cos_a, sin_a = math.cos(angle_rad), math.sin(angle_rad)
-            tip   = (center[0] + cos_a * 20,           center[1] + sin_a * 20)
-            back  = (center[0] - cos_a * 20,           center[1] - sin_a * 20)
-            wing1 = (back[0]  - sin_a * 10,            back[1]  + cos_a * 10)
-            wing2 = (back[0]  + sin_a * 10,            back[1]  - cos_a * 10)
-            pygame.draw.polygon(screen, self.color, [tip, wing1, wing2])
+            tip   = (center[0] + cos_a * 20 * s,       center[1] + sin_a * 20 * s)
+            back  = (center[0] - cos_a * 20 * s,       center[1] - sin_a * 20 * s)
+            wing1 = (back[0]  - sin_a * 10 * s,        back[1]  + cos_a * 10 * s)
+            wing2 = (back[0]  + sin_a * 10 * s,        back[1]  - cos_a * 10 * s)
+            gfx.polygon(screen, self.color, [tip, wing1, wing2])
 
 class EXEraser(PlayerProjectile):
-    def __init__(self, game, x, y, direction):
-        super().__init__(game, x, y, direction * 300, 0, 3, COLOR_PURPLE, (30, 30), is_ex=True)
+    __slots__ = ()
+
+    def reset(self, game, x, y, direction):
+        super().reset(game, x, y, direction * 300, 0, 3, COLOR_PURPLE, (30, 30), is_ex=True)
 
-    def draw(self, screen, camera_offset):
-        center = (self.rect.centerx - camera_offset.x, self.rect.centery - camera_offset.y)
-        icon = _get_icon('Rauchverbot.png', (30, 30))
+    def draw(self, screen, view):
+        center = view.point(*self.rect.center)
+        icon = _get_icon('Rauchverbot.png', (view.size(30), view.size(30)))
         if icon:
-            rotated = pygame.transform.rotate(icon, self.angle_rot)
-            screen.blit(rotated, rotated.get_rect(center=center))
+            gfx.blit_rotated(screen, icon, center, self.angle_rot)
         else:
-            draw_rect = self.rect.copy()
-            draw_rect.x -= camera_offset.x
-            draw_rect.y -= camera_offset.y
-            pygame.draw.rect(screen, self.color, draw_rect)
+            gfx.rect(screen, self.color, view.rect(self.rect))
 
     def kill(self):
         self.game.particle_manager.spawn_hit(self.rect.center, color=COLOR_PURPLE)
@@ -167,24 +318,22 @@ class EXEraser(PlayerProjectile):
         super().kill()
 
 class EXRuler(PlayerProjectile):
-    def __init__(self, game, x, y, direction):
-        super().__init__(game, x, y, direction * 600, 0, 3, COLOR_BROWN, (50, 14), is_ex=True)
+    __slots__ = ('returning', 'start_x', 'caught', '_direction')
+
+    def reset(self, game, x, y, direction):
+        super().reset(game, x, y, direction * 600, 0, 3, COLOR_BROWN, (50, 14), is_ex=True)
         self.returning = False
         self.start_x = x
         self.caught = False
         self._direction = direction
 
-    def draw(self, screen, camera_offset):
-        center = (self.rect.centerx - camera_offset.x, self.rect.centery - camera_offset.y)
-        icon = _get_icon('Lineal.png', (50, 14))
+    def draw(self, screen, view):
+        center = view.point(*self.rect.center)
+        icon = _get_icon('Lineal.png', (view.size(50), view.size(14)))
         if icon:
-            img = pygame.transform.flip(icon, self._direction < 0, False)
-            screen.blit(img, img.get_rect(center=center))
+            gfx.blit_scaled(screen, icon, icon.get_rect(center=center), flip_x=self._direction < 0)
         else:
-            draw_rect = self.rect.copy()
-            draw_rect.x -= camera_offset.x
-            draw_rect.y -= camera_offset.y
-            pygame.draw.rect(screen, self.color, draw_rect)
+            gfx.rect(screen, self.color, view.rect(self.rect))
 
     def update(self, dt):
         if not self.returning:
@@ -199,7 +348,7 @@ class EXRuler(PlayerProjectile):
             if dir_vec.length() < 40 and not self.caught:
                 self.caught = True
                 self.game.player.cards = min(self.game.player.cards + 1, PLAYER_MAX_CARDS)
-                self.game.effect_manager.add_damage_number(self.game.player.rect.center, "CATCH!", color=COLOR_GREEN, size=24)
+                self.game.events.damage_number(self.game.player.rect.center, "CATCH!", target=self.game.player, color=COLOR_GREEN, size=24)
                 self.kill()
                 return
 
@@ -209,8 +358,10 @@ class EXRuler(PlayerProjectile):
         super().update(dt)
 
 class ParryDamageProjectile(PlayerProjectile):
-    def __init__(self, game, x, y, vel_x, vel_y, damage):
-        super().__init__(game, x, y, vel_x, vel_y, damage, COLOR_GOLD, (15, 15))
+    __slots__ = ('is_homing',)
+
+    def reset(self, game, x, y, vel_x, vel_y, damage):
+        super().reset(game, x, y, vel_x, vel_y, damage, COLOR_GOLD, (15, 15))
         self.is_homing = True
 
     def update(self, dt):
@@ -221,19 +372,21 @@ class ParryDamageProjectile(PlayerProjectile):
                 self.vel = dir_vec.normalize() * 900
         super().update(dt)
 
-    def draw(self, screen, camera_offset):
+    def draw(self, screen, view):
         points = []
-        center = (self.rect.centerx - camera_offset.x, self.rect.centery - camera_offset.y)
+        center = view.point(*self.rect.center)
         for i in range(10):
             angle = math.radians(i * 36 + self.angle_rot)
-            r = 10 if i % 2 == 0 else 4
+            r = (10 if i % 2 == 0 else 4) * view.scale
             points.append((center[0] + math.cos(angle) * r, center[1] + math.sin(angle) * r))
-        pygame.draw.polygon(screen, self.color, points)
-        pygame.draw.polygon(screen, COLOR_WHITE, points, 1)
+        gfx.polygon(screen, self.color, points)
+        gfx.polygon(screen, COLOR_WHITE, points, 1)
 
 class EXSuper(PlayerProjectile):
-    def __init__(self, game, x, y, direction):
-        super().__init__(game, x, y, 0, 0, 0.3, COLOR_YELLOW, (SCREEN_WIDTH, 60), is_ex=True)
+    __slots__ = ('lifetime', '_tick_timer', 'total_damage_dealt')
+
+    def reset(self, game, x, y, direction):
+        super().reset(game, x, y, 0, 0, 0.3, COLOR_YELLOW, (SCREEN_WIDTH, 60), is_ex=True)
         self.lifetime = 0.75 # 45 / 60
         self._tick_timer = 0.125  # start at full interval so first tick waits properly
         self.rect.midleft = (0, y) if direction > 0 else (SCREEN_WIDTH, y)
@@ -264,18 +417,16 @@ class EXSuper(PlayerProjectile):
                 boss.hp -= dmg
                 boss.flash_timer = 0.05
                 self.total_damage_dealt += dmg
-                self.game.effect_manager.add_damage_number(
-                    boss.rect.center, int(dmg), is_weak=False)
+                self.game.events.damage_number(
+                    boss.rect.center, int(dmg), target=boss)
                 if boss.hp < 0:
                     boss.hp = 0
 
-    def draw(self, screen, camera_offset):
-        rect = self.rect.copy()
-        rect.x -= camera_offset.x
-        rect.y -= camera_offset.y
+    def draw(self, screen, view):
+        rect = view.rect(self.rect)
         
-        pulse = math.sin(pygame.time.get_ticks() * 0.1) * 10
+        pulse = math.sin(pygame.time.get_ticks() * 0.1) * 10 * view.scale
         draw_rect = rect.inflate(0, pulse)
         
-        pygame.draw.rect(screen, self.color, draw_rect)
-        pygame.draw.rect(screen, COLOR_WHITE, draw_rect.inflate(0, -20))
+        gfx.rect(screen, self.color, draw_rect)
+        gfx.rect(screen, COLOR_WHITE, draw_rect.inflate(0, -view.size(20)))
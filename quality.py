@@ -0,0 +1,69 @@
+from constants import FPS, RENDER_SCALE
+
+# Kosmetische Detailstufen, 0 = volle Qualität. Nur Optik – keine Spiellogik.
+# Die letzte Stufe rendert die Szene zusätzlich in halber Auflösung.
+QUALITY_LEVELS = [
+    {'max_particles': 200, 'trail_length': 5, 'afterimage_stride': 3,
+     'muzzle_flash': 5, 'max_damage_numbers': 30, 'shake': True, 'render_scale': 1.0},
+    {'max_particles': 120, 'trail_length': 3, 'afterimage_stride': 6,
+     'muzzle_flash': 3, 'max_damage_numbers': 15, 'shake': True, 'render_scale': 1.0},
+    {'max_particles': 60, 'trail_length': 0, 'afterimage_stride': 0,
+     'muzzle_flash': 1, 'max_damage_numbers': 8, 'shake': False, 'render_scale': 1.0},
+    {'max_particles': 60, 'trail_length': 0, 'afterimage_stride': 0,
+     'muzzle_flash': 1, 'max_damage_numbers': 8, 'shake': False, 'render_scale': 0.5},
+]
+
+
+class QualityController:
+    """Steps cosmetic load down when frames get slow and back up with headroom.
+
+    Watches an exponentially smoothed frame time (the work per frame as
+    reported by Clock.get_rawtime, without the tick delay). Hysteresis: it
+    only steps down after staying over budget for DOWNGRADE_HOLD seconds and
+    only steps up after staying well under budget for UPGRADE_HOLD seconds.
+    A fixed constants.RENDER_SCALE overrides the level's render scale.
+    """
+    SMOOTHING = 0.1
+    DOWNGRADE_MS = 1000.0 / FPS * 0.9
+    UPGRADE_MS = 1000.0 / FPS * 0.5
+    DOWNGRADE_HOLD = 0.5
+    UPGRADE_HOLD = 3.0
+
+    def __init__(self, game):
+        self.game = game
+        self.level = 0
+        self.frame_ms = 1000.0 / FPS * 0.5
+        self._over = 0.0
+        self._under = 0.0
+        self.apply()
+
+    def update(self, frame_ms, dt_raw):
+        self.frame_ms += (frame_ms - self.frame_ms) * self.SMOOTHING
+        if self.frame_ms > self.DOWNGRADE_MS:
+            self._over += dt_raw
+            self._under = 0.0
+        elif self.frame_ms < self.UPGRADE_MS:
+            self._under += dt_raw
+            self._over = 0.0
+        else:
+            self._over = self._under = 0.0
+
+        if self._over >= self.DOWNGRADE_HOLD and self.level < len(QUALITY_LEVELS) - 1:
+            self.set_level(self.level + 1)
+        elif self._under >= self.UPGRADE_HOLD and self.level > 0:
+            self.set_level(self.level - 1)
+
+    def set_level(self, level):
+        self.level = level
+        self._over = self._under = 0.0
+        self.apply()
+
+    def apply(self):
+        settings = QUALITY_LEVELS[self.level]
+        self.trail_length = settings['trail_length']
+        self.afterimage_stride = settings['afterimage_stride']
+        self.muzzle_flash = settings['muzzle_flash']
+        self.render_scale = RENDER_SCALE or settings['render_scale']
+        self.game.particle_manager.set_max_particles(settings['max_particles'])
+        self.game.effect_manager.max_damage_numbers = settings['max_damage_numbers']
+        self.game.effect_manager.shake_enabled = settings['shake']
@@ -0,0 +1,149 @@
+import math
+import sys
+import time
+import zlib
+from collections import deque
+from constants import FPS
+from snapshot import Snapshot, take_snapshot, restore_snapshot
+
+REWIND_SECONDS = 6.0          # so weit lässt sich höchstens zurückspulen
+REWIND_KEYFRAME_INTERVAL = 30  # Frames zwischen zwei Keyframes
+REWIND_MEMORY = 2 * 1024 * 1024  # Bytes für den ganzen Puffer
+REWIND_CAPTURE_BUDGET = 0.001  # s Aufnahmezeit pro Frame im Mittel
+REWIND_SPEED = 2               # Frames pro Frame beim Zurückspulen (2x Tempo)
+
+
+class RewindFrame:
+    """One captured frame: a keyframe or a delta against its keyframe."""
+    __slots__ = ('frame', 'key', 'data', 'size')
+
+    def __init__(self, frame, key, data):
+        self.frame = frame
+        self.key = key    # None: selbst Keyframe, sonst der Keyframe des Deltas
+        self.data = data  # zlib; ein Delta mit dem entpackten Keyframe als Wörterbuch
+        self.size = len(data) + _ENTRY_OVERHEAD
+
+
+_ENTRY_OVERHEAD = sys.getsizeof(object()) + 8 * len(RewindFrame.__slots__)
+
+
+class RewindBuffer:
+    """Ring buffer of per-frame fight snapshots for the practice mode.
+
+    capture() stores the state at the start of a frame. Every
+    REWIND_KEYFRAME_INTERVAL-th entry is a keyframe (zlib-compressed
+    snapshot); the rest are deltas, compressed with the keyframe as
+    preset dictionary, so only what changed since the keyframe costs
+    memory. Old entries are dropped keyframe group by keyframe group
+    once they are older than REWIND_SECONDS or the buffer outgrows
+    REWIND_MEMORY.
+
+    Capturing is timed: if it costs more than REWIND_CAPTURE_BUDGET per
+    frame on average, only every second (third, ...) frame is captured
+    until it fits again. step_back() moves a rewind position back by a
+    number of frames and restores the fight from the entry there, so the
+    rewind speed does not depend on the stride.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.frames = deque()
+        self.bytes = 0
+        self.stride = 1
+        self.capture_time = 0.0  # s pro Aufnahme, gleitender Mittelwert
+        self._frame = 0
+        self._key = None
+        self._key_raw = None
+        self._cache = (None, None)  # zuletzt entpackter Keyframe beim Zurückspulen
+        self._position = None  # Ziel-Frame beim Zurückspulen, None während normal gespielt wird
+
+    def capture(self):
+        self._position = None
+        self._frame += 1
+        if self._frame % self.stride:
+            return
+        t0 = time.perf_counter()
+        raw = take_snapshot(self.game).blob
+
+        key = self._key
+        if key is None or self._frame - key.frame >= REWIND_KEYFRAME_INTERVAL * self.stride:
+            entry = RewindFrame(self._frame, None, zlib.compress(raw, 1))
+            self._key, self._key_raw = entry, raw
+        else:
+            packer = zlib.compressobj(1, zdict=self._key_raw)
+            data = packer.compress(raw) + packer.flush()
+            entry = RewindFrame(self._frame, key, data)
+        self.frames.append(entry)
+        self.bytes += entry.size
+        self._trim()
+        self._account(time.perf_counter() - t0)
+
+    def _account(self, spent):
+        self.capture_time += (spent - self.capture_time) * 0.1
+        # Budget pro Frame einhalten: lieber seltener aufnehmen als Frames verlieren
+        self.stride = min(4, max(1, math.ceil(self.capture_time / REWIND_CAPTURE_BUDGET)))
+
+    @property
+    def cost(self):
+        """Average capture time per frame in seconds."""
+        return self.capture_time / self.stride
+
+    def _trim(self):
+        frames = self.frames
+        oldest = self._frame - REWIND_SECONDS * FPS
+        while frames and (frames[0].frame < oldest or self.bytes > REWIND_MEMORY):
+            # Immer einen ganzen Keyframe samt seinen Deltas verwerfen
+            self.bytes -= frames.popleft().size
+            while frames and frames[0].key is not None:
+                self.bytes -= frames.popleft().size
+            if not frames:
+                self._key = None
+
+    @property
+    def seconds(self):
+        """How far back the buffer currently reaches."""
+        if not self.frames:
+            return 0.0
+        return (self._frame - self.frames[0].frame) / FPS
+
+    def step_back(self, frames=REWIND_SPEED):
+        """Rewind the fight by ``frames`` frames; False once the buffer is empty.
+
+        Entries lie ``stride`` frames apart, so a call may restore nothing
+        (the fight holds for a frame) or skip entries; on average the fight
+        runs back ``frames`` frames per call at any stride. The restored
+        entry is dropped too, the next capture() records it again.
+        """
+        if not self.frames:
+            return False
+        if self._position is None:
+            self._position = self._frame + 1  # Anfang des laufenden Frames
+        self._position -= frames
+        entry = None
+        while self.frames and self.frames[-1].frame >= self._position:
+            entry = self.frames.pop()
+            self.bytes -= entry.size
+            if entry is self._key:
+                self._key = None  # nächste Aufnahme wird wieder ein Keyframe
+        if entry is not None:
+            self._frame = entry.frame - 1  # die nächste Aufnahme ist wieder dieser Frame
+            restore_snapshot(self.game, self._decode(entry))
+        return True
+
+    def _decode(self, entry):
+        key = entry.key or entry
+        if self._cache[0] is key:
+            key_raw = self._cache[1]
+        else:
+            key_raw = zlib.decompress(key.data)
+            self._cache = (key, key_raw)
+        if entry.key is None:
+            return Snapshot(key_raw)
+        return Snapshot(zlib.decompressobj(zdict=key_raw).decompress(entry.data))
+
+    def clear(self):
+        self.frames.clear()
+        self.bytes = 0
+        self._key = self._key_raw = None
+        self._cache = (None, None)
+        self._position = None
@@ -0,0 +1,97 @@
+import asyncio
+import pygame
+from constants import FPS
+
+IDLE_POLL = 1.0 / FPS  # s, Abfrageintervall für Eingaben in Idle-Szenen
+
+
+class AsyncRunner:
+    """Runs the game loop as a coroutine on an asyncio event loop.
+
+    One frame is still handle_events(), update(), draw(). Between frames
+    the frame coroutine sleeps until the next frame is due instead of
+    blocking in Clock.tick(), and services run in that gap. A service is
+    a coroutine function ``service(game)``, started as a task next to the
+    frames and cancelled when the runner stops. Services must await
+    instead of blocking – file or network work goes through
+    asyncio.to_thread() – or they delay the next frame.
+
+    Idle scenes (menus, pause) poll for input every IDLE_POLL seconds
+    instead of blocking in pygame.event.wait(), so the services keep
+    running there too.
+    """
+
+    def __init__(self, game, services=()):
+        self.game = game
+        self.services = list(services)
+        self.tasks = []
+
+    def add_service(self, service):
+        self.services.append(service)
+        if self.tasks:
+            self.tasks.append(asyncio.create_task(service(self.game)))
+
+    async def run(self):
+        self.tasks = [asyncio.create_task(service(self.game)) for service in self.services]
+        try:
+            await self.frames()
+        finally:
+            for task in self.tasks:
+                task.cancel()
+            await asyncio.gather(*self.tasks, return_exceptions=True)
+            self.tasks = []
+
+    async def frames(self):
+        game = self.game
+        loop = asyncio.get_running_loop()
+        next_frame = loop.time()
+        while True:
+            timeout = game.idle_timeout()
+            if timeout is None:
+                # Die Zeit bis zum nächsten Frame gehört den Diensten;
+                # Clock.tick() in update() muss dann kaum noch warten
+                await asyncio.sleep(max(0.0, next_frame - loop.time()))
+                events = pygame.event.get()
+            else:
+                events = await self.wait_events(timeout / 1000.0)
+            # Nach einem Hänger nicht alle verpassten Frames nachholen
+            next_frame = max(next_frame, loop.time() - 1.0 / FPS) + 1.0 / FPS
+            game.handle_events(events)
+            game.update()
+            game.draw()
+            game.run_idle_tasks()
+
+    async def wait_events(self, timeout):
+        """Like Game.wait_events(), but yields to the services while waiting."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        events = pygame.event.get()
+        while not events and loop.time() < deadline:
+            await asyncio.sleep(min(IDLE_POLL, deadline - loop.time()))
+            events = pygame.event.get()
+        if timeout > 0:
+            self.game.idle_waited = True
+        return events
+
+
+async def save_flusher(game, interval=2.0):
+    """Service: write changed save data in a worker thread instead of mid-frame.
+
+    While it runs, Game.win_game() leaves saving to it.
+    """
+    save_system = game.save_system
+    game.save_deferred = True
+    writing = None
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            if save_system.dirty:
+                # Serialisieren im Loop-Thread, nur das Schreiben läuft nebenher
+                writing = asyncio.ensure_future(asyncio.to_thread(save_system.write, save_system.dump()))
+                await asyncio.shield(writing)
+    finally:
+        # Nie zwei Schreiber auf derselben Datei
+        if writing is not None and not writing.done():
+            await writing
+        game.save_deferred = False
+        save_system.save()
@@ -5,6 +5,8 @@ from constants import SAVE_FILE
 class SaveSystem:
     def __init__(self):
         self.data = self.get_default_data()
+        self.revision = 0  # erhöht bei jeder Datenänderung (UI-Caches)
+        self.pending = False  # save_later() angefordert, aber noch nicht gelaufen
         self.load()
 
     def get_default_data(self):
@@ -48,15 +50,44 @@ class SaveSystem:
                                 self.data[key] = loaded_data[key]
             except Exception as e:
                 print(f"Error loading save file: {e}")
+        self.revision += 1
+
+    @property
+    def dirty(self):
+        return getattr(self, '_dirty', True)
 
     def save(self):
-        if not getattr(self, '_dirty', True):
+        self.pending = False
+        if not self.dirty:
             return
+        self.write(self.dump())
+
+    def save_later(self):
+        """save() as an idle task (tasks.IdleScheduler); flush() writes it if it has not run yet."""
+        self.pending = True
+        return self._save_step()
+
+    def _save_step(self):
+        yield  # erst in der nächsten freien Frame-Zeit
+        if self.pending:
+            self.save()
+
+    def flush(self):
+        if self.pending:
+            self.save()
+
+    def dump(self):
+        """Serialized save data; counts as saved unless write() fails."""
+        self._dirty = False
+        return json.dumps(self.data, indent=4)
+
+    def write(self, text):
+        # Darf in einem Worker-Thread laufen (siehe runner.save_flusher)
         try:
             with open(SAVE_FILE, 'w') as f:
-                json.dump(self.data, f, indent=4)
-            self._dirty = False
+                f.write(text)
         except Exception as e:
+            self._dirty = True
             print(f"Error saving file: {e}")
 
     def update_stat(self, stat_name, value, mode="add"):
@@ -75,13 +106,16 @@ class SaveSystem:
         elif mode == "set":
             self.data["stats"][stat_name] = value
         self._dirty = True
+        self.revision += 1
 
     def unlock_skin(self, skin_name):
         if skin_name not in self.data["unlocks"]["skins"]:
             self.data["unlocks"]["skins"].append(skin_name)
+            self.revision += 1
             self.save()
 
     def unlock_ex(self, ex_name):
         if ex_name not in self.data["unlocks"]["ex_attacks"]:
             self.data["unlocks"]["ex_attacks"].append(ex_name)
+            self.revision += 1
             self.save()
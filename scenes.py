@@ -0,0 +1,452 @@
+import sys
+from abc import ABC, abstractmethod
+import pygame
+import gfx
+from constants import *
+from backend import compose_scene
+from tutorial import TutorialManager
+from view import View
+from utils import draw_text
+from rewind import RewindBuffer, REWIND_SPEED
+
+IDLE_MAX_WAIT = 0.5  # s, längste Blockade auch ohne anstehenden Timer
+PRACTICE_DEATH_REWIND = 3.0  # s, so weit spult der Übungsmodus nach einem Tod zurück
+
+
+class Scene:
+    """One entry of Game.scenes; only the top scene gets events, updates and draws.
+
+    ``name`` is what Game.state reports while the scene is on top. An
+    ``overlay`` scene is pushed over the scene below instead of replacing
+    it; the scene below is not updated any more and is shown as a still
+    frame rendered once (render_still) when the overlay is entered.
+    """
+    name = None
+    overlay = False
+    idle = False       # blocks on input instead of ticking at FPS (see idle_wait)
+    simulated = False  # runs the fight: game clocks and quality control
+
+    def __init__(self, game):
+        self.game = game
+
+    def handle_event(self, event):
+        pass
+
+    def update(self, dt, dt_raw):
+        pass
+
+    def draw(self, screen):
+        pass
+
+    def idle_wait(self):
+        """Seconds the loop may block waiting for input (idle scenes only)."""
+        return IDLE_MAX_WAIT
+
+    def render_still(self, surface):
+        surface.fill(COLOR_BLACK)
+
+
+# ---------------------------------------------------------------------------
+# Static pages
+# ---------------------------------------------------------------------------
+
+class PageScene(Scene, ABC):
+    """Scene showing one ui.RetainedScreen; redrawn and flipped only on change."""
+    idle = True
+
+    @property
+    @abstractmethod
+    def page(self):
+        """The ui.RetainedScreen this scene shows."""
+
+    def draw(self, screen):
+        dirty = self.game.ui_manager.present_retained(screen, self.page)
+        if dirty:
+            self.game.backend.flip(dirty)
+
+    def render_still(self, surface):
+        self.page.draw(surface)
+
+
+class MenuScene(PageScene):
+    name = "MENU"
+
+    @property
+    def page(self):
+        return self.game.ui_manager.menu
+
+    def handle_event(self, event):
+        game = self.game
+        action = self.page.update([event])
+        if action == "TUTORIAL":
+            game.reset_game()
+            game.tutorial_manager = TutorialManager(game)
+            game.state = "TUTORIAL"
+        elif action == "START GAME":
+            game.reset_game()
+            game.state = "PLAYING"
+        elif action == "PRACTICE MODE":
+            game.reset_game()
+            game.state = "PRACTICE"
+        elif action == "CHALLENGE MODES":
+            game.state = "CHALLENGE_SELECT"
+        elif action == "DEMO MODE":
+            game.reset_game(challenge_name=None, is_demo_interactive=True)
+        elif action == "STATISTICS":
+            game.state = "STATISTICS"
+        elif action == "QUIT":
+            pygame.quit()
+            sys.exit()
+
+    def update(self, dt, dt_raw):
+        self.game.inactivity_timer += dt_raw
+        if self.game.inactivity_timer >= 15.0:
+            self.game.reset_game(is_demo=True)
+
+    def idle_wait(self):
+        # Rechtzeitig für den Wechsel in den Demo-Modus aufwachen
+        return min(IDLE_MAX_WAIT, 15.0 - self.game.inactivity_timer)
+
+
+class ChallengeSelectScene(PageScene):
+    name = "CHALLENGE_SELECT"
+
+    @property
+    def page(self):
+        return self.game.ui_manager.challenge_screen
+
+    def handle_event(self, event):
+        chal_action = self.page.update([event])
+        if chal_action == "BACK":
+            self.game.state = "MENU"
+        elif chal_action:
+            self.game.reset_game(challenge_name=chal_action)
+            self.game.state = "PLAYING"
+
+
+class StatisticsScene(PageScene):
+    name = "STATISTICS"
+
+    @property
+    def page(self):
+        return self.game.ui_manager.statistics_screen
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.game.state = "MENU"
+
+
+class WinScene(PageScene):
+    name = "WIN_SCREEN"
+
+    @property
+    def page(self):
+        return self.game.grade_screen
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+            self.game.state = "MENU"
+
+
+# ---------------------------------------------------------------------------
+# Fight
+# ---------------------------------------------------------------------------
+
+class FightScene(Scene):
+    name = "PLAYING"
+    simulated = True
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_p:
+            self.game.state = "PAUSED"
+
+    def update(self, dt, dt_raw):
+        game = self.game
+        self.update_fight(dt)
+        # Alle Countdowns (Spieler, Boss, Effekte) laufen am Ende des Schritts ab,
+        # wo früher die einzelnen update_timers() herunterzählten
+        game.timers.advance(dt)
+        game.real_timers.advance(dt_raw)
+
+    def update_fight(self, dt):
+        game = self.game
+        if game.challenge:
+            game.challenge.update(dt)
+        self.update_actors(dt)
+        game.player_bullets.update(dt)
+        game.boss_bullets.update(dt)
+        game.particle_manager.update(dt)
+        game.effect_manager.update(dt)
+
+        if game.player.alive() and game.boss.alive():
+            hits = game.player_bullets.collide(game.boss.rect, kill=True)
+            for bullet in hits:
+                game.boss.take_damage(bullet.damage)
+                game.particle_manager.spawn_impact(bullet.rect.center, color=COLOR_WHITE)
+                # Style: Weak Point Treffer
+                if game.boss.weak_point_timer > 0:
+                    game.style_points += 5
+                # Style: Treffer während Streber Mode
+                if game.player.streber_mode:
+                    game.style_points += 2
+
+        if game.boss.is_dying and game.boss.state_timer <= 0:
+            game.win_game()
+
+    def update_actors(self, dt):
+        self.game.game_time += dt
+        self.game.player.update(dt)
+        self.game.boss.update(dt)
+
+    def draw(self, screen):
+        game = self.game
+        # Hit-Stop: das zuletzt gezeigte Bild bleibt einfach stehen
+        static = game.effect_manager.freeze_timer > 0
+        if static and game.static_frame_shown:
+            return
+        game.static_frame_shown = static
+
+        zoom = game.effect_manager.zoom_level
+        scale = game.quality.render_scale
+        # Ohne Zoom und in voller Auflösung direkt auf den Bildschirm zeichnen
+        direct = zoom == 1.0 and scale == 1.0
+        target = screen if direct else game.scene_surface(scale)
+        target.fill(COLOR_BLACK)
+        game.draw_scene(target, View(game.effect_manager.get_camera_offset(), scale, zoom))
+        if target is not screen:
+            game.backend.present_scene(target, zoom)
+        self.draw_hud(screen)
+        game.backend.flip()
+
+    def draw_hud(self, screen):
+        """HUD, always at native resolution."""
+        game = self.game
+        if game.reality_break_timer > 0:
+            _rb_labels = {'invert_controls': 'STEUERUNG INVERTIERT!', 'invert_gravity': 'SCHWERKRAFT UMGEKEHRT!', 'slow_mo': 'ZEITLUPE!'}
+            rb_text = _rb_labels.get(game.reality_break_type, game.reality_break_type.upper())
+            draw_text(screen, f"REALITY BREAK: {rb_text}", 32, SCREEN_WIDTH//2, 150, COLOR_WHITE)
+        game.ui_manager.hud.draw(screen)
+
+    def render_still(self, surface):
+        # Volle Auflösung ohne Wackeln – das Bild bleibt länger stehen.
+        # Immer in Software, auch beim Renderer-Backend: das Standbild ist eine Surface
+        game = self.game
+        zoom = game.effect_manager.zoom_level
+        scene = game.render_surface
+        scene.fill(COLOR_BLACK)
+        game.draw_scene(scene, View((0, 0), 1.0, zoom))
+        compose_scene(scene, zoom, surface)
+        self.draw_hud(surface)
+
+
+class DemoScene(FightScene):
+    name = "DEMO"
+
+    def handle_event(self, event):
+        game = self.game
+        ability = game.ui_manager.demo_panel.update([event])
+        if ability:
+            game.handle_demo_ability(ability)
+
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_TAB:
+                game.demo.panel_visible = not game.demo.panel_visible
+            if event.key == pygame.K_r:
+                game.boss.hp = 100
+                game.boss.phase = 1
+                game.boss.state = 'idle'
+            if event.key == pygame.K_b:
+                game.player.pos = pygame.math.Vector2(100, SCREEN_HEIGHT)
+            if event.key == pygame.K_ESCAPE:
+                game.state = "MENU"
+                return
+        super().handle_event(event)
+
+    def update_actors(self, dt):
+        game = self.game
+        game.demo.update(dt)
+        game.player.update(dt)
+        if game.demo.boss_active_timer > 0:
+            game.boss.update(dt)
+            game.demo.boss_active_timer -= dt
+        else:
+            game.boss.update_weak_point(dt)
+            game.boss.update_visuals(dt)
+            game.boss.rect.center = game.boss.pos + game.boss.vibrate_offset
+
+    def draw_hud(self, screen):
+        super().draw_hud(screen)
+        if self.game.demo.panel_visible:
+            self.game.ui_manager.demo_panel.draw(screen)
+        draw_text(screen, "⚡ DEMO MODE — ESC zum Beenden", 24, SCREEN_WIDTH//2, 30, COLOR_RED)
+
+
+class TutorialScene(FightScene):
+    name = "TUTORIAL"
+
+    def handle_event(self, event):
+        game = self.game
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                if game.tutorial_manager and not game.tutorial_manager.done:
+                    game.tutorial_manager.skip_step()
+            if event.key in (pygame.K_RETURN, pygame.K_SPACE):
+                if game.tutorial_manager:
+                    game.tutorial_manager.finish()
+                    if game.tutorial_manager.done:
+                        game.state = "MENU"
+
+    def update_fight(self, dt):
+        game = self.game
+        if game.tutorial_manager:
+            game.tutorial_manager.update(dt)
+            if game.tutorial_manager.done:
+                game.state = "MENU"
+        game.player.update(dt)
+        game.boss.update(dt)
+        game.player_bullets.update(dt)
+        game.boss_bullets.update(dt)
+        game.particle_manager.update(dt)
+        game.effect_manager.update(dt)
+        # Track damage dealt to boss during tutorial
+        if game.player.alive() and game.boss.alive():
+            hits = game.player_bullets.collide(game.boss.rect, kill=True)
+            for bullet in hits:
+                game.tutorial_damage_dealt += bullet.damage
+                game.particle_manager.spawn_impact(bullet.rect.center, color=COLOR_WHITE)
+
+    def draw_hud(self, screen):
+        super().draw_hud(screen)
+        if self.game.tutorial_manager:
+            self.game.tutorial_manager.draw(screen)
+
+
+class PracticeScene(FightScene):
+    """Normal fight, but holding R rewinds it (see rewind.RewindBuffer).
+
+    Losing is not possible: on death the fight rewinds by
+    PRACTICE_DEATH_REWIND seconds instead, and a win is not counted in
+    the statistics.
+    """
+    name = "PRACTICE"
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.rewind = RewindBuffer(game)
+        self.rewinding = False
+        self.auto_rewind = 0  # Frames, die nach einem Tod noch zurückgespult werden
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.game.state = "MENU"
+            return
+        super().handle_event(event)
+
+    def player_died(self):
+        # Erst im nächsten Frame zurückspulen – Snapshots nur zwischen zwei Frames
+        self.auto_rewind = int(PRACTICE_DEATH_REWIND * FPS)
+
+    def update(self, dt, dt_raw):
+        if self.auto_rewind > 0 or self.game.input.held('rewind'):
+            self.rewinding = self.rewind.step_back(REWIND_SPEED)
+            if self.rewinding:
+                self.auto_rewind = max(0, self.auto_rewind - REWIND_SPEED)
+                return
+            if self.auto_rewind:
+                # Nichts mehr im Puffer (Tod gleich zu Beginn): Kampf neu starten
+                self.auto_rewind = 0
+                self.game.reset_game()
+                self.rewind.clear()
+        self.rewinding = False
+        self.rewind.capture()
+        super().update(dt, dt_raw)
+
+    def draw_hud(self, screen):
+        super().draw_hud(screen)
+        if self.rewinding:
+            draw_text(screen, "◀◀ ZURÜCKSPULEN", 32, SCREEN_WIDTH//2, 150, COLOR_CYAN)
+        draw_text(screen, f"ÜBUNGSMODUS — R halten: {self.rewind.seconds:.1f}s zurück", 20,
+                  SCREEN_WIDTH//2, 30, COLOR_CYAN)
+
+
+# ---------------------------------------------------------------------------
+# Overlays
+# ---------------------------------------------------------------------------
+
+class OverlayScene(Scene):
+    """Drawn over a still of the scene below, which is neither updated nor redrawn.
+
+    The overlay is only redrawn when frame_key() changes or the display
+    was invalidated (Game.static_frame_shown reset).
+    """
+    overlay = True
+    idle = True
+
+    def __init__(self, game, below):
+        super().__init__(game)
+        self.below = below
+        self.still = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        below.render_still(self.still)
+        gfx.static(self.still)
+        self._key = None
+
+    def frame_key(self):
+        return None
+
+    def draw(self, screen):
+        game = self.game
+        key = self.frame_key()
+        if game.static_frame_shown and key == self._key:
+            return
+        game.static_frame_shown = True
+        self._key = key
+        screen.blit(self.still, (0, 0))
+        self.draw_overlay(screen)
+        game.backend.flip()
+
+    def draw_overlay(self, screen):
+        pass
+
+    def render_still(self, surface):
+        surface.blit(self.still, (0, 0))
+        self.draw_overlay(surface)
+
+
+class PauseScene(OverlayScene):
+    name = "PAUSED"
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_p:
+            self.game.pop_scene()
+
+    def draw_overlay(self, screen):
+        self.game.ui_manager.draw_pause(screen)
+
+
+class GameOverScene(OverlayScene):
+    name = "GAME_OVER"
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key in (pygame.K_RETURN, pygame.K_SPACE):
+            self.game.state = "MENU"
+
+    def update(self, dt, dt_raw):
+        self.game.game_over_timer -= dt_raw
+        if self.game.game_over_timer <= 0:
+            self.game.state = "MENU"
+
+    def frame_key(self):
+        # Der Countdown-Text ändert sich nur jede volle Sekunde
+        return int(max(0, self.game.game_over_timer))
+
+    def draw_overlay(self, screen):
+        self.game.ui_manager.draw_game_over(screen)
+
+    def idle_wait(self):
+        timer = self.game.game_over_timer
+        return min(IDLE_MAX_WAIT, timer % 1.0 or 1.0, timer)
+
+
+SCENES = {cls.name: cls for cls in (
+    MenuScene, ChallengeSelectScene, StatisticsScene, WinScene,
+    FightScene, DemoScene, TutorialScene, PracticeScene, PauseScene, GameOverScene)}
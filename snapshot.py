@@ -0,0 +1,111 @@
+import pickle
+import random
+
+# Erhöhen, sobald sich der Aufbau des Blobs oder ein get_state() ändert: alte Blobs passen dann nicht mehr
+SNAPSHOT_FORMAT = 2
+
+
+def _owners(game):
+    """Objects whose methods timer callbacks may be; the blob names them by these keys."""
+    return {'game': game, 'player': game.player, 'boss': game.boss,
+            'effect_manager': game.effect_manager}
+
+
+class Snapshot:
+    """Fight state as one pickled blob (see take_snapshot).
+
+    The blob stands alone: it holds plain values from the get_state()
+    methods, projectile and particle classes by module and name, timer
+    callbacks by owner and method name – no surfaces and no references
+    into the running process. It can be written to a file and restored
+    into any Game of the same version (save states, rewind, rollback,
+    lookahead).
+    """
+    __slots__ = ('blob',)
+
+    def __init__(self, blob):
+        self.blob = blob
+
+    def __len__(self):
+        return len(self.blob)
+
+
+def _entity_state(entity):
+    return entity.__class__, entity.pool is not None, entity.get_state()
+
+
+def take_snapshot(game, cosmetic=False):
+    """Capture the fight between two frames (after entities/events were flushed).
+
+    ``cosmetic`` also captures particles.
+    """
+    owners = _owners(game)
+    names = {id(obj): name for name, obj in owners.items()}
+    state = (
+        SNAPSHOT_FORMAT,
+        tuple(scene.name for scene in game.scenes),
+        # Zustand des Zufallsgenerators unverändert, nur mit seiner Version zum Prüfen
+        (random.Random.VERSION, random.getstate()),
+        game.timers.get_state(names),
+        game.real_timers.get_state(names),
+        game.get_state(),
+        game.player.get_state(),
+        game.boss.get_state(),
+        game.effect_manager.get_state(),
+        [_entity_state(entity) for entity in game.player_bullets.sprites()],
+        [_entity_state(entity) for entity in game.boss_bullets.sprites()],
+        game.particle_manager.get_state() if cosmetic else None,
+    )
+    return Snapshot(pickle.dumps(state, pickle.HIGHEST_PROTOCOL))
+
+
+def _restore_entities(game, entity_list, entries):
+    pools = {}
+    for cls, pooled, state in entries:
+        if pooled:
+            pool = pools.get(cls)
+            if pool is None:
+                pool = pools[cls] = game.pools.get(cls)
+            # Lebende Projektile kommen aus ihrem Pool – sonst wüchse die Freiliste mit jedem Restore
+            entity = pool.reclaim()
+        else:
+            entity = cls()
+        entity_list.add(entity)
+        entity.set_state(game, state)
+
+
+def restore_snapshot(game, snapshot):
+    """Put the fight back exactly as it was when ``snapshot`` was taken."""
+    state = pickle.loads(snapshot.blob)
+    if state[0] != SNAPSHOT_FORMAT:
+        raise ValueError(f"snapshot format {state[0]}, expected {SNAPSHOT_FORMAT}")
+    (_, scenes, (random_version, random_state), timers, real_timers, game_state, player, boss,
+     effects, player_bullets, boss_bullets, particles) = state
+    # Vor jeder Änderung prüfen: ein fremder Generator ließe den Kampf halb wiederhergestellt
+    if random_version != random.Random.VERSION:
+        raise ValueError(f"snapshot random state version {random_version}, "
+                         f"expected {random.Random.VERSION}")
+
+    # Laufende Projektile gehen zurück in ihre Pools
+    game.entities.clear()
+    # Zuerst die Uhren: die Countdowns der anderen Objekte zeigen auf deren Timer
+    owners = _owners(game)
+    game.timers.set_state(timers, owners)
+    game.real_timers.set_state(real_timers, owners)
+    game.set_state(game_state)
+    game.player.set_state(player)
+    game.boss.set_state(boss)
+    game.effect_manager.set_state(effects)
+    _restore_entities(game, game.player_bullets, player_bullets)
+    _restore_entities(game, game.boss_bullets, boss_bullets)
+    if particles is not None:
+        game.particle_manager.set_state(particles, game.player.afterimage_image)
+    random.setstate(random_state)
+    game.events.clear()
+
+    # Overlays zeigen ein Standbild des Kampfes – dann neu aufbauen
+    if tuple(scene.name for scene in game.scenes) != scenes or game.scene.overlay:
+        game.scenes = []
+        for name in scenes:
+            game.state = name
+    game.invalidate()
@@ -0,0 +1,105 @@
+import time
+from collections import deque
+
+IDLE_MARGIN = 0.002   # s Reserve, damit Clock.tick() den Frame noch pünktlich beendet
+IDLE_LOG_SIZE = 512  # Einträge in IdleScheduler.log
+
+
+class IdleTask:
+    """A generator run step by step in spare frame time (see IdleScheduler.add)."""
+    __slots__ = ('name', 'steps', 'priority', 'deadline', 'seq', 'used', 'done')
+
+    def __init__(self, name, steps, priority, deadline, seq):
+        self.name = name
+        self.steps = steps
+        self.priority = priority
+        self.deadline = deadline
+        self.seq = seq
+        self.used = 0.0  # s, insgesamt
+        self.done = False
+
+
+class IdleScheduler:
+    """Runs small resumable tasks in the time left over after a frame.
+
+    A task is a generator; every next() should be a small step (a few
+    hundred microseconds at most). run(budget) steps tasks until the
+    budget is spent – highest priority first, older tasks first within a
+    priority. A task past its deadline gets one step per frame even
+    without budget, so it cannot starve while the game is busy.
+
+    Every frame a task ran in is recorded in ``log`` as (frame, task
+    name, seconds used); usage() sums it up per task.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.tasks = []
+        self.frame = 0
+        self.log = deque(maxlen=IDLE_LOG_SIZE)
+        self._seq = 0
+
+    def add(self, name, steps, priority=0, deadline=None):
+        """Queue generator ``steps``; ``deadline`` is in seconds from now."""
+        self._seq += 1
+        if deadline is not None:
+            deadline += self.clock()
+        task = IdleTask(name, steps, priority, deadline, self._seq)
+        self.tasks.append(task)
+        self.tasks.sort(key=lambda t: (-t.priority, t.seq))
+        return task
+
+    def cancel(self, task):
+        if not task.done:
+            task.done = True
+            self.tasks.remove(task)
+
+    def run(self, budget):
+        """Step tasks for at most ``budget`` seconds (overdue tasks: one step regardless)."""
+        self.frame += 1
+        if not self.tasks:
+            return
+        clock = self.clock
+        end = clock() + budget
+        log = self.log
+        for task in list(self.tasks):
+            if task.done:  # von einer anderen Aufgabe abgebrochen
+                continue
+            now = clock()
+            overdue = task.deadline is not None and now >= task.deadline
+            used = 0.0
+            while overdue or now < end:
+                try:
+                    next(task.steps)
+                except StopIteration:
+                    task.done = True
+                except Exception as e:
+                    print(f"Hintergrundaufgabe '{task.name}' abgebrochen: {e}")
+                    task.done = True
+                after = clock()
+                used += after - now
+                now = after
+                overdue = False
+                if task.done:
+                    break
+            if used:
+                task.used += used
+                log.append((self.frame, task.name, used))
+            if task.done:
+                self.tasks.remove(task)
+
+    def finish(self):
+        """Run every pending task to the end."""
+        while self.tasks:
+            self.run(float('inf'))
+
+    def usage(self, frames=60):
+        """Seconds used per task name over the last ``frames`` frames."""
+        totals = {}
+        for frame, name, used in self.log:
+            if self.frame - frame < frames:
+                totals[name] = totals.get(name, 0.0) + used
+        return totals
+
+    def __len__(self):
+        return len(self.tasks)
@@ -0,0 +1,188 @@
+import heapq
+from functools import partial
+
+
+class Timer:
+    """Handle for a scheduled callback (see TimerScheduler.cancel)."""
+    __slots__ = ('deadline', 'seq', 'callback', 'cancelled')
+
+    def __init__(self, deadline, seq, callback):
+        self.deadline = deadline
+        self.seq = seq  # Reihenfolge bei gleicher Deadline, Schlüssel im Snapshot
+        self.callback = callback
+        self.cancelled = False
+
+
+def _callback_state(callback, names):
+    # Gebundene Methode (oder partial davon) als (Besitzer, Methodenname, Argumente)
+    args = ()
+    if callback.__class__ is partial:
+        callback, args = callback.func, callback.args
+    owner = names.get(id(getattr(callback, '__self__', None)))
+    if owner is None:
+        raise ValueError(f"timer callback {callback!r} is not a method of a snapshot object")
+    return owner, callback.__name__, args
+
+
+class TimerScheduler:
+    """Clock plus a heap of pending callbacks.
+
+    advance(dt) moves the clock and fires everything that expired, in
+    deadline order. Nothing is polled per timer, so idle objects cost
+    nothing per frame. The game keeps two of these: Game.timers runs on
+    game time (dt already scaled by effect_manager.time_scale, 0 during a
+    freeze), Game.real_timers on unscaled frame time.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self._heap = []
+        self._seq = 0
+        self._cancelled = 0
+
+    def schedule(self, delay, callback):
+        self._seq += 1
+        timer = Timer(self.now + delay, self._seq, callback)
+        heapq.heappush(self._heap, (timer.deadline, timer.seq, timer))
+        return timer
+
+    def cancel(self, timer):
+        if not timer.cancelled:
+            timer.cancelled = True
+            self._cancelled += 1
+            # Abgebrochene bleiben bis zum Ablauf im Heap – nur bei Überhang aufräumen
+            if self._cancelled > 32 and self._cancelled * 2 > len(self._heap):
+                self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+                heapq.heapify(self._heap)
+                self._cancelled = 0
+
+    def advance(self, dt):
+        self.now += dt
+        heap = self._heap
+        while heap and heap[0][0] <= self.now:
+            timer = heapq.heappop(heap)[2]
+            if timer.cancelled:
+                self._cancelled -= 1
+                continue
+            timer.cancelled = True
+            timer.callback()
+
+    def clear(self):
+        # Noch gehaltene Handles (Countdown) sollen cancel() nicht mehr mitzählen
+        for entry in self._heap:
+            entry[2].cancelled = True
+        self._heap.clear()
+        self._cancelled = 0
+
+    def __len__(self):
+        return len(self._heap) - self._cancelled
+
+    def get_state(self, names):
+        """Clock and pending timers as plain values (see snapshot.py).
+
+        Callbacks must be methods of the objects in ``names`` (id -> name)
+        or partials of them; they are stored by name. The heap is kept in
+        its current order, so ties fire in the same order after a restore.
+        """
+        entries = [(deadline, seq, None if timer.cancelled else _callback_state(timer.callback, names))
+                   for deadline, seq, timer in self._heap]
+        return self.now, self._seq, self._cancelled, entries
+
+    def set_state(self, state, objects):
+        """Inverse of get_state(); ``objects`` maps the names back to objects."""
+        self.now, self._seq, cancelled, entries = state
+        self.clear()
+        heap = self._heap
+        for deadline, seq, callback in entries:
+            if callback is None:
+                timer = Timer(deadline, seq, None)
+                timer.cancelled = True
+            else:
+                owner, name, args = callback
+                method = getattr(objects[owner], name)
+                timer = Timer(deadline, seq, partial(method, *args) if args else method)
+            heap.append((deadline, seq, timer))
+        self._cancelled = cancelled
+
+    def find(self, seq):
+        """Pending timer with sequence number ``seq`` (Countdown.set_state)."""
+        for entry in self._heap:
+            if entry[1] == seq:
+                return entry[2]
+        return None
+
+
+class Countdown:
+    """Timer attribute: reads as the remaining seconds, never below 0.
+
+    Only the deadline is stored, so a running countdown needs no per-frame
+    update. Assigning restarts it; with ``on_expire`` the named method is
+    called when it runs out (not when it is set to 0 by hand). ``clock``
+    is the attribute holding the TimerScheduler on the owning object.
+    """
+
+    def __init__(self, on_expire=None, clock='timers'):
+        self.on_expire = on_expire
+        self.clock = clock
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.deadline_key = '_deadline_' + name
+        self.timer_key = '_timer_' + name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        deadline = instance.__dict__.get(self.deadline_key)
+        if deadline is None:
+            return 0.0
+        remaining = deadline - getattr(instance, self.clock).now
+        return remaining if remaining > 0.0 else 0.0
+
+    def __set__(self, instance, value):
+        clock = getattr(instance, self.clock)
+        state = instance.__dict__
+        timer = state.get(self.timer_key)
+        if timer is not None:
+            clock.cancel(timer)
+            state[self.timer_key] = None
+        state[self.deadline_key] = clock.now + value
+        if self.on_expire is not None and value > 0:
+            state[self.timer_key] = clock.schedule(value, getattr(instance, self.on_expire))
+
+    def get_state(self, instance):
+        """(deadline, seq of the pending expiry timer or None) for snapshots."""
+        state = instance.__dict__
+        timer = state.get(self.timer_key)
+        if timer is not None and timer.cancelled:
+            timer = None  # abgelaufen oder abgebrochen: wirkt wie keiner
+        return state.get(self.deadline_key), None if timer is None else timer.seq
+
+    def set_state(self, instance, value):
+        """Inverse of get_state(), after the clock's TimerScheduler was restored."""
+        deadline, seq = value
+        state = instance.__dict__
+        state[self.deadline_key] = deadline
+        state[self.timer_key] = None if seq is None else getattr(instance, self.clock).find(seq)
+
+
+_countdowns = {}  # Klasse -> ihre Countdown-Attribute
+
+
+def countdowns(cls):
+    found = _countdowns.get(cls)
+    if found is None:
+        found = _countdowns[cls] = tuple(
+            value for klass in reversed(cls.__mro__) for value in vars(klass).values()
+            if isinstance(value, Countdown))
+    return found
+
+
+def get_countdowns(obj):
+    """State of all Countdown attributes of ``obj`` (see Countdown.get_state)."""
+    return tuple(countdown.get_state(obj) for countdown in countdowns(obj.__class__))
+
+
+def set_countdowns(obj, state):
+    for countdown, value in zip(countdowns(obj.__class__), state):
+        countdown.set_state(obj, value)
@@ -1,11 +1,14 @@
 import pygame
 import math
+import gfx
 from constants import *
 from boss_projectiles import BossProjectile
-from utils import draw_text
+from utils import draw_text, get_overlay
 
 
 class TutorialStep:
+    __slots__ = ('title', 'lines', 'hint', 'check_fn', 'timeout')
+
     def __init__(self, title, lines, hint, check_fn=None, timeout=25.0):
         self.title = title
         self.lines = lines
@@ -177,7 +180,8 @@ class TutorialManager:
 
     def _spawn_tutorial_bullet(self):
         boss = self.game.boss
-        bullet = BossProjectile(
+        bullet = self.game.pools.acquire(
+            BossProjectile,
             self.game,
             boss.rect.left,
             boss.rect.centery + (0 if self.step_idx % 2 == 0 else 60),
@@ -185,8 +189,7 @@ class TutorialManager:
             0,
             is_parryable=True,
         )
-        self.game.all_sprites.add(bullet)
-        self.game.boss_bullets.add(bullet)
+        self.game.entities.add(bullet)
 
     # ------------------------------------------------------------------
     def draw(self, screen):
@@ -197,9 +200,7 @@ class TutorialManager:
         panel_y = SCREEN_HEIGHT - panel_h
 
         # Semi-transparent background panel
-        surf = pygame.Surface((SCREEN_WIDTH, panel_h), pygame.SRCALPHA)
-        surf.fill((10, 10, 30, 210))
-        screen.blit(surf, (0, panel_y))
+        screen.blit(get_overlay((SCREEN_WIDTH, panel_h), (10, 10, 30, 210)), (0, panel_y))
 
         # Step progress dots
         dot_spacing = 16
@@ -215,7 +216,7 @@ class TutorialManager:
             else:
                 color = COLOR_DARK_GRAY
                 r = 4
-            pygame.draw.circle(screen, color, (cx, panel_y + 10), r)
+            gfx.circle(screen, color, (cx, panel_y + 10), r)
 
         if self.complete_flash_timer > 0:
             # Flash completion message
@@ -249,6 +250,6 @@ class TutorialManager:
             cam = self.game.effect_manager.get_camera_offset()
             bx = boss.rect.centerx - int(cam.x)
             by = boss.rect.centery - 20 + offset - int(cam.y)
-            pygame.draw.polygon(screen, COLOR_YELLOW, [
+            gfx.polygon(screen, COLOR_YELLOW, [
                 (bx - 12, by - 20), (bx + 12, by - 20), (bx, by)
             ])
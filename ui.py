@@ -1,21 +1,63 @@
 import pygame
 import math
 import os
+import gfx
 from constants import *
-from utils import draw_text
+from utils import draw_text, get_overlay, load_image
 
 def _load_icon(filename, size):
     path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sprites', 'icons', filename)
     try:
-        img = pygame.image.load(path).convert_alpha()
-        return pygame.transform.scale(img, size)
+        return gfx.static(pygame.transform.scale(load_image(path), size))
     except Exception:
         return None
 
+class RetainedScreen:
+    """Full-screen UI page rendered into a cached surface.
+
+    render() only runs when state_key() changes (selection, save data, ...);
+    otherwise draw() is a single blit and an unchanged page on the display
+    needs no work at all (see UIManager.present_retained).
+    """
+
+    def __init__(self):
+        self.surface = None
+        self._key = None
+
+    def state_key(self):
+        return None
+
+    def render(self, surface):
+        """Draw the page into ``surface``; the base page stays empty."""
+
+    def refresh(self):
+        """Re-render if the state changed; returns True if it did."""
+        key = self.state_key()
+        if self.surface is not None and key == self._key:
+            return False
+        if self.surface is None:
+            self.surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._key = key
+        self.render(self.surface)
+        return True
+
+    def draw(self, screen):
+        self.refresh()
+        screen.blit(self.surface, (0, 0))
+
 class HUD:
     def __init__(self, game):
         self.game = game
         self._icons = None
+        self._pulse_icons = {}  # aufgehellte Blitz-Icons bei vollem Meter, je Pulsstufe
+
+    def _pulsed(self, key, pulse):
+        icon = self._pulse_icons.get((key, pulse))
+        if icon is None:
+            icon = self._icons[key].copy()
+            icon.fill((pulse, pulse, 0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            icon = self._pulse_icons[(key, pulse)] = gfx.static(icon)
+        return icon
 
     def _ensure_icons(self):
         if self._icons is not None:
@@ -54,9 +96,9 @@ class HUD:
             for i in range(PLAYER_MAX_HP):
                 rect = pygame.Rect(20 + i * 40, 20, 30, 30)
                 if i < self.game.player.hp:
-                    pygame.draw.rect(screen, COLOR_RED, rect)
+                    gfx.rect(screen, COLOR_RED, rect)
                 else:
-                    pygame.draw.rect(screen, COLOR_DARK_GRAY, rect, 2)
+                    gfx.rect(screen, COLOR_DARK_GRAY, rect, 2)
 
         # Special Meter (Cards) – lightning bolt icons
         for i in range(PLAYER_MAX_CARDS):
@@ -78,26 +120,24 @@ class HUD:
             if icon:
                 if self.game.player.cards >= 5 and fill >= 1.0:
                     pulse = int((math.sin(pygame.time.get_ticks() * 0.01) + 1) * 0.5 * 60)
-                    tinted = icon.copy()
-                    tinted.fill((pulse, pulse, 0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-                    screen.blit(tinted, rect.topleft)
+                    screen.blit(self._pulsed(icon_key, pulse), rect.topleft)
                 else:
                     screen.blit(icon, rect.topleft)
             else:
                 # Fallback to rectangles
                 color = COLOR_BLUE
-                pygame.draw.rect(screen, color, rect, 2)
+                gfx.rect(screen, color, rect, 2)
                 if fill > 0:
                     fill_rect = rect.copy()
                     fill_rect.height = int(rect.height * fill)
                     fill_rect.bottom = rect.bottom
-                    pygame.draw.rect(screen, color, fill_rect)
+                    gfx.rect(screen, color, fill_rect)
 
         # Focus Meter
         focus_rect = pygame.Rect(20, 115, 170, 10)
-        pygame.draw.rect(screen, COLOR_DARK_GRAY, focus_rect)
+        gfx.rect(screen, COLOR_DARK_GRAY, focus_rect)
         focus_fill = (self.game.player.focus_time / PLAYER_FOCUS_MAX_DURATION) * 170
-        pygame.draw.rect(screen, COLOR_CYAN, (20, 115, focus_fill, 10))
+        gfx.rect(screen, COLOR_CYAN, (20, 115, focus_fill, 10))
 
         # EX-Ability Selector (all 5 types)
         ex_map = [
@@ -114,7 +154,7 @@ class HUD:
             icon = self._icons.get(key) if key else None
             is_selected = (selected_ex == name)
             slot_color = COLOR_WHITE if is_selected else COLOR_DARK_GRAY
-            pygame.draw.rect(screen, slot_color, (ix - 2, iy - 2, 32, 32), 2 if not is_selected else 1)
+            gfx.rect(screen, slot_color, (ix - 2, iy - 2, 32, 32), 2 if not is_selected else 1)
             if icon:
                 screen.blit(icon, (ix, iy))
             else:
@@ -128,11 +168,11 @@ class HUD:
         shield_cd = p.shield_cooldown
         if shield_cd > 0:
             bar_fill = max(0.0, 1.0 - shield_cd / PLAYER_SHIELD_COOLDOWN)
-            pygame.draw.rect(screen, COLOR_DARK_GRAY, (20, y_status, 80, 8))
-            pygame.draw.rect(screen, COLOR_CYAN, (20, y_status, int(80 * bar_fill), 8))
+            gfx.rect(screen, COLOR_DARK_GRAY, (20, y_status, 80, 8))
+            gfx.rect(screen, COLOR_CYAN, (20, y_status, int(80 * bar_fill), 8))
             draw_text(screen, "E-CD", 12, 105, y_status + 4, COLOR_GRAY)
         else:
-            pygame.draw.rect(screen, COLOR_CYAN, (20, y_status, 80, 8))
+            gfx.rect(screen, COLOR_CYAN, (20, y_status, 80, 8))
             draw_text(screen, "E bereit", 12, 110, y_status + 4, COLOR_CYAN)
         y_status += 14
 
@@ -140,11 +180,11 @@ class HUD:
         dash_cd = p.dash_cooldown_timer
         if dash_cd > 0:
             bar_fill = max(0.0, 1.0 - dash_cd / PLAYER_DASH_COOLDOWN)
-            pygame.draw.rect(screen, COLOR_DARK_GRAY, (20, y_status, 80, 8))
-            pygame.draw.rect(screen, COLOR_ORANGE, (20, y_status, int(80 * bar_fill), 8))
+            gfx.rect(screen, COLOR_DARK_GRAY, (20, y_status, 80, 8))
+            gfx.rect(screen, COLOR_ORANGE, (20, y_status, int(80 * bar_fill), 8))
             draw_text(screen, "Dash-CD", 12, 115, y_status + 4, COLOR_GRAY)
         else:
-            pygame.draw.rect(screen, COLOR_ORANGE, (20, y_status, 80, 8))
+            gfx.rect(screen, COLOR_ORANGE, (20, y_status, 80, 8))
             draw_text(screen, "Dash bereit", 12, 120, y_status + 4, COLOR_ORANGE)
         y_status += 14
 
@@ -167,17 +207,18 @@ class HUD:
         if boss and boss.alive():
             hp_width = 400
             hp_rect_bg = pygame.Rect(SCREEN_WIDTH // 2 - hp_width // 2, 20, hp_width, 25)
-            pygame.draw.rect(screen, COLOR_DARK_GRAY, hp_rect_bg)
+            gfx.rect(screen, COLOR_DARK_GRAY, hp_rect_bg)
 
             hp_fill = (boss.hp / boss.max_hp) * hp_width
             hp_rect_fill = pygame.Rect(SCREEN_WIDTH // 2 - hp_width // 2, 20, hp_fill, 25)
-            pygame.draw.rect(screen, boss.color, hp_rect_fill)
-            pygame.draw.rect(screen, COLOR_WHITE, hp_rect_bg, 2)
+            gfx.rect(screen, boss.color, hp_rect_fill)
+            gfx.rect(screen, COLOR_WHITE, hp_rect_bg, 2)
 
             draw_text(screen, "Dr. Pythagoras", 20, SCREEN_WIDTH // 2, 60, COLOR_WHITE)
 
-class GradeScreen:
+class GradeScreen(RetainedScreen):
     def __init__(self, game, stats):
+        super().__init__()
         self.game = game
         self.stats = stats
         self.grade, self.score = self.calculate_grade()
@@ -223,7 +264,7 @@ class GradeScreen:
 
         return grade, int(total)
 
-    def draw(self, screen):
+    def render(self, screen):
         screen.fill(COLOR_BLACK)
         draw_text(screen, "KAMPF-STATISTIK", 48, SCREEN_WIDTH//2, 60, COLOR_YELLOW)
 
@@ -288,20 +329,24 @@ class GradeScreen:
 
         draw_text(screen, "Press ENTER to continue", 20, SCREEN_WIDTH//2, SCREEN_HEIGHT - 20, COLOR_GRAY)
 
-class Menu:
+class Menu(RetainedScreen):
     def __init__(self, game):
+        super().__init__()
         self.game = game
-        self.options = ["TUTORIAL", "START GAME", "CHALLENGE MODES", "DEMO MODE", "STATISTICS", "QUIT"]
+        self.options = ["TUTORIAL", "START GAME", "PRACTICE MODE", "CHALLENGE MODES", "DEMO MODE", "STATISTICS", "QUIT"]
         self.selected = 0
 
-    def draw(self, screen):
+    def state_key(self):
+        return self.selected
+
+    def render(self, screen):
         screen.fill(COLOR_BLACK)
         draw_text(screen, "DR. PYTHAGORAS 2.0", 64, SCREEN_WIDTH//2, 150, COLOR_LIGHT_RED)
 
         for i, opt in enumerate(self.options):
             color = COLOR_WHITE if i == self.selected else COLOR_GRAY
             size = 40 if i == self.selected else 30
-            draw_text(screen, opt, size, SCREEN_WIDTH//2, 300 + i * 60, color)
+            draw_text(screen, opt, size, SCREEN_WIDTH//2, 270 + i * 50, color)
 
     def update(self, events):
         for event in events:
@@ -331,18 +376,33 @@ class DemoAbilityPanel:
         for i, name in enumerate(self.buttons):
              r = pygame.Rect(SCREEN_WIDTH - self.width + 10, 50 + i * 25, self.width - 20, 20)
              self.button_rects.append(r)
+        self._panel = None  # background + buttons, rendered on first draw
+
+    def _render_panel(self):
+        # Hintergrund und alle Buttons einmal vorrendern (panel-lokale Koordinaten)
+        panel = pygame.Surface((self.width, SCREEN_HEIGHT), pygame.SRCALPHA)
+        panel.fill((50, 50, 50, 180))
+        for i, name in enumerate(self.buttons):
+            self._draw_button(panel, i, COLOR_WHITE, -self.rect.x)
+        self._panel = gfx.static(panel)
+
+    def _draw_button(self, surface, i, color, dx=0):
+        r = self.button_rects[i].move(dx, 0)
+        gfx.rect(surface, (30, 30, 30), r)
+        draw_text(surface, self.buttons[i], 14, r.centerx, r.centery, color)
 
     def draw(self, screen):
-        surf = pygame.Surface((self.width, SCREEN_HEIGHT), pygame.SRCALPHA)
-        surf.fill((50, 50, 50, 180))
-        screen.blit(surf, (SCREEN_WIDTH - self.width, 0))
+        if self._panel is None:
+            self._render_panel()
+        screen.blit(self._panel, self.rect.topleft)
 
+        # Nur der Button unter der Maus wird pro Frame neu gezeichnet
         mouse_pos = pygame.mouse.get_pos()
-        for i, name in enumerate(self.buttons):
-            r = self.button_rects[i]
-            color = COLOR_YELLOW if r.collidepoint(mouse_pos) else COLOR_WHITE
-            pygame.draw.rect(screen, (30, 30, 30), r)
-            draw_text(screen, name, 14, r.centerx, r.centery, color)
+        if self.rect.collidepoint(mouse_pos):
+            for i, r in enumerate(self.button_rects):
+                if r.collidepoint(mouse_pos):
+                    self._draw_button(screen, i, COLOR_YELLOW)
+                    break
 
     def update(self, events):
         for event in events:
@@ -352,8 +412,9 @@ class DemoAbilityPanel:
                         return self.buttons[i]
         return None
 
-class ChallengeSelectScreen:
+class ChallengeSelectScreen(RetainedScreen):
     def __init__(self, game):
+        super().__init__()
         self.game = game
         self.challenges = [
             {"name": "No Dash", "desc": "Kein Dash möglich. Boss ist schneller.", "diff": 3},
@@ -364,7 +425,10 @@ class ChallengeSelectScreen:
         ]
         self.selected = 0
 
-    def draw(self, screen):
+    def state_key(self):
+        return (self.selected, self.game.save_system.revision)
+
+    def render(self, screen):
         screen.fill(COLOR_BLACK)
         draw_text(screen, "CHALLENGE MODES", 48, SCREEN_WIDTH//2, 80, COLOR_YELLOW)
 
@@ -394,11 +458,16 @@ class ChallengeSelectScreen:
                     return "BACK"
         return None
 
-class StatisticsScreen:
+class StatisticsScreen(RetainedScreen):
     def __init__(self, game, save_data):
+        super().__init__()
+        self.game = game
         self.save_data = save_data
 
-    def draw(self, screen):
+    def state_key(self):
+        return self.game.save_system.revision
+
+    def render(self, screen):
         screen.fill(COLOR_BLACK)
         draw_text(screen, "LIFETIME STATISTICS", 48, SCREEN_WIDTH//2, 80, COLOR_CYAN)
 
@@ -428,11 +497,22 @@ class UIManager:
         self.statistics_screen = StatisticsScreen(game, game.save_system.data)
         self.challenge_screen = ChallengeSelectScreen(game)
         self.demo_panel = DemoAbilityPanel(game)
+        self._presented = None  # RetainedScreen currently shown on the display
+
+    def present_retained(self, screen, view):
+        """Blit the static page ``view`` if needed; returns the dirty rects."""
+        if view.refresh() or view is not self._presented:
+            screen.blit(view.surface, (0, 0))
+            self._presented = view
+            return [screen.get_rect()]
+        return []
+
+    def invalidate(self):
+        """Force a full redraw, e.g. after the window was exposed."""
+        self._presented = None
 
     def draw_game_over(self, screen):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        screen.blit(get_overlay((SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0, 0, 180)), (0, 0))
         draw_text(screen, "GAME OVER", 80, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 60, COLOR_RED)
         draw_text(screen, "Dr. Pythagoras hat gewonnen... diesmal.", 28,
                   SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20, COLOR_GRAY)
@@ -440,45 +520,20 @@ class UIManager:
         draw_text(screen, f"Zurück zum Menü in {int(remaining) + 1}s  (SPACE / ENTER zum Überspringen)",
                   20, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 70, COLOR_WHITE)
 
-    def draw(self, screen):
-        if self.game.state == "MENU":
-            self.menu.draw(screen)
-        elif self.game.state == "CHALLENGE_SELECT":
-            self.challenge_screen.draw(screen)
-        elif self.game.state == "STATISTICS":
-            self.statistics_screen.draw(screen)
-        elif self.game.state == "GAME_OVER":
-            self.draw_game_over(screen)
-        elif self.game.state in ["PLAYING", "PAUSED", "WIN_SCREEN", "DEMO", "TUTORIAL"]:
-            self.hud.draw(screen)
-            if self.game.state == "DEMO" and self.game.demo.panel_visible:
-                self.demo_panel.draw(screen)
-
-            if self.game.state == "PAUSED":
-                overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, 140))
-                screen.blit(overlay, (0, 0))
-                draw_text(screen, "PAUSE", 64, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 80, COLOR_WHITE)
-                controls = [
-                    "A / D  –  Bewegen",
-                    "SPACE  –  Springen  |  S + SPACE  –  Parry",
-                    "LSHIFT  –  Dash",
-                    "Linksklick  –  Schießen  |  Rechtsklick  –  EX-Angriff",
-                    "E  –  Schild  |  F  –  Focus-Modus",
-                    "1-5  –  EX-Typ wählen",
-                    "",
-                    "P  –  Weiterspielen",
-                ]
-                y = SCREEN_HEIGHT // 2 - 20
-                for line in controls:
-                    draw_text(screen, line, 20, SCREEN_WIDTH // 2, y, COLOR_GRAY if line else COLOR_BLACK)
-                    y += 26
-
-            if self.game.state == "DEMO":
-                draw_text(screen, "⚡ DEMO MODE — ESC zum Beenden", 24, SCREEN_WIDTH//2, 30, COLOR_RED)
-
-            if self.game.state == "TUTORIAL" and self.game.tutorial_manager:
-                self.game.tutorial_manager.draw(screen)
-
-            if self.game.state == "WIN_SCREEN":
-                self.game.grade_screen.draw(screen)
+    def draw_pause(self, screen):
+        screen.blit(get_overlay((SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0, 0, 140)), (0, 0))
+        draw_text(screen, "PAUSE", 64, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 80, COLOR_WHITE)
+        controls = [
+            "A / D  –  Bewegen",
+            "SPACE  –  Springen  |  S + SPACE  –  Parry",
+            "LSHIFT  –  Dash",
+            "Linksklick  –  Schießen  |  Rechtsklick  –  EX-Angriff",
+            "E  –  Schild  |  F  –  Focus-Modus",
+            "1-5  –  EX-Typ wählen",
+            "",
+            "P  –  Weiterspielen",
+        ]
+        y = SCREEN_HEIGHT // 2 - 20
+        for line in controls:
+            draw_text(screen, line, 20, SCREEN_WIDTH // 2, y, COLOR_GRAY if line else COLOR_BLACK)
+            y += 26
@@ -3,6 +3,8 @@ import random
 import os
 import struct
 import math
+from collections import OrderedDict
+import gfx
 from constants import COLOR_WHITE, COLOR_BLACK
 
 # Font Cache
@@ -17,13 +19,72 @@ def get_font(name, size, bold=True):
             _font_cache[key] = pygame.font.Font(None, size)
     return _font_cache[key]
 
+def load_image(path):
+    """Load an image, converted to the display format if there is a display surface.
+
+    The renderer backend has no display surface; its textures do not care
+    about the surface format.
+    """
+    img = pygame.image.load(path)
+    return img.convert_alpha() if pygame.display.get_surface() else img
+
+# Overlay- und Scratch-Surfaces: wiederverwendet statt pro Frame neu angelegt
+_overlay_cache = {}
+_scratch_cache = {}
+
+def get_overlay(size, color, flags=0):
+    """Cached surface of ``size`` uniformly filled with ``color``. Read-only.
+
+    Without SRCALPHA the alpha of ``color`` becomes the surface alpha, which
+    blits faster than per-pixel alpha and looks the same for flat tints.
+    """
+    key = (size, color, flags)
+    surf = _overlay_cache.get(key)
+    if surf is None:
+        surf = pygame.Surface(size, flags)
+        if flags & pygame.SRCALPHA:
+            surf.fill(color)
+        else:
+            surf.fill(color[:3])
+            if len(color) == 4:
+                surf.set_alpha(color[3])
+        _overlay_cache[key] = gfx.static(surf)
+    return surf
+
+def get_scratch(size, flags=pygame.SRCALPHA):
+    """Shared scratch surface of ``size``; contents are undefined.
+
+    Only valid until the next get_scratch call with the same size and flags,
+    so draw into it and blit it right away.
+    """
+    key = (size, flags)
+    surf = _scratch_cache.get(key)
+    if surf is None:
+        surf = _scratch_cache[key] = pygame.Surface(size, flags)
+    return surf
+
+# Gerenderte Texte: HUD, Labels und Schadenszahlen wiederholen sich von Frame zu Frame
+TEXT_CACHE_SIZE = 256
+_text_cache = OrderedDict()
+
+def render_text(font, text, color):
+    """Cached ``font.render(text, True, color)``. Read-only except for set_alpha."""
+    key = (font, text, tuple(color))
+    surf = _text_cache.get(key)
+    if surf is None:
+        surf = _text_cache[key] = gfx.static(font.render(text, True, color))
+        if len(_text_cache) > TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+    else:
+        _text_cache.move_to_end(key)
+    return surf
+
 def draw_text(screen, text, size, x, y, color=COLOR_WHITE, shadow=True, center=True, alpha=255):
     font = get_font("Arial", size, bold=True)
 
     if shadow:
-        shadow_surf = font.render(text, True, COLOR_BLACK)
-        if alpha < 255:
-            shadow_surf.set_alpha(alpha)
+        shadow_surf = render_text(font, text, COLOR_BLACK)
+        shadow_surf.set_alpha(alpha)
         shadow_rect = shadow_surf.get_rect()
         if center:
             shadow_rect.center = (x + 2, y + 2)
@@ -31,9 +92,8 @@ def draw_text(screen, text, size, x, y, color=COLOR_WHITE, shadow=True, center=T
             shadow_rect.topleft = (x + 2, y + 2)
         screen.blit(shadow_surf, shadow_rect)
 
-    surf = font.render(text, True, color)
-    if alpha < 255:
-        surf.set_alpha(alpha)
+    surf = render_text(font, text, color)
+    surf.set_alpha(alpha)
     rect = surf.get_rect()
     if center:
         rect.center = (x, y)
@@ -138,6 +198,10 @@ class SoundManager:
         self.sounds[name] = snd
         return snd
 
+    def preload(self, *names):
+        for name in names:
+            self._load(name)
+
     def play(self, name, volume=1.0):
         snd = self._load(name)
         if snd is None:
@@ -0,0 +1,42 @@
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+class View:
+    """Camera offset plus render scale for drawing the scene.
+
+    Screen position = (world position - offset) * scale. Scene draw methods
+    get a View where they used to get the bare camera offset; ``x``/``y``
+    are still the offset, so at scale 1.0 everything lands where it did.
+    ``visible`` is the world rect that ends up on screen (for culling).
+    """
+    __slots__ = ('x', 'y', 'scale', 'visible')
+
+    def __init__(self, offset=(0, 0), scale=1.0, zoom=1.0):
+        self.x, self.y = offset
+        self.scale = scale
+        # Zoom > 1 zeigt nur den Mittelausschnitt, Zoom < 1 verkleinert nur
+        zoom = max(1.0, zoom)
+        self.visible = pygame.Rect(0, 0, int(SCREEN_WIDTH / zoom) + 2, int(SCREEN_HEIGHT / zoom) + 2)
+        self.visible.center = (SCREEN_WIDTH // 2 + int(self.x), SCREEN_HEIGHT // 2 + int(self.y))
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+
+    def point(self, x, y):
+        s = self.scale
+        return (int((x - self.x) * s), int((y - self.y) * s))
+
+    def size(self, n):
+        """Length in render pixels, never below 1."""
+        return max(1, int(n * self.scale + 0.5))
+
+    def rect(self, rect):
+        s = self.scale
+        return pygame.Rect(int((rect[0] - self.x) * s), int((rect[1] - self.y) * s),
+                           max(1, int(rect[2] * s + 0.5)), max(1, int(rect[3] * s + 0.5)))
+
+    def world(self, pos):
+        """Inverse of point() – render pixels back to world coordinates."""
+        return (pos[0] / self.scale + self.x, pos[1] / self.scale + self.y)